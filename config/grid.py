@@ -6,7 +6,9 @@ class GridConfig:
     SCREEN_H = 600
 
     @staticmethod
-    def offset():
-        # centre the 592px tall grid inside 600px
-        grid_h = GridConfig.ROWS * GridConfig.CELL  # 592
-        return (0, (GridConfig.SCREEN_H - grid_h) // 2)  # (0, 4)
+    def offset(cols=None, rows=None):
+        # centre the grid on screen (default 50x37: the 592px tall grid inside 600px -> (0, 4));
+        # grids bigger than the screen start at the top-left corner
+        grid_w = (GridConfig.COLS if cols is None else cols) * GridConfig.CELL
+        grid_h = (GridConfig.ROWS if rows is None else rows) * GridConfig.CELL
+        return (max(0, (GridConfig.SCREEN_W - grid_w) // 2), max(0, (GridConfig.SCREEN_H - grid_h) // 2))
@@ -7,12 +7,21 @@ class Colour:
     BRIGHT_GREEN = (0, 255, 70)
     PLAYER_CORE = (220, 255, 220)  # almost pure white
     SENSOR = (255, 140, 0)
+    DRONE = (255, 140, 0)
+    DRONE_ALERT = (255, 50, 20)
 
     # Task1 tiles
     TASK1_ACTIVE = (50, 220, 60)    
     TASK1_LOCKED = (30, 140, 40)       
     TASK1_PROCESSED = (15, 100, 20)
 
+    # debug layers (RGBA, baked into overlay surfaces)
+    DEBUG_SENSOR = (255, 140, 0, 60)
+    DEBUG_TRIGGER = (255, 220, 0, 110)
+    DEBUG_ZONE = (80, 160, 255, 50)
+    DEBUG_ZONE_LIVE = (80, 160, 255, 140)
+    DEBUG_WALKABLE = (0, 255, 70, 30)
+
     @staticmethod
     def phosphor_colour(base_rgb, alpha_value):
         # alpha_value is 200..255; convert to 0.78..1.0 brightness factor
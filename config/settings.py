@@ -6,11 +6,28 @@ class GamePlayConfig:
     SENSOR_DETECTION = 100  # lower equals faster detection, linked to infrared alpha
 
     MAX_INFRARED_ALPHA = 200  # infrared brightness
+
+    # sensor cones per emitter token: (full spread in degrees, max 90; range in cells)
+    SENSOR_CONES = {
+        "^": (50, 30),
+        "v": (50, 30),
+        "<": (50, 30),
+        ">": (50, 30),
+    }
     
     # bright green glitch intensity
     PHOS_MIN_ALPHA = 180
     PHOS_MAX_ALPHA = 255
 
+    # discoveries: trigger radius around each marked cell (1 => 3x3 area)
+    DISCOVERY_RADIUS_CELLS = 1
+
+    # patrol drones (world/drones.py)
+    DRONE_SIZE = 12               # px, square
+    DRONE_SPEED = 60              # px per second along the patrol route
+    DRONE_SUSPICION_RATE = 15     # per second while any drone touches the player
+    DRONE_CAPACITY = 64           # initial pool size (doubles when full)
+
 
 class TimingConfig:
     """central timing controls"""
@@ -46,3 +63,100 @@ class TimingConfig:
     TERMINAL_LINE_DELAY = 1
     TERMINAL_BLOCK_PAUSE = 0.35
     POST_ATTACH_PAUSE = 0.8
+
+    # repeatable discoveries (anomalies)
+    DISCOVERY_COOLDOWN = 5
+
+    # frame pacing
+    TARGET_FPS = 60
+    UNFOCUSED_FPS = 30
+    IDLE_MAX_WAIT = 0.25  # longest block on a static screen
+    HIDDEN_POLL = 0.25    # event wait while minimised
+    PACING_SPIN = 0.002   # final stretch before a frame deadline is spun, not slept
+
+    # asyncio loop (main.py --async)
+    FRAME_GUARD = 0.002        # background work yields if a frame is due this soon
+    ASYNC_INPUT_POLL = 0.016   # input check interval while idling
+    AUTOSAVE_INTERVAL = 30     # seconds, 0 = off
+
+
+class TelemetryConfig:
+    """session telemetry (telemetry/*.n2t)"""
+
+    ENABLED = True
+    QUEUE_CAPACITY = 8192    # records buffered before new ones are dropped
+    BATCH_RECORDS = 1024     # records per compressed batch
+    FLUSH_INTERVAL = 0.5     # seconds between writer wake-ups
+    COMPRESS_LEVEL = 6
+    ROTATE_BYTES = 1 << 20   # start a new file past this size
+    KEEP_FILES = 64          # oldest files pruned beyond this, 0 = keep all
+    SUSPICION_SAMPLE = 0.5   # seconds between suspicion samples
+
+
+class ProfileConfig:
+    """frame instrumentation (main.py --profile / --profile-mem)"""
+
+    SNAPSHOT_FRAMES = 300    # --profile-mem: tracemalloc snapshot diffed every N frames
+    TRACE_DEPTH = 1          # tracemalloc frames kept per allocation
+    TOP_LINES = 12           # allocation sites listed per snapshot diff
+    WORST_FRAMES = 5         # slowest frames listed in the summary
+
+
+class DebugConfig:
+    """debug overlay layers (render/debug_layers.py), toggled in play"""
+
+    # key name (pygame.key.name) -> layer; every layer starts hidden
+    LAYER_KEYS = {
+        "1": "markers",     # spawn, sensors, task / discovery / anomaly cells, door cells
+        "2": "sensors",     # cells inside any sensor's cone
+        "3": "triggers",    # door triggers and task triggers
+        "4": "zones",       # Task1 activation zones (live zone brighter)
+        "5": "walkable",    # cells that don't block right now
+    }
+    CLEAR_KEY = "0"         # hide every layer
+
+
+class AudioConfig:
+    """synthesised sound (fx/audio.py)"""
+
+    ENABLED = True
+    SAMPLE_RATE = 22050
+    BUFFER = 256             # samples per mixer callback (~12 ms at 22050 Hz)
+    CHANNELS = 8             # looping slots (hum, sensor, alarm) + one-shot pool
+    MASTER_VOLUME = 0.6
+
+    HUM_VOLUME = 0.12
+    CLICK_VOLUME = 0.5       # text line reveals
+    SENSOR_VOLUME = 0.25     # at full infrared alpha
+    ALARM_START = 40         # suspicion where the alarm fades in
+    ALARM_VOLUME = 0.35      # at 100 suspicion
+    ALARM_BEEPS = (2, 3, 4, 6)  # beeps per second, one loop per band from ALARM_START to 100
+
+    # one-shot priority: a full pool steals from the lowest (never from higher)
+    PRIORITY = {"click": 1, "chime": 2, "alert": 3}
+
+
+class FXConfig:
+    """post-processing tuning"""
+
+    # 0 = off, 1 = scanlines + flicker, 2 = + vignette + jitter
+    CRT_QUALITY = 2
+
+    CRT_SCANLINE_STRENGTH = 0.18  # darkening of every other row
+    CRT_VIGNETTE_STRENGTH = 0.35  # darkening at the corners
+
+    CRT_FLICKER_CHANCE = 0.08  # per frame
+    CRT_FLICKER_DEPTH = 0.06   # max brightness dip
+
+    CRT_JITTER_CHANCE = 0.004  # per frame
+    CRT_JITTER_PX = 2
+    CRT_JITTER_TIME = 0.06     # seconds a tear holds
+
+    # static / grain overlay
+    NOISE_FRAMES = 8
+    NOISE_TILE = 256
+    NOISE_MAX_ALPHA = 60       # grain brightness (of 255) added at intensity 1.0
+    NOISE_BASE_INTENSITY = 0.05  # always-on grain during play
+
+    # player drawn as core + soft halo instead of a flat square
+    PLAYER_NODE_LOOK = False
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from config.settings import TimingConfig
+
+
+class AsyncGameLoop:
+    """
+    asyncio driver for Game.
+
+    Frames run from one coroutine that awaits its next deadline; background
+    coroutines (autosave, telemetry flush, asset warm-up...) run in the gaps.
+    Blocking work goes through run_blocking() to a small thread pool.
+
+    asyncio can't pre-empt, so frame priority is cooperative: long-running
+    coroutines should call `await loop.yield_to_frame()` between chunks, which
+    parks them whenever a frame is due within FRAME_GUARD.
+    """
+
+    def __init__(self, game, *, workers=2):
+        self.game = game
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="node2084-bg")
+
+        self._tasks = set()
+        self._frame_done = None
+        self._next_deadline = 0.0
+
+        # frame lateness (seconds past deadline when the frame actually started)
+        self.frames = 0
+        self.late_frames = 0
+        self.worst_late = 0.0
+
+        # background coroutines started with the loop: callables(loop) -> coroutine
+        self.startup = [autosave]
+
+    # ---- scheduling API ----
+
+    def spawn(self, coro):
+        """run a coroutine in the background; it is cancelled when the game exits"""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def run_blocking(self, fn, *args):
+        """run blocking I/O on the thread pool without stalling frames"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def yield_to_frame(self):
+        """let a due frame go first; otherwise just give other tasks a turn"""
+        loop = asyncio.get_running_loop()
+        if self._next_deadline - loop.time() < TimingConfig.FRAME_GUARD:
+            await self._frame_done.wait()
+        else:
+            await asyncio.sleep(0)
+
+    # ---- frame driver ----
+
+    async def _sleep_until(self, deadline, *, wake_on_input):
+        loop = asyncio.get_running_loop()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            if wake_on_input and pygame.event.peek():
+                return
+            # idle waits poll input at a modest rate instead of blocking the event loop
+            await asyncio.sleep(min(remaining, TimingConfig.ASYNC_INPUT_POLL) if wake_on_input else remaining)
+
+    def _mark_frame_done(self):
+        done, self._frame_done = self._frame_done, asyncio.Event()
+        done.set()
+
+    async def _frames(self):
+        game = self.game
+        loop = asyncio.get_running_loop()
+
+        last = time.perf_counter()
+        self._next_deadline = loop.time()
+
+        while game.running:
+            late = loop.time() - self._next_deadline
+            if late > 0.001:
+                self.late_frames += 1
+            self.worst_late = max(self.worst_late, late)
+            self.frames += 1
+
+            now = time.perf_counter()
+            dt, last = now - last, now
+
+            rendered = game.frame(dt)
+            self._mark_frame_done()
+
+            if not rendered:
+                wait = TimingConfig.HIDDEN_POLL
+            else:
+                wait = game.scheduler.idle_wait(game.next_change_in())
+
+            if wait > 0:
+                # idle / hidden: sleep long, but wake early on input
+                self._next_deadline = loop.time() + wait
+                await self._sleep_until(self._next_deadline, wake_on_input=True)
+                last = time.perf_counter() if not rendered else last
+            else:
+                # stay on the deadline grid unless we fell behind it
+                period = 1.0 / game.scheduler.frame_rate()
+                self._next_deadline = max(self._next_deadline + period, loop.time())
+                await self._sleep_until(self._next_deadline, wake_on_input=False)
+
+    async def _main(self):
+        self._frame_done = asyncio.Event()
+        for start in self.startup:
+            self.spawn(start(self))
+
+        try:
+            await self._frames()
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def run(self):
+        try:
+            asyncio.run(self._main())
+        finally:
+            # let in-flight writes (autosave etc.) finish
+            self.executor.shutdown(wait=True)
+
+
+async def autosave(loop):
+    """periodic PlayState snapshot: packed on the loop thread (~20 us), written on the pool"""
+    from states.play import PlayState
+    from states.snapshot import pack_play_state, write_snapshot
+
+    interval = TimingConfig.AUTOSAVE_INTERVAL
+    if interval <= 0:
+        return
+
+    while True:
+        await asyncio.sleep(interval)
+        state = loop.game.machine.state
+        if isinstance(state, PlayState):
+            await loop.run_blocking(write_snapshot, pack_play_state(state), "autosave")
@@ -0,0 +1,79 @@
+import math
+
+import pygame
+
+from config.settings import TimingConfig
+
+
+class FrameScheduler:
+    """
+    Decides how hard the main loop has to work.
+
+    - states / systems report next_change_in(): seconds until their next visible
+      change (0 = animating every frame, None = nothing until input)
+    - when nothing changes soon the loop blocks on pygame.event.wait instead of
+      spinning at full rate (capped at IDLE_MAX_WAIT so timers stay honest)
+    - unfocused windows drop to a lower rate, hidden windows stop entirely
+    """
+
+    def __init__(self):
+        self.hidden = False
+        self.focused = True
+
+        # set when the window comes back after being hidden
+        self.resumed = False
+
+    def handle_event(self, event):
+        if event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.hidden = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            if self.hidden:
+                self.resumed = True
+            self.hidden = False
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+
+    def frame_rate(self):
+        return TimingConfig.TARGET_FPS if self.focused else TimingConfig.UNFOCUSED_FPS
+
+    def consume_resumed(self):
+        """True once after the window comes back (caller should drop the stale dt)"""
+        resumed, self.resumed = self.resumed, False
+        return resumed
+
+    def _block(self, seconds):
+        # never swallow queued input: only block on an empty queue
+        if pygame.event.peek():
+            return
+        ms = math.ceil(seconds * 1000)
+        if ms <= 0:
+            return
+        event = pygame.event.wait(ms)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def wait_hidden(self):
+        self._block(TimingConfig.HIDDEN_POLL)
+
+    def idle_wait(self, next_change_in):
+        """seconds the loop may sleep before the next visible change (0 = run next frame)"""
+        if next_change_in is None:
+            wait = TimingConfig.IDLE_MAX_WAIT
+        else:
+            wait = min(next_change_in, TimingConfig.IDLE_MAX_WAIT)
+
+        # anything due within a frame is left to the normal frame pacing
+        if wait <= 1.0 / self.frame_rate():
+            return 0.0
+        return wait
+
+    def wait_idle(self, next_change_in):
+        """block until the next visible change is due (or input arrives)"""
+        wait = self.idle_wait(next_change_in)
+        if wait <= 0:
+            return False
+
+        self._block(wait)
+        return True
@@ -1,46 +1,147 @@
 import pygame
 
 from core.state_machine import StateMachine
+from core.frame_scheduler import FrameScheduler
+from core.pacing import FramePacer
+from core.telemetry import Telemetry
 from states.boot import BootState
 from states.play import PlayState
 from fx.phosphor import PhosphorPulse
+from fx.crt import CRTEffect
+from fx.noise import NoiseAtlas
+from fx.audio import AudioSystem
 from config.grid import GridConfig
+from config.settings import AudioConfig
+from world.pool import WorldPool
+from world import cycles
+from utils.timers import TimerScheduler
 
 
 class Game:
     """main controller: loops, state machine and systems"""
 
     def __init__(self):
+        AudioSystem.pre_init()  # small mixer buffer: has to be set before pygame.init()
         pygame.init()
 
         self.screen = pygame.display.set_mode((GridConfig.SCREEN_W, GridConfig.SCREEN_H))
         pygame.display.set_caption("NODE 2084")
 
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer()
+        self.scheduler = FrameScheduler()
+        self.timers = TimerScheduler()  # game-time one-shot / repeating timers
         self.font = pygame.font.SysFont("consolas", 24)
 
-        self.phosphor = PhosphorPulse()
+        self.phosphor = PhosphorPulse(self.timers)
+        self.crt = CRTEffect()
+        self.noise = NoiseAtlas()
 
-        starting_state = PlayState(self.font)
+        # every sound synthesised up front; silent if there is no NumPy / audio device
+        self.audio = AudioSystem()
+        self.audio.set_loop("hum", "hum", AudioConfig.HUM_VOLUME)
+
+        # parsed world data shared by every PlayState built this session
+        self.world_pool = WorldPool()
+
+        # gameplay event log, written off-thread
+        self.telemetry = Telemetry(grid_size=(GridConfig.COLS, GridConfig.ROWS))
+
+        starting_state = PlayState(
+            self.font, timers=self.timers, world_pool=self.world_pool, telemetry=self.telemetry,
+        )
 
         self.machine = StateMachine(starting_state)
         self.machine.set_game(self)
 
+        # frame instrumentation (core/profiler.py), off unless enable_profiling() is called
+        self.profiler = None
+
         self.running = True
 
+    def enable_profiling(self, trace_memory=False):
+        """count draw calls / surfaces / allocations per frame; summary on shutdown()"""
+        from core.profiler import FrameProfiler
+
+        self.profiler = FrameProfiler(trace_memory=trace_memory)
+
     def run(self):
-        """main loop"""
+        """main loop (blocking)"""
         while self.running:
-            dt = self.clock.tick(60) / 1000
-            self.phosphor.update(dt)
-            self.handle_events()
-            self.machine.update(dt)
-            self.machine.render(self.screen)
+            dt = self.pacer.tick(self.scheduler.frame_rate())
+
+            # minimised / hidden: no update, no render, just wait for the window
+            if not self.frame(dt):
+                self.scheduler.wait_hidden()
+                self.pacer.resync()
+                continue
+
+            # static screens: sleep until something is due to change
+            if self.scheduler.wait_idle(self.next_change_in()):
+                self.pacer.skip_next()
+
+    def run_async(self):
+        """asyncio-driven main loop: same frames, plus background coroutines in the gaps"""
+        from core.async_loop import AsyncGameLoop
+
+        AsyncGameLoop(self).run()
+
+    def shutdown(self):
+        """flush background writers (and dump the profile, if on) before exit"""
+        self.telemetry.close()
+        self.audio.close()
+        if self.profiler is not None:
+            self.profiler.close()
+            self.profiler = None
+
+    def frame(self, dt):
+        """one frame: events, update, render. False if the window is hidden (nothing ran)."""
+        # background cycle builds (world/cycles.py) wait while the frame runs
+        cycles.frame_started()
+        try:
+            profiler = self.profiler
+            if profiler is None:
+                return self._frame(dt)
+
+            profiler.begin_frame()
+            try:
+                return self._frame(dt)
+            finally:
+                profiler.end_frame()
+        finally:
+            cycles.frame_finished()
+
+    def _frame(self, dt):
+        self.handle_events()
+
+        if self.scheduler.hidden:
+            return False
+        if self.scheduler.consume_resumed():
+            dt = 0.0
+
+        # timers first: callbacks see the same frame as the update that follows
+        self.timers.advance(dt)
+        self.phosphor.update(dt)
+        self.machine.update(dt)
+        self.machine.render(self.screen)
+        self.crt.apply(self.screen, dt)
+
+        pygame.display.flip()
+        return True
 
-            pygame.display.flip()
+    def next_change_in(self):
+        """soonest visible change across the active state and global fx (None = input only)"""
+        times = (
+            self.timers.next_due_in(),
+            self.machine.next_change_in(),
+            self.phosphor.next_change_in(),
+            self.crt.next_change_in(),
+        )
+        due = [t for t in times if t is not None]
+        return min(due) if due else None
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            self.scheduler.handle_event(event)
             self.machine.handle_event(event)
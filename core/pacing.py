@@ -0,0 +1,150 @@
+import time
+from array import array
+
+from config.settings import TimingConfig
+
+
+class FramePacer:
+    """
+    Frame pacing on time.perf_counter.
+
+    tick() sleeps coarsely until just before the frame deadline, then spins the
+    last SPIN_S to land on it. Deadlines advance by whole periods (no drift);
+    if a frame runs more than a period late the schedule restarts from now
+    instead of bursting to catch up.
+
+    Every recorded frame interval goes into a histogram of its deviation from
+    the target period (signed, bin_us wide, centred on 0) so pacing quality can
+    be checked in benchmarks.
+    """
+
+    def __init__(self, target_fps=None, *, spin_s=None, bin_us=250, bins=64):
+        self.spin_s = TimingConfig.PACING_SPIN if spin_s is None else spin_s
+        self.bin_s = bin_us / 1_000_000
+        self.bins = bins
+
+        self.period = 0.0
+        self.set_target(TimingConfig.TARGET_FPS if target_fps is None else target_fps)
+
+        self._last = time.perf_counter()
+        self._deadline = self._last + self.period
+        self._skip_next = False
+
+        self.reset_stats()
+
+    def set_target(self, fps):
+        self.fps = fps
+        self.period = 1.0 / fps
+
+    # ---- pacing ----
+
+    def tick(self, fps=None):
+        """wait for the next frame deadline; returns dt in seconds"""
+        if fps is not None and fps != self.fps:
+            self.set_target(fps)
+            self._deadline = self._last + self.period
+
+        now = time.perf_counter()
+        remaining = self._deadline - now
+
+        if remaining > self.spin_s:
+            time.sleep(remaining - self.spin_s)
+        if remaining > 0:
+            deadline = self._deadline
+            while time.perf_counter() < deadline:
+                pass
+
+        now = time.perf_counter()
+        dt = now - self._last
+        self._last = now
+
+        # next deadline: keep the grid unless we fell a whole period behind
+        self._deadline += self.period
+        if now - self._deadline > self.period:
+            self._deadline = now + self.period
+
+        if self._skip_next:
+            self._skip_next = False
+        else:
+            self._record(dt)
+
+        return dt
+
+    def skip_next(self):
+        """don't record the next interval (the loop deliberately idled)"""
+        self._skip_next = True
+
+    def resync(self):
+        """restart the schedule from now and drop the elapsed time"""
+        self._last = time.perf_counter()
+        self._deadline = self._last + self.period
+        self._skip_next = False
+
+    # ---- jitter stats ----
+
+    def reset_stats(self):
+        self.counts = array("I", bytes(4 * self.bins))
+        self.samples = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self.worst = 0.0
+
+    def _record(self, dt):
+        dev = dt - self.period
+        idx = int(dev // self.bin_s) + self.bins // 2
+        if idx < 0:
+            idx = 0
+        elif idx >= self.bins:
+            idx = self.bins - 1
+        self.counts[idx] += 1
+
+        self.samples += 1
+        self._sum += dev
+        self._sum_sq += dev * dev
+        if abs(dev) > abs(self.worst):
+            self.worst = dev
+
+    def histogram(self):
+        """[(lo_ms, hi_ms, count)] of interval - period; edge bins are open-ended"""
+        out = []
+        half = self.bins // 2
+        for i, count in enumerate(self.counts):
+            lo = (i - half) * self.bin_s * 1000
+            out.append((lo, lo + self.bin_s * 1000, count))
+        return out
+
+    def stats(self):
+        n = self.samples
+        if n == 0:
+            return {"fps": self.fps, "frames": 0}
+        mean = self._sum / n
+        var = max(0.0, self._sum_sq / n - mean * mean)
+        within = sum(c for lo, hi, c in self.histogram() if -0.5 <= lo and hi <= 0.5)
+        return {
+            "fps": self.fps,
+            "frames": n,
+            "mean_dev_ms": mean * 1000,
+            "jitter_ms": var ** 0.5 * 1000,
+            "worst_ms": self.worst * 1000,
+            "within_0.5ms": within / n,
+        }
+
+
+def benchmark(fps=60, seconds=2.0):
+    """pace an empty loop and return the pacer's stats"""
+    pacer = FramePacer(fps)
+    end = time.perf_counter() + seconds
+    pacer.tick()
+    pacer.reset_stats()
+    while time.perf_counter() < end:
+        pacer.tick()
+    return pacer.stats()
+
+
+if __name__ == "__main__":
+    for rate in (60, 120, 144):
+        s = benchmark(rate)
+        print(
+            f"{rate:>3} fps: frames={s['frames']} jitter={s['jitter_ms']:.3f}ms "
+            f"worst={s['worst_ms']:.3f}ms within0.5ms={s['within_0.5ms']:.1%}"
+        )
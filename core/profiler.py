@@ -0,0 +1,321 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import Counter
+
+import pygame
+
+from config.settings import ProfileConfig
+from utils.paths import project_root, report_path
+
+# Frame instrumentation (main.py --profile, --profile-mem adds tracemalloc).
+#
+# Per frame, between Game.frame()'s begin/end only:
+#   blit     Surface.blit / blits / fblits
+#   fill     Surface.fill
+#   draw     pygame.draw.* / pygame.gfxdraw.*
+#   text     Font.render
+#   surface  every new Surface: constructor, Font.render, copy / convert*,
+#            subsurface, transform.*, image loads, surfarray.make_surface
+# each counted against the module that made the call (world.sensors, fx.crt, ...).
+# pygame calls are seen through sys.setprofile c_call events; the Surface
+# constructor is a type call (no event), so pygame.Surface is swapped for a
+# counting subclass while the profiler is installed.
+#
+# Also per frame: GC runs and pause time (gc.callbacks), net allocated blocks,
+# and with tracemalloc the peak bytes allocated inside the frame.
+
+_MODULE_KINDS = {
+    "pygame.draw": ("draw",),
+    "pygame.gfxdraw": ("draw",),
+    "pygame.transform": ("surface",),
+}
+
+_CALL_KINDS = {
+    "Surface.blit": ("blit",),
+    "Surface.blits": ("blit",),
+    "Surface.fblits": ("blit",),
+    "Surface.fill": ("fill",),
+    "Font.render": ("text", "surface"),
+    "Surface.copy": ("surface",),
+    "Surface.convert": ("surface",),
+    "Surface.convert_alpha": ("surface",),
+    "Surface.subsurface": ("surface",),
+    "load": ("surface",),
+    "frombuffer": ("surface",),
+    "fromstring": ("surface",),
+    "frombytes": ("surface",),
+    "make_surface": ("surface",),
+}
+
+KINDS = ("blit", "fill", "draw", "text", "surface")
+KIND_INDEX = {kind: i for i, kind in enumerate(KINDS)}
+
+_active = None  # the installed FrameProfiler (read by _CountedSurface)
+_RealSurface = pygame.Surface
+
+
+class _CountedSurface(_RealSurface):
+    """pygame.Surface while profiling: counts constructions made inside a frame"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        profiler = _active
+        if profiler is not None and profiler.in_frame:
+            profiler.count(sys._getframe(1), ("surface",))
+
+
+class FrameRecord:
+    __slots__ = ("index", "ms", "counts", "gc_runs", "gc_ms", "gc_gen", "blocks", "peak_bytes")
+
+    def __init__(self, index, ms, counts, gc_runs, gc_ms, gc_gen, blocks, peak_bytes):
+        self.index = index
+        self.ms = ms
+        self.counts = counts          # calls this frame, one per KINDS entry
+        self.gc_runs = gc_runs
+        self.gc_ms = gc_ms
+        self.gc_gen = gc_gen          # oldest generation collected (-1 = none)
+        self.blocks = blocks          # net allocated blocks (sys.getallocatedblocks delta)
+        self.peak_bytes = peak_bytes  # tracemalloc peak above the frame's start (None without it)
+
+
+class FrameProfiler:
+    """
+    Collects per-frame call / allocation counts; Game calls begin_frame() and
+    end_frame() around each frame, and close() prints + writes the summary.
+    Nothing is hooked outside a frame, so idle waits and pacing sleeps are free.
+    """
+
+    def __init__(self, *, trace_memory=False, snapshot_frames=None):
+        self.trace_memory = trace_memory
+        self.snapshot_frames = ProfileConfig.SNAPSHOT_FRAMES if snapshot_frames is None else snapshot_frames
+
+        self.records = []
+        self.by_subsystem = Counter()  # (subsystem, kind) -> calls over the run
+        self.in_frame = False
+
+        self._root = str(project_root()) + os.sep
+        self._subsystems = {}  # code filename -> subsystem name
+        self._kinds = {}       # (module, qualname) -> kinds tuple (empty = ignored)
+
+        # hook-side counting allocates nothing that outlives the call (so tracemalloc
+        # doesn't blame the profiler's own bookkeeping on the game line being counted)
+        self._slot_of = {}       # (subsystem, kind) -> index into _counts
+        self._slot_keys = []
+        self._counts = array("q")
+        self._t0 = 0.0
+        self._blocks0 = 0
+        self._mem0 = 0
+        self._gc_started = 0.0
+        self._gc_ms = 0.0
+        self._gc_runs = 0
+        self._gc_gen = -1
+
+        self._snapshots = []  # (frame index, tracemalloc.Snapshot)
+        self._window_diffs = []  # (from frame, to frame, [StatisticDiff])
+
+        self._install()
+
+    # ---- hooks ----
+
+    def _install(self):
+        global _active
+        _active = self
+        pygame.Surface = _CountedSurface
+        gc.callbacks.append(self._on_gc)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(ProfileConfig.TRACE_DEPTH)
+
+    def _uninstall(self):
+        global _active
+        sys.setprofile(None)
+        _active = None
+        pygame.Surface = _RealSurface
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if not self.in_frame:
+            return
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        else:
+            self._gc_ms += (time.perf_counter() - self._gc_started) * 1000
+            self._gc_runs += 1
+            self._gc_gen = max(self._gc_gen, info["generation"])
+
+    def _subsystem(self, filename):
+        name = self._subsystems.get(filename)
+        if name is None:
+            if filename.startswith(self._root):
+                name = filename[len(self._root):].rsplit(".", 1)[0].replace(os.sep, ".")
+            else:
+                name = "other"
+            self._subsystems[filename] = name
+        return name
+
+    def _new_slot(self, key):
+        self._slot_of[key] = slot = len(self._slot_keys)
+        self._slot_keys.append(key)
+        self._counts.append(0)
+        return slot
+
+    def count(self, frame, kinds):
+        sub = self._subsystem(frame.f_code.co_filename)
+        for kind in kinds:
+            slot = self._slot_of.get((sub, kind))
+            if slot is None:
+                slot = self._new_slot((sub, kind))
+            self._counts[slot] += 1
+
+    def _on_call(self, frame, event, arg):
+        if event != "c_call":
+            return
+        key = (getattr(arg, "__module__", None), arg.__qualname__)
+        kinds = self._kinds.get(key)
+        if kinds is None:
+            kinds = _MODULE_KINDS.get(key[0]) or _CALL_KINDS.get(key[1]) or ()
+            self._kinds[key] = kinds
+        if kinds:
+            self.count(frame, kinds)
+
+    # ---- per frame ----
+
+    def begin_frame(self):
+        counts = self._counts
+        for i in range(len(counts)):
+            counts[i] = 0
+        self._gc_ms = 0.0
+        self._gc_runs = 0
+        self._gc_gen = -1
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self._mem0 = tracemalloc.get_traced_memory()[0]
+        self._blocks0 = sys.getallocatedblocks()
+
+        self.in_frame = True
+        self._t0 = time.perf_counter()
+        sys.setprofile(self._on_call)
+
+    def end_frame(self):
+        sys.setprofile(None)
+        ms = (time.perf_counter() - self._t0) * 1000
+        self.in_frame = False
+
+        blocks = sys.getallocatedblocks() - self._blocks0
+        peak = None
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - self._mem0
+
+        per_kind = [0] * len(KINDS)
+        for key, n in zip(self._slot_keys, self._counts):
+            if n:
+                per_kind[KIND_INDEX[key[1]]] += n
+                self.by_subsystem[key] += n
+
+        index = len(self.records)
+        self.records.append(FrameRecord(index, ms, tuple(per_kind), self._gc_runs, self._gc_ms, self._gc_gen, blocks, peak))
+
+        if self.trace_memory and self.snapshot_frames and index % self.snapshot_frames == 0:
+            self._snapshot(index)
+
+    def _snapshot(self, index):
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        if self._snapshots:
+            prev_index, prev = self._snapshots[-1]
+            diff = [d for d in snap.compare_to(prev, "lineno") if d.size_diff]
+            self._window_diffs.append((prev_index, index, diff[:ProfileConfig.TOP_LINES]))
+        self._snapshots = [self._snapshots[0], (index, snap)] if self._snapshots else [(index, snap)]
+
+    # ---- summary ----
+
+    def summary(self):
+        records = self.records
+        if not records:
+            return "frame profile: no frames recorded"
+
+        n = len(records)
+        lines = []
+        ms = [r.ms for r in records]
+        lines.append(f"---- frame profile: {n} frames, {sum(ms) / n:.2f} ms mean, {max(ms):.2f} ms max ----")
+
+        lines.append("per frame              mean      max")
+        for i, kind in enumerate(KINDS):
+            values = [r.counts[i] for r in records]
+            lines.append(f"  {kind:<18} {sum(values) / n:>7.1f} {max(values):>8}")
+
+        gc_frames = [r for r in records if r.gc_runs]
+        gc_total = sum(r.gc_ms for r in records)
+        lines.append(f"  {'gc runs':<18} {sum(r.gc_runs for r in records) / n:>7.2f} {max(r.gc_runs for r in records):>8}"
+                     f"   ({len(gc_frames)} frames, {gc_total:.1f} ms total,"
+                     f" {max((r.gc_ms for r in records), default=0):.2f} ms worst pause)")
+        blocks = [r.blocks for r in records]
+        lines.append(f"  {'net blocks':<18} {sum(blocks) / n:>+7.1f} {max(blocks):>+8}")
+        if self.trace_memory:
+            peaks = [r.peak_bytes / 1024 for r in records]
+            lines.append(f"  {'py alloc KiB':<18} {sum(peaks) / n:>7.1f} {max(peaks):>8.1f}   (tracemalloc peak inside the frame)")
+
+        lines.append("by subsystem (calls per frame)")
+        subsystems = sorted({sub for sub, _kind in self.by_subsystem})
+        subsystems.sort(key=lambda s: -sum(self.by_subsystem[(s, k)] for k in KINDS))
+        for sub in subsystems:
+            cells = "  ".join(
+                f"{kind} {self.by_subsystem[(sub, kind)] / n:.1f}" for kind in KINDS if self.by_subsystem[(sub, kind)]
+            )
+            lines.append(f"  {sub:<28} {cells}")
+
+        lines.append("slowest frames")
+        for r in sorted(records, key=lambda r: -r.ms)[:ProfileConfig.WORST_FRAMES]:
+            gc_note = f"gc {r.gc_ms:.2f} ms (gen {r.gc_gen})" if r.gc_runs else "no gc"
+            alloc = f", {r.peak_bytes / 1024:.1f} KiB" if r.peak_bytes is not None else ""
+            lines.append(
+                f"  #{r.index:<6} {r.ms:>7.2f} ms  {gc_note}, {r.counts[KIND_INDEX['surface']]} surfaces,"
+                f" {r.counts[KIND_INDEX['blit']]} blits, {r.blocks:+d} blocks{alloc}"
+            )
+
+        if len(self._snapshots) == 2:
+            (first, snap0), (last, snap1) = self._snapshots
+            growth = [d for d in snap1.compare_to(snap0, "lineno") if d.size_diff][:ProfileConfig.TOP_LINES]
+            lines.append(f"tracemalloc growth, frames {first}..{last}")
+            lines.extend(self._format_diff(growth))
+        if self._window_diffs:
+            start, end, diff = self._window_diffs[-1]
+            lines.append(f"tracemalloc last window, frames {start}..{end}")
+            lines.extend(self._format_diff(diff))
+
+        return "\n".join(lines)
+
+    def _format_diff(self, diff):
+        out = []
+        for d in diff:
+            frame = d.traceback[0]
+            filename = frame.filename
+            if filename.startswith(self._root):
+                filename = filename[len(self._root):]
+            out.append(f"  {d.size_diff / 1024:>+9.1f} KiB {d.count_diff:>+7} blocks  {filename}:{frame.lineno}")
+        return out or ["  (no change)"]
+
+    def close(self):
+        """unhook, print the summary and write it to reports/ (returns the file path)"""
+        if self.in_frame:
+            self.end_frame()
+        self._uninstall()
+
+        text = self.summary()
+        print(text)
+
+        os.makedirs(report_path(), exist_ok=True)
+        path = report_path(time.strftime("profile-%Y%m%d-%H%M%S.txt"))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+        if self.trace_memory:
+            tracemalloc.stop()
+        self._snapshots = []
+        return path
@@ -15,6 +15,10 @@ class StateMachine:
         self._bind(self.state)
 
     def change_state(self, new_state):
+        # the outgoing state drops its timers etc. so nothing fires against it later
+        exit_hook = getattr(self.state, "exit", None)
+        if exit_hook:
+            exit_hook()
         self.state = new_state
         self._bind(self.state)
 
@@ -23,6 +27,11 @@ class StateMachine:
         if handler:
             handler(event)
 
+    def next_change_in(self):
+        """seconds until the state next changes on screen (0 = every frame)"""
+        handler = getattr(self.state, "next_change_in", None)
+        return handler() if handler else 0
+
     def update(self, dt):
         self.state.update(dt)
 
@@ -0,0 +1,255 @@
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+
+from config.settings import TelemetryConfig
+from utils.paths import telemetry_path
+
+# Session telemetry: fixed-size binary records, batched + zlib'd by a writer
+# thread into rotating files under telemetry/.
+#
+# File layout (little-endian):
+#   header   magic "N2T", u8 version, u16 record size, f64 session start (unix),
+#            u16 part number, u16 cols, u16 rows
+#   batches  u32 compressed length, u32 record count, zlib(records)
+#
+# Record: f32 session time, u8 kind, u16 code, i16 a, i16 b, f32 value
+#   CELL          player entered cell (a, b)
+#   TRIGGER       code = trigger token (ord), (a, b) = cell
+#   SENSOR_WAKE   code = sensor index, (a, b) = player cell
+#   SENSOR_DETECT code = sensor index, (a, b) = player cell, value = suspicion (rising edge)
+#   SENSOR_LOST   code = sensor index, (a, b) = player cell, value = suspicion (falling edge)
+#   TASK          code = state index, a = path step, b = anchor token (ord, 0 = none),
+#                 value = task index (order in assets/tasks.json)
+#   SUSPICION     (a, b) = player cell, value = suspicion (periodic sample)
+#   DROPPED       value = records dropped so far this session (written when it grows)
+#
+# A map of another size (set_grid_size) starts a new part, so every file's
+# header cols / rows describe the grid its cells refer to.
+
+MAGIC = b"N2T"
+VERSION = 2  # 2: code widened to u16 (sensor indices past 255)
+
+FILE_HEADER = struct.Struct("<3sBHdHHH")
+BATCH_HEADER = struct.Struct("<II")
+RECORD = struct.Struct("<fBHhhf")
+
+CELL = 1
+TRIGGER = 2
+SENSOR_WAKE = 3
+SENSOR_DETECT = 4
+SENSOR_LOST = 5
+TASK = 6
+SUSPICION = 7
+DROPPED = 8
+GRID = 255  # queue-only control item (a, b) = (cols, rows); never written as a record
+
+KIND_NAMES = {
+    CELL: "cell",
+    TRIGGER: "trigger",
+    SENSOR_WAKE: "sensor_wake",
+    SENSOR_DETECT: "sensor_detect",
+    SENSOR_LOST: "sensor_lost",
+    TASK: "task",
+    SUSPICION: "suspicion",
+    DROPPED: "dropped",
+}
+
+
+class Telemetry:
+    """
+    Game-thread side is emit(): one bounds check and one deque.append of a
+    plain tuple (deque appends/pops are atomic under the GIL, so no lock).
+    Packing, compression and file I/O all happen on the writer thread.
+
+    When the queue is full new records are dropped and counted, never blocked on.
+    A batch that fails to pack or write is counted in failed and reported; the
+    writer keeps going with the next one.
+    """
+
+    def __init__(self, *, enabled=None, directory=None, capacity=None, grid_size=(0, 0)):
+        self.enabled = TelemetryConfig.ENABLED if enabled is None else enabled
+        self.directory = telemetry_path() if directory is None else directory
+        self.capacity = TelemetryConfig.QUEUE_CAPACITY if capacity is None else capacity
+        self.cols, self.rows = grid_size
+        self._grid_size = tuple(grid_size)  # as last requested by the game thread
+
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0  # records lost to a batch that couldn't be packed / written
+
+        self._queue = deque()
+        self._t0 = time.perf_counter()
+        self._started_at = time.time()
+        self._session = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+        self._part = 0
+        self._dropped_written = 0
+
+        if self.enabled:
+            self._thread = threading.Thread(target=self._run, name="node2084-telemetry", daemon=True)
+            self._thread.start()
+
+    # ---- game thread ----
+
+    def emit(self, kind, code=0, a=0, b=0, value=0.0):
+        if not self.enabled:
+            return
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            self.dropped += 1
+            return
+        queue.append((time.perf_counter() - self._t0, kind, code, a, b, value))
+
+    def set_grid_size(self, size):
+        """the map in play is (cols, rows): records after this go to a part with that header"""
+        size = tuple(size)
+        if not self.enabled or size == self._grid_size:
+            return
+        self._grid_size = size
+        # past the capacity check: a size change must never be dropped
+        self._queue.append((time.perf_counter() - self._t0, GRID, 0, size[0], size[1], 0.0))
+
+    def close(self):
+        """stop the writer after it drains the queue"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    # ---- writer thread ----
+
+    def _run(self):
+        interval = TelemetryConfig.FLUSH_INTERVAL
+        try:
+            while not self._stop.wait(interval):
+                self._drain()
+            self._drain()
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _drain(self):
+        queue = self._queue
+        batch_max = TelemetryConfig.BATCH_RECORDS
+
+        while True:
+            records = []
+            grid = None
+            popleft = queue.popleft
+            try:
+                while len(records) < batch_max:
+                    record = popleft()
+                    if record[1] == GRID:
+                        grid = record
+                        break
+                    records.append(record)
+            except IndexError:
+                pass
+
+            # dropped count travels in the stream so readers see the gap
+            if self.dropped != self._dropped_written:
+                self._dropped_written = self.dropped
+                records.append((time.perf_counter() - self._t0, DROPPED, 0, 0, 0, float(self.dropped)))
+
+            if not records and grid is None:
+                return
+
+            if records:
+                try:
+                    self._write_batch(records)
+                except (struct.error, OSError) as exc:
+                    self.failed += len(records)
+                    print(f"telemetry: dropped a batch of {len(records)} records ({exc})", file=sys.stderr)
+            if grid is not None:
+                self._switch_grid(grid[3], grid[4])
+                continue
+            if len(records) < batch_max:
+                return
+
+    def _write_batch(self, records):
+        pack = RECORD.pack
+        raw = b"".join([pack(*rec) for rec in records])
+        data = zlib.compress(raw, TelemetryConfig.COMPRESS_LEVEL)
+
+        f = self._file
+        if f is None or f.tell() >= TelemetryConfig.ROTATE_BYTES:
+            f = self._rotate()
+
+        f.write(BATCH_HEADER.pack(len(data), len(records)))
+        f.write(data)
+        f.flush()
+        self.written += len(records)
+
+    def _switch_grid(self, cols, rows):
+        if (cols, rows) == (self.cols, self.rows):
+            return
+        self.cols, self.rows = cols, rows
+        # the next batch opens a new part whose header carries the new size
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._part += 1
+        path = os.path.join(self.directory, f"{self._session}-{self._part:03d}.n2t")
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(
+            MAGIC, VERSION, RECORD.size, self._started_at, self._part, self.cols, self.rows,
+        ))
+        self._prune()
+        return self._file
+
+    def _prune(self):
+        keep = TelemetryConfig.KEEP_FILES
+        if keep <= 0:
+            return
+        files = sorted(name for name in os.listdir(self.directory) if name.endswith(".n2t"))
+        for name in files[:-keep]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+def read_file(path):
+    """
+    (header dict, list of record tuples) for one telemetry file.
+    A truncated final batch (game killed mid-write) is ignored.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, record_size, started_at, part, cols, rows = FILE_HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a NODE 2084 telemetry file")
+    if version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"Unsupported telemetry version {version}")
+
+    header = {"started_at": started_at, "part": part, "cols": cols, "rows": rows}
+
+    records = []
+    offset = FILE_HEADER.size
+    while offset + BATCH_HEADER.size <= len(data):
+        length, count = BATCH_HEADER.unpack_from(data, offset)
+        offset += BATCH_HEADER.size
+        if offset + length > len(data):
+            break
+        raw = zlib.decompress(data[offset:offset + length])
+        offset += length
+        records.extend(RECORD.iter_unpack(raw[:count * RECORD.size]))
+
+    return header, records
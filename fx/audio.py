@@ -0,0 +1,249 @@
+import math
+
+import pygame
+
+from config.settings import AudioConfig
+
+try:
+    import numpy as np
+except ImportError:  # no NumPy, no synthesis: the game runs silent
+    np = None
+
+
+# ---- synthesis (float32 samples in -1..1) ----
+
+def _time(seconds, rate):
+    return np.arange(int(seconds * rate), dtype=np.float32) / rate
+
+
+def _sine(freq, t):
+    return np.sin(2 * math.pi * freq * t, dtype=np.float32)
+
+
+def _square(freq, t, harmonics=3):
+    """band-limited square: the first few odd harmonics (soft, no aliasing)"""
+    wave = np.zeros_like(t)
+    for k in range(harmonics):
+        n = 2 * k + 1
+        wave += _sine(freq * n, t) / n
+    return wave * (4 / math.pi) * 0.5
+
+
+def synth_hum(rate, seconds=1.0):
+    """mains hum: 50 Hz plus harmonics, a whole number of cycles so it loops seamlessly"""
+    t = _time(seconds, rate)
+    return 0.5 * _sine(50, t) + 0.3 * _sine(100, t) + 0.15 * _sine(150, t) + 0.05 * _sine(250, t)
+
+
+def synth_click(rate, seconds=0.012, seed=0):
+    """relay tick: a noise burst over a short 2 kHz blip, both decaying in ~2 ms"""
+    t = _time(seconds, rate)
+    noise = np.random.default_rng(seed).uniform(-1, 1, len(t)).astype(np.float32)
+    envelope = np.exp(-t / 0.002, dtype=np.float32)
+    return (0.6 * noise + 0.4 * _sine(2000, t)) * envelope
+
+
+def synth_chime(rate, notes=(523, 659, 784), note_s=0.12, tail_s=0.25):
+    """task chime: a rising arpeggio, each note ringing out under the next"""
+    t = _time(len(notes) * note_s + tail_s, rate)
+    wave = np.zeros_like(t)
+    for i, freq in enumerate(notes):
+        local = np.maximum(t - i * note_s, 0.0)
+        wave += np.where(t >= i * note_s, _sine(freq, local) * np.exp(-local / 0.12, dtype=np.float32), 0.0)
+    return wave / len(notes)
+
+
+def synth_alert(rate, seconds=0.15, f0=1200.0, f1=600.0):
+    """detection sting: a falling square sweep"""
+    t = _time(seconds, rate)
+    phase = 2 * math.pi * (f0 * t + (f1 - f0) * t * t / (2 * seconds))
+    wave = np.sign(np.sin(phase)).astype(np.float32) * 0.5
+    return wave * np.minimum(1.0, (seconds - t) / 0.02)
+
+
+def synth_sensor(rate, seconds=0.5):
+    """infrared whine: 880 Hz with a 4 Hz tremolo (both loop cleanly over 0.5 s)"""
+    t = _time(seconds, rate)
+    tremolo = 0.75 + 0.25 * _sine(4, t)
+    return _sine(880, t) * tremolo
+
+
+def synth_alarm(rate, beeps_per_s, seconds=None):
+    """
+    two-tone alarm: alternating 660 / 880 Hz beeps with raised-cosine edges.
+    Default length: about a second, rounded to whole lo/hi pairs so the loop seam keeps alternating.
+    """
+    if seconds is None:
+        pair_s = 2.0 / beeps_per_s
+        seconds = pair_s * max(1, round(1.0 / pair_s))
+    t = _time(seconds, rate)
+    beep = (t * beeps_per_s).astype(np.int32)
+    phase = t * beeps_per_s - beep                      # 0..1 through each beep
+    freq_hi = (beep % 2).astype(bool)
+
+    wave = np.where(freq_hi, _square(880, t), _square(660, t))
+    gate = np.clip(np.minimum(phase, 0.7 - phase) / 0.05, 0.0, 1.0)  # on for 70%, 50 ms edges
+    gate = 0.5 - 0.5 * np.cos(math.pi * gate, dtype=np.float32)
+    return wave * gate
+
+
+class AudioSystem:
+    """
+    Synthesised sound on a small, fixed mixer setup.
+
+    - every sound is built once at startup (NumPy) into a pygame Sound buffer;
+      nothing is synthesised or loaded while playing
+    - the first channels are reserved looping slots (hum, sensor, alarm) whose
+      volume is steered every frame; only real changes reach the mixer
+    - one-shots share the remaining channels: a free one if any, otherwise the
+      lowest-priority, oldest sound is stolen (never a higher priority one)
+    - the mixer runs with a small buffer (AudioConfig.BUFFER) for low latency
+
+    Without NumPy or an audio device every call is a no-op.
+    """
+
+    LOOP_SLOTS = ("hum", "sensor", "alarm")
+
+    # volumes are quantised before they reach the mixer (no per-frame set_volume churn)
+    VOLUME_STEPS = 64
+
+    @staticmethod
+    def pre_init():
+        """mixer format / buffer size; must run before pygame.init()"""
+        pygame.mixer.pre_init(AudioConfig.SAMPLE_RATE, -16, 1, AudioConfig.BUFFER)
+
+    def __init__(self, enabled=None):
+        self.enabled = AudioConfig.ENABLED if enabled is None else enabled
+        self.sounds = {}
+        self.dropped = 0  # one-shots refused because every pool channel held higher priority
+
+        self._loops = {}    # slot -> Channel
+        self._looping = {}  # slot -> (sound name, quantised volume) currently set
+        self._pool = []
+        self._pool_priority = []
+        self._pool_order = []
+        self._played = 0
+
+        if not self.enabled or np is None:
+            self.enabled = False
+            return
+
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(AudioConfig.SAMPLE_RATE, -16, 1, AudioConfig.BUFFER)
+            except pygame.error:
+                self.enabled = False
+                return
+
+        rate, _size, out_channels = pygame.mixer.get_init()
+        self._build_sounds(rate, out_channels)
+
+        slots = len(self.LOOP_SLOTS)
+        pygame.mixer.set_num_channels(max(AudioConfig.CHANNELS, slots + 1))
+        pygame.mixer.set_reserved(slots)  # keep find_channel() (anyone else) off the loop slots
+        self._loops = {slot: pygame.mixer.Channel(i) for i, slot in enumerate(self.LOOP_SLOTS)}
+        self._pool = [pygame.mixer.Channel(i) for i in range(slots, pygame.mixer.get_num_channels())]
+        self._pool_priority = [0] * len(self._pool)
+        self._pool_order = [0] * len(self._pool)
+
+    @property
+    def available(self):
+        return self.enabled
+
+    # ---- startup ----
+
+    def _build_sounds(self, rate, out_channels):
+        master = AudioConfig.MASTER_VOLUME
+        waves = {
+            "hum": synth_hum(rate),
+            "click": synth_click(rate),
+            "chime": synth_chime(rate),
+            "alert": synth_alert(rate),
+            "sensor": synth_sensor(rate),
+        }
+        for step, beeps in enumerate(AudioConfig.ALARM_BEEPS):
+            waves[f"alarm{step}"] = synth_alarm(rate, beeps)
+
+        for name, wave in waves.items():
+            samples = (np.clip(wave * master, -1.0, 1.0) * 32767).astype(np.int16)
+            if out_channels > 1:
+                samples = np.ascontiguousarray(np.repeat(samples[:, None], out_channels, axis=1))
+            self.sounds[name] = pygame.sndarray.make_sound(samples)
+
+    # ---- one-shots ----
+
+    def play(self, name, volume=1.0):
+        """fire a one-shot; returns its Channel, or None if it was dropped"""
+        if not self.enabled:
+            return None
+
+        priority = AudioConfig.PRIORITY.get(name, 0)
+        slot = None
+        for i, channel in enumerate(self._pool):
+            if not channel.get_busy():
+                slot = i
+                break
+            if self._pool_priority[i] > priority:
+                continue
+            if slot is None or (self._pool_priority[i], self._pool_order[i]) < (
+                self._pool_priority[slot], self._pool_order[slot]
+            ):
+                slot = i
+
+        if slot is None:
+            self.dropped += 1
+            return None
+
+        self._played += 1
+        self._pool_priority[slot] = priority
+        self._pool_order[slot] = self._played
+
+        channel = self._pool[slot]
+        channel.play(self.sounds[name])  # replaces whatever the channel held
+        channel.set_volume(volume)
+        return channel
+
+    # ---- loops ----
+
+    def set_loop(self, slot, name, volume):
+        """keep sound name looping on slot at volume (0 stops it); cheap to call every frame"""
+        if not self.enabled:
+            return
+
+        level = round(max(0.0, min(1.0, volume)) * self.VOLUME_STEPS)
+        current = self._looping.get(slot)
+        if level == 0:
+            if current is not None:
+                self._loops[slot].stop()
+                del self._looping[slot]
+            return
+        if current == (name, level):
+            return
+
+        channel = self._loops[slot]
+        if current is None or current[0] != name:
+            channel.play(self.sounds[name], loops=-1)
+        channel.set_volume(level / self.VOLUME_STEPS)
+        self._looping[slot] = (name, level)
+
+    def sensor_tone(self, level):
+        """infrared whine following the brightest awake sensor (level = alpha / max alpha)"""
+        self.set_loop("sensor", "sensor", level * AudioConfig.SENSOR_VOLUME)
+
+    def alarm(self, suspicion):
+        """alarm loop: silent below ALARM_START, then louder and faster up to 100"""
+        level = (suspicion - AudioConfig.ALARM_START) / (100 - AudioConfig.ALARM_START)
+        bands = len(AudioConfig.ALARM_BEEPS)
+        step = max(0, min(bands - 1, int(level * bands)))
+        self.set_loop("alarm", f"alarm{step}", level * AudioConfig.ALARM_VOLUME)
+
+    def stop_loops(self):
+        for slot in list(self._looping):
+            self._loops[slot].stop()
+        self._looping.clear()
+
+    def close(self):
+        if self.enabled:
+            self.stop_loops()
+            for channel in self._pool:
+                channel.stop()
@@ -0,0 +1,135 @@
+import random
+import time
+
+import pygame
+
+from config.settings import FXConfig
+from config.palette import Colour
+
+try:
+    import numpy as np
+except ImportError:  # masks fall back to plain draw calls
+    np = None
+
+
+class CRTEffect:
+    """
+    CRT post pass over the finished frame: scanlines, vignette, flicker, jitter.
+
+    Scanlines + vignette are baked once per resolution into a single multiply
+    mask, so the per-frame cost is one BLEND_RGB_MULT blit. Flicker is a global
+    multiply fill (only on flicker frames) and jitter is an in-place scroll.
+    Nothing is allocated per frame.
+    """
+
+    QUALITY_OFF = 0
+    QUALITY_LOW = 1   # scanlines + flicker
+    QUALITY_HIGH = 2  # scanlines + vignette + flicker + jitter
+
+    def __init__(self, quality=None, *, seed=None):
+        self.quality = FXConfig.CRT_QUALITY if quality is None else quality
+        self.rng = random.Random(seed)
+
+        self._mask = None
+        self._mask_key = None
+
+        self._jitter_left = 0.0
+        self._jitter_dx = 0
+
+    def set_quality(self, quality):
+        self.quality = quality
+        self._mask_key = None
+
+    # ---- mask baking (once per resolution / quality) ----
+
+    def _build_mask(self, size):
+        w, h = size
+        mask = pygame.Surface(size)
+        mask.fill((255, 255, 255))
+
+        scan = int(255 * (1.0 - FXConfig.CRT_SCANLINE_STRENGTH))
+        vignette = self.quality >= self.QUALITY_HIGH
+
+        if np is None:
+            for y in range(1, h, 2):
+                pygame.draw.line(mask, (scan, scan, scan), (0, y), (w - 1, y))
+            return mask
+
+        xs = np.linspace(-1.0, 1.0, w, dtype=np.float32)
+        ys = np.linspace(-1.0, 1.0, h, dtype=np.float32)
+
+        factor = np.ones((w, h), dtype=np.float32)
+        if vignette:
+            d2 = (xs[:, None] ** 2 + ys[None, :] ** 2) * 0.5
+            factor -= FXConfig.CRT_VIGNETTE_STRENGTH * d2 * d2
+
+        factor[:, 1::2] *= scan / 255.0
+
+        view = pygame.surfarray.pixels3d(mask)
+        view[...] = np.clip(factor * 255.0, 0, 255).astype(np.uint8)[:, :, None]
+        del view  # release the surface lock
+
+        return mask
+
+    def _ensure_mask(self, screen):
+        key = (screen.get_size(), self.quality)
+        if key != self._mask_key:
+            mask = self._build_mask(key[0])
+            if pygame.display.get_surface() is not None:
+                mask = mask.convert(screen)
+            self._mask = mask
+            self._mask_key = key
+        return self._mask
+
+    # ---- per frame ----
+
+    def next_change_in(self):
+        # a jitter tear has to be animated; flicker is just sampled whenever we draw
+        if self.quality >= self.QUALITY_HIGH and self._jitter_left > 0:
+            return 0
+        return None
+
+    def apply(self, screen, dt):
+        if self.quality <= self.QUALITY_OFF:
+            return
+
+        # jitter: occasional short horizontal tear, scrolled in place
+        if self.quality >= self.QUALITY_HIGH:
+            if self._jitter_left > 0:
+                self._jitter_left -= dt
+            elif self.rng.random() < FXConfig.CRT_JITTER_CHANCE:
+                self._jitter_left = FXConfig.CRT_JITTER_TIME
+                self._jitter_dx = self.rng.choice((-1, 1)) * self.rng.randint(1, FXConfig.CRT_JITTER_PX)
+
+            if self._jitter_left > 0:
+                dx = self._jitter_dx
+                screen.scroll(dx, 0)
+                # scroll leaves the old pixels in the exposed strip: blank it
+                w, h = screen.get_size()
+                strip = (0, 0, dx, h) if dx > 0 else (w + dx, 0, -dx, h)
+                screen.fill(Colour.BACKGROUND, strip)
+
+        screen.blit(self._ensure_mask(screen), (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+        # flicker: global brightness dip on a few frames
+        if self.rng.random() < FXConfig.CRT_FLICKER_CHANCE:
+            v = 255 - self.rng.randint(1, int(255 * FXConfig.CRT_FLICKER_DEPTH))
+            screen.fill((v, v, v), special_flags=pygame.BLEND_RGB_MULT)
+
+
+def benchmark(size=(800, 600), frames=600, quality=CRTEffect.QUALITY_HIGH):
+    """average ms per apply() on an offscreen surface of the given size"""
+    screen = pygame.Surface(size)
+    screen.fill((0, 10, 0))
+    crt = CRTEffect(quality, seed=0)
+    crt.apply(screen, 1 / 60)  # bake outside the timed loop
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        crt.apply(screen, 1 / 60)
+    return (time.perf_counter() - t0) * 1000.0 / frames
+
+
+if __name__ == "__main__":
+    for q in (CRTEffect.QUALITY_LOW, CRTEffect.QUALITY_HIGH):
+        print(f"quality {q}: {benchmark(quality=q):.3f} ms/frame @ 800x600")
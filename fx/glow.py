@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class GlowCache:
+    """
+    Pre-baked square glow sprites with a smooth falloff around a tile.
+
+    Sprites are keyed by (base colour, quantised phosphor alpha), stored as
+    premultiplied RGB and meant to be blitted with BLEND_RGB_ADD. The cache is
+    a small LRU so pulsing alpha never grows it without bound.
+    """
+
+    def __init__(self, core_px, radius_px, peak=0.35, *, alpha_step=8, max_entries=32):
+        self.core_px = core_px
+        self.radius_px = radius_px
+        self.peak = peak
+        self.alpha_step = alpha_step
+        self.max_entries = max_entries
+
+        self._sprites = OrderedDict()
+
+    @property
+    def size(self):
+        return self.core_px + 2 * self.radius_px
+
+    def _quantise(self, alpha):
+        step = self.alpha_step
+        return min(255, int(alpha) // step * step + step // 2)
+
+    def _bake(self, rgb, alpha):
+        size = self.size
+        surf = pygame.Surface((size, size))
+        surf.fill((0, 0, 0))
+
+        factor = alpha / 255.0
+        rad = self.radius_px
+
+        # outermost ring first; each smaller rect overwrites the centre
+        for d in range(rad, -1, -1):
+            t = 1.0 - d / (rad + 1)
+            k = self.peak * factor * t * t
+            col = (int(rgb[0] * k), int(rgb[1] * k), int(rgb[2] * k))
+            inset = rad - d
+            rect = pygame.Rect(inset, inset, size - 2 * inset, size - 2 * inset)
+            pygame.draw.rect(surf, col, rect, border_radius=d)
+
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        return surf
+
+    def get(self, rgb, phosphor_alpha=255):
+        key = (tuple(rgb), self._quantise(phosphor_alpha))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = self._bake(key[0], key[1])
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def blit(self, screen, rgb, tile_rect, phosphor_alpha=255):
+        sprite = self.get(rgb, phosphor_alpha)
+        pos = (tile_rect.x - self.radius_px, tile_rect.y - self.radius_px)
+        screen.blit(sprite, pos, special_flags=pygame.BLEND_RGB_ADD)
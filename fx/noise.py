@@ -0,0 +1,89 @@
+import random
+
+import pygame
+
+from config.settings import FXConfig
+from config.palette import Colour
+
+try:
+    import numpy as np
+except ImportError:  # slower pure-python generation at startup
+    np = None
+
+
+class NoiseAtlas:
+    """
+    Static / grain overlay.
+
+    N seeded noise tiles are generated once (vectorised) and stored as
+    display-format surfaces. Drawing picks the next frame, scales its brightness
+    by the intensity into one reused scratch tile and adds that across the
+    screen from a random offset (BLEND_RGB_ADD): grain only ever brightens, it
+    never dims the scene. Nothing is regenerated or allocated per frame.
+    """
+
+    def __init__(self, frames=None, tile=None, *, seed=None):
+        self.frame_count = FXConfig.NOISE_FRAMES if frames is None else frames
+        self.tile = FXConfig.NOISE_TILE if tile is None else tile
+        self.rng = random.Random(seed)
+
+        self.frames = self._generate(seed)
+        self.index = 0
+        self._scratch = None  # brightness-scaled copy of the current frame
+
+    def _generate(self, seed):
+        t = self.tile
+        r, g, b = Colour.BRIGHT_GREEN
+
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            # squared uniform noise: mostly dark with sparse bright grains
+            v = rng.random((self.frame_count, t, t), dtype=np.float32)
+            v *= v
+            tint = np.array(Colour.BRIGHT_GREEN, dtype=np.float32)
+            data = (v[..., None] * tint).astype(np.uint8)
+            frames = [pygame.surfarray.make_surface(data[i]) for i in range(self.frame_count)]
+        else:
+            rng = random.Random(seed)
+            frames = []
+            for _ in range(self.frame_count):
+                grey = rng.randbytes(t * t)
+                rgb = bytes(v for px in grey for v in (px * r // 255, px * g // 255, px * b // 255))
+                frames.append(pygame.image.frombuffer(rgb, (t, t), "RGB").copy())
+
+        if pygame.display.get_surface() is not None:
+            frames = [f.convert() for f in frames]
+        return frames
+
+    def _scaled(self, surf, level):
+        if self._scratch is None:
+            self._scratch = surf.copy()
+        scratch = self._scratch
+        scratch.blit(surf, (0, 0))
+        scratch.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+        return scratch
+
+    def render(self, screen, intensity):
+        """intensity 0..1 scales the grain brightness; 0 draws nothing"""
+        if intensity <= 0 or not self.frames:
+            return
+
+        level = int(min(1.0, intensity) * FXConfig.NOISE_MAX_ALPHA)
+        if level <= 0:
+            return
+
+        surf = self._scaled(self.frames[self.index], level)
+        self.index = (self.index + 1) % len(self.frames)
+
+        t = self.tile
+        w, h = screen.get_size()
+        ox = -self.rng.randrange(t)
+        oy = -self.rng.randrange(t)
+
+        y = oy
+        while y < h:
+            x = ox
+            while x < w:
+                screen.blit(surf, (x, y), special_flags=pygame.BLEND_RGB_ADD)
+                x += t
+            y += t
@@ -3,12 +3,13 @@ from config.settings import GamePlayConfig, TimingConfig
 
 
 class PhosphorPulse:
-    """controls global bright-green alpha cycling"""
+    """controls global bright-green alpha cycling (the hold is a scheduled timer)"""
 
-    def __init__(self):
+    def __init__(self, timers):
+        self.timers = timers
         self.alpha = GamePlayConfig.PHOS_MIN_ALPHA
         self.phase = "up"
-        self.timer = 0
+        self.hold_time = 0.0
 
     def _new_hold_time(self):
         t = uniform(0.0, 1.0)
@@ -17,6 +18,13 @@ class PhosphorPulse:
             TimingConfig.PHOS_MAX_HOLD - TimingConfig.PHOS_MIN_HOLD
         ) * (1.0 - biased)
 
+    def next_change_in(self):
+        # alpha only sits still while holding; the hold's end is on the timer heap
+        return None if self.phase == "hold" else 0
+
+    def _release(self):
+        self.phase = "down"
+
     def update(self, dt):
         min_a = GamePlayConfig.PHOS_MIN_ALPHA
         max_a = GamePlayConfig.PHOS_MAX_ALPHA
@@ -30,12 +38,7 @@ class PhosphorPulse:
                 self.alpha = max_a
                 self.phase = "hold"
                 self.hold_time = self._new_hold_time()
-                self.timer = self.hold_time
-
-        elif self.phase == "hold":
-            self.timer -= dt
-            if self.timer <= 0:
-                self.phase = "down"
+                self.timers.after(self.hold_time, self._release)
 
         elif self.phase == "down":
             speed = (max_a - min_a) / fade_time
@@ -4,7 +4,15 @@ from core.game import Game
 
 
 def main():
-    Game().run()
+    args = sys.argv[1:]
+    game = Game()
+    if "--profile" in args or "--profile-mem" in args:
+        game.enable_profiling(trace_memory="--profile-mem" in args)
+    if "--async" in args:
+        game.run_async()
+    else:
+        game.run()
+    game.shutdown()
     pygame.quit()
     sys.exit()
 
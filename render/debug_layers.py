@@ -0,0 +1,159 @@
+import pygame
+
+from config.palette import Colour
+from world.map.meshing import merge_cells
+
+# byte table: 0 -> 1, anything else -> 0 (inverts a 0/1 mask with bytes.translate)
+_INVERT = bytes([1]) + bytes(255)
+
+
+class DebugLayers:
+    """
+    Toggleable debug overlays for one map, each baked once into its own surface.
+
+    - markers:  spawn, sensor emitters, task / discovery / anomaly and door cells (Map.marker_data)
+    - sensors:  every cell inside any sensor's cone
+    - triggers: door trigger cells and task trigger cells
+    - zones:    Task1 activation zones around every anchor, the live zone brighter
+    - walkable: cells that don't block with the current doors
+
+    A layer is rebaked only when what it shows changes (door state for sensors /
+    walkable, the live zone centres for zones); otherwise drawing it is one blit.
+    Only cells inside the window are baked, so a large map costs no more than a
+    screen-sized one, and filled layers merge their cells into blocks first.
+    """
+
+    LAYERS = ("markers", "sensors", "triggers", "zones", "walkable")
+
+    def __init__(self, game_map, sensors=(), tasks=None):
+        self.map = game_map
+        self.sensors = sensors
+        self.tasks = tasks  # world.tasks.system.TaskSystem (or None)
+
+        self.visible = set()
+        self._cache = {}  # layer -> (key, surface)
+
+    def toggle(self, name):
+        if name not in self.LAYERS:
+            raise KeyError(name)
+        self.visible ^= {name}
+
+    def clear(self):
+        self.visible.clear()
+
+    # ---- cache keys ----
+
+    def _key(self, name):
+        """everything a layer's pixels depend on besides the (fixed) layout"""
+        if name in ("sensors", "walkable"):
+            return self.map.get_state()[0]
+        if name == "zones" and self.tasks is not None:
+            return tuple(task.zone_centres for task in self.tasks.tasks)
+        return 0
+
+    def _view(self, screen):
+        """(cols, rows) of map cells that land inside the window"""
+        m = self.map
+        width, height = screen.get_size()
+        cols = min(m.cols, -(-(width - m.offset_x) // m.cell))
+        rows = min(m.rows, -(-(height - m.offset_y) // m.cell))
+        return max(0, cols), max(0, rows)
+
+    def _surface(self, name, view):
+        key = (view, self._key(name))
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != key:
+            cols, rows = view
+            cell = self.map.cell
+            surf = pygame.Surface((cols * cell, rows * cell), pygame.SRCALPHA)
+            getattr(self, "_bake_" + name)(surf, view)
+            cached = (key, surf)
+            self._cache[name] = cached
+        return cached[1]
+
+    # ---- baking ----
+
+    def _fill(self, surf, view, mask, colour):
+        """fill the view's cells where mask[r * map cols + c] is set"""
+        cols, rows = view
+        stride = self.map.cols
+        cells = [(c, r) for r in range(rows) for c in range(cols) if mask[r * stride + c]]
+
+        cell = self.map.cell
+        for c, r, w, h in merge_cells(cells, cols, rows):
+            surf.fill(colour, (c * cell, r * cell, w * cell, h * cell))
+
+    def _bake_markers(self, surf, view):
+        md = self.map.marker_data
+        cols, rows = view
+        cell = self.map.cell
+        half = cell // 2
+
+        outlined = [md["spawn_cell"]]
+        for group in ("task_cells", "discovery_cells", "dynamic_walls"):
+            for cells in md[group].values():
+                outlined.extend(cells)
+        outlined.extend((c, r) for c, r, _token in md["anomalies"])
+
+        for c, r in outlined:
+            if c < cols and r < rows:
+                pygame.draw.rect(surf, Colour.BRIGHT_GREEN, (c * cell, r * cell, cell, cell), 1)
+
+        # emitter dot plus a tick towards its facing
+        for c, r, token in md["sensors"]:
+            if c < cols and r < rows:
+                cx, cy = c * cell + half, r * cell + half
+                dx, dy = {"^": (0, -5), "v": (0, 5), "<": (-5, 0), ">": (5, 0)}[token]
+                pygame.draw.circle(surf, Colour.SENSOR, (cx, cy), 3)
+                pygame.draw.line(surf, Colour.SENSOR, (cx, cy), (cx + dx, cy + dy), 1)
+
+    def _bake_sensors(self, surf, view):
+        # masks are 0/1 per byte, so OR-ing them as big ints ORs them cell by cell
+        covered = 0
+        for sensor in self.sensors:
+            if sensor.visible_mask is not None:
+                covered |= int.from_bytes(sensor.visible_mask, "little")
+        mask = covered.to_bytes(len(self.map.grid), "little")
+        self._fill(surf, view, mask, Colour.DEBUG_SENSOR)
+
+    def _bake_triggers(self, surf, view):
+        mask = bytearray(len(self.map.grid))
+        for cell_ids in self.map.triggers.values():
+            for idx in cell_ids:
+                mask[idx] = 1
+        self._fill(surf, view, mask, Colour.DEBUG_TRIGGER)
+        if self.tasks is not None:
+            self._fill(surf, view, self.tasks.trigger_lookup, Colour.DEBUG_TRIGGER)
+
+    def _bake_zones(self, surf, view):
+        if self.tasks is None:
+            return
+        m = self.map
+        reach = bytearray(len(m.grid))
+        for task in self.tasks.tasks:
+            rad = task.activation_radius_cells
+            for c0, r0 in task.anchors.values():
+                for r in range(max(0, r0 - rad), min(m.rows, r0 + rad + 1)):
+                    for c in range(max(0, c0 - rad), min(m.cols, c0 + rad + 1)):
+                        reach[r * m.cols + c] = 1
+        self._fill(surf, view, reach, Colour.DEBUG_ZONE)
+
+        # fills replace pixels, so the live zone goes on top at its own alpha
+        for task in self.tasks.tasks:
+            self._fill(surf, view, task.zone, Colour.DEBUG_ZONE_LIVE)
+
+    def _bake_walkable(self, surf, view):
+        # grid bytes -> 1 where blocking (live wall table), then inverted
+        mask = self.map.grid.translate(self.map.wall_table).translate(_INVERT)
+        self._fill(surf, view, mask, Colour.DEBUG_WALKABLE)
+
+    # ---- render ----
+
+    def render(self, screen):
+        if not self.visible:
+            return
+        view = self._view(screen)
+        at = (self.map.offset_x, self.map.offset_y)
+        for name in self.LAYERS:
+            if name in self.visible:
+                screen.blit(self._surface(name, view), at)
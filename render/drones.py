@@ -0,0 +1,31 @@
+import pygame
+
+from config.palette import Colour
+
+# (size, colour) -> solid square
+_sprites = {}
+
+
+def _sprite(size, colour):
+    key = (size, colour)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((size, size))
+        sprite.fill(colour)
+        _sprites[key] = sprite
+    return sprite
+
+
+def draw_drones(screen, drones, phosphor_alpha=255):
+    """every live drone in one blits call (patrol colour / alert colour by state)"""
+    n = drones.count
+    if n == 0:
+        return
+
+    half = drones.size / 2
+    top_left = (drones.pos[:n] - half).astype("int32").tolist()
+    sprites = (
+        _sprite(drones.size, Colour.phosphor_colour(Colour.DRONE, phosphor_alpha)),
+        _sprite(drones.size, Colour.DRONE_ALERT),
+    )
+    screen.blits([(sprites[s], xy) for s, xy in zip(drones.state[:n].tolist(), top_left)], doreturn=False)
@@ -0,0 +1,18 @@
+import pygame
+
+from config.palette import Colour
+
+
+def draw_map(screen, game_map, phosphor_alpha, draw_dynamic_walls=True):
+    """static walls, then every active dynamic group (merged blocks, one rect call each)"""
+    col = Colour.phosphor_colour(Colour.BRIGHT_GREEN, phosphor_alpha)
+
+    for wall in game_map.static_walls:
+        pygame.draw.rect(screen, col, wall)
+
+    if draw_dynamic_walls:
+        for tok, active in game_map.dynamic_active.items():
+            if not active:
+                continue
+            for wall in game_map.dynamic_rects[tok]:
+                pygame.draw.rect(screen, col, wall)
@@ -0,0 +1,60 @@
+import pygame
+
+from config.settings import FXConfig
+from config.palette import Colour
+
+# fade-in sprites, shared by every Player: (size, quantised alpha, look) -> Surface
+ALPHA_STEP = 8
+HALO_PX = 6
+_sprites = {}
+
+
+def _bake(size, alpha, node_look):
+    w, h = size
+    if not node_look:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill((*Colour.PLAYER_CORE, alpha))
+        return surf
+
+    # core plus soft halo, outer ring first
+    pad = HALO_PX
+    surf = pygame.Surface((w + 2 * pad, h + 2 * pad), pygame.SRCALPHA)
+    for d in range(pad, 0, -1):
+        t = 1.0 - d / (pad + 1)
+        a = int(alpha * 0.45 * t * t)
+        rect = pygame.Rect(pad - d, pad - d, w + 2 * d, h + 2 * d)
+        pygame.draw.rect(surf, (*Colour.BRIGHT_GREEN, a), rect, border_radius=d)
+    surf.fill((*Colour.PLAYER_CORE, alpha), pygame.Rect(pad, pad, w, h))
+    return surf
+
+
+def _sprite(size, alpha, node_look):
+    q = 255 if alpha >= 255 else int(alpha) // ALPHA_STEP * ALPHA_STEP
+    key = (size, q, node_look)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = _bake(size, q, node_look)
+        _sprites[key] = sprite
+    return sprite
+
+
+def draw_player(screen, player):
+    node_look = FXConfig.PLAYER_NODE_LOOK
+    rect = player.rect
+
+    # fully faded in: plain opaque fill, no surface at all
+    if player.alpha >= 255 and not node_look:
+        screen.fill(Colour.PLAYER_CORE, rect)
+        return
+
+    sprite = _sprite(rect.size, player.alpha, node_look)
+    pad = HALO_PX if node_look else 0
+    screen.blit(sprite, (rect.x - pad, rect.y - pad))
+
+
+def read_move_input():
+    """WASD as a Player.move direction: (x, y) steps of -1 / 0 / 1 (d beats a, s beats w)"""
+    keys = pygame.key.get_pressed()
+    step_x = 1 if keys[pygame.K_d] else -1 if keys[pygame.K_a] else 0
+    step_y = 1 if keys[pygame.K_s] else -1 if keys[pygame.K_w] else 0
+    return step_x, step_y
@@ -0,0 +1,31 @@
+import pygame
+
+from config.palette import Colour
+
+# one screen-sized overlay, cleared per sensor instead of allocated per sensor per frame
+_overlay = None
+
+
+def _clear_overlay(size):
+    global _overlay
+    if _overlay is None or _overlay.get_size() != size:
+        _overlay = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        _overlay.fill((0, 0, 0, 0))
+    return _overlay
+
+
+def draw_sensor(screen, sensor, game_map, draw_cone=True):
+    ox, oy = game_map.cell_center(sensor.cell)
+    overlay = _clear_overlay(screen.get_size())
+
+    # emitter always visible
+    pygame.draw.circle(overlay, Colour.SENSOR, (ox, oy), 6)
+
+    # cone only if enabled (and we have endpoints)
+    if draw_cone and sensor.enabled and sensor.cone_polygon:
+        points = [(ox, oy)] + sensor.cone_polygon
+        a = int(sensor.alpha * 0.25)
+        pygame.draw.polygon(overlay, (*Colour.SENSOR, a), points)
+
+    screen.blit(overlay, (0, 0))
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+import pygame
+
+from config.palette import Colour
+from fx.glow import GlowCache
+from world.collision import Rect
+from world.tasks.task1 import Task1PathOptimisation
+
+# glow tuning: smooth falloff reaching ~9px past the tile, baked once per colour/alpha step
+_glow = GlowCache(core_px=16, radius_px=10, peak=0.35)
+
+_TILE_COLOURS = {
+    Task1PathOptimisation.TILE_ACTIVE: Colour.TASK1_ACTIVE,
+    Task1PathOptimisation.TILE_LOCKED: Colour.TASK1_LOCKED,
+    Task1PathOptimisation.TILE_PROCESSED: Colour.TASK1_PROCESSED,
+}
+
+
+# (size, colour, quantised phosphor alpha) -> opaque tile, made translucent per blit with
+# set_alpha(fill alpha); a small LRU like the glow's, so the pulse and fades reuse tiles
+MAX_FILLS = 32
+ALPHA_STEP = 8
+_fills = OrderedDict()
+
+
+def _fill(size, rgb, phosphor_alpha):
+    step = ALPHA_STEP
+    key = (size, rgb, min(255, int(phosphor_alpha) // step * step + step // 2))
+    surf = _fills.get(key)
+    if surf is not None:
+        _fills.move_to_end(key)
+        return surf
+
+    surf = pygame.Surface(size)
+    surf.fill(Colour.phosphor_colour(rgb, key[2]))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    _fills[key] = surf
+    if len(_fills) > MAX_FILLS:
+        _fills.popitem(last=False)
+    return surf
+
+
+def _cell_rect(game_map, cell):
+    rect = Rect(0, 0, game_map.cell, game_map.cell)
+    rect.center = game_map.cell_center(cell)
+    return rect
+
+
+def draw_tiles(screen, task, game_map, phosphor_alpha=255):
+    """a task's tiles() as translucent fills, glowing ones with an additive halo underneath"""
+    tiles = task.tiles()
+    if not tiles:
+        return
+
+    # halos first, then the fills (one tile-sized blit each, nothing full-screen)
+    rects = [_cell_rect(game_map, cell) for cell, _look, _alpha, _glowing in tiles]
+    for (_cell, look, _alpha, glowing), rect in zip(tiles, rects):
+        if glowing:
+            _glow.blit(screen, _TILE_COLOURS[look], rect, phosphor_alpha)
+
+    for (_cell, look, fill_alpha, _glowing), rect in zip(tiles, rects):
+        surf = _fill(rect.size, _TILE_COLOURS[look], phosphor_alpha)
+        surf.set_alpha(fill_alpha)
+        screen.blit(surf, rect.topleft)
+
+
+# task TYPE -> draw function
+TASK_RENDERERS = {
+    Task1PathOptimisation.TYPE: draw_tiles,
+}
+
+
+def draw_tasks(screen, tasks, game_map, phosphor_alpha=255):
+    """every started task of a world.tasks.system.TaskSystem (idle tasks draw nothing)"""
+    for task in tasks.tasks:
+        if task.started:
+            TASK_RENDERERS[task.TYPE](screen, task, game_map, phosphor_alpha)
@@ -1,31 +1,54 @@
 import pygame
 
-from world.map.map import Map
+from core import telemetry as tm
+from world.pool import WorldPool
+from world.cycles import CycleManager
 from world.suspicion import Suspicion
 from world.player import Player
-from world.tasks.task1 import Task1PathOptimisation
+from states.snapshot import save_snapshot, load_snapshot
 from ui.single_line import SingleLineMessage
 from ui.task_message import TaskMessage
-from config.settings import TimingConfig, GamePlayConfig
+from render.debug_layers import DebugLayers
+from render.drones import draw_drones
+from render.map import draw_map
+from render.player import draw_player, read_move_input
+from render.sensors import draw_sensor
+from render.tasks import draw_tasks
+from config.settings import TimingConfig, GamePlayConfig, FXConfig, TelemetryConfig, DebugConfig, AudioConfig
 from config.palette import Colour
-from config.grid import GridConfig
 
 
 class PlayState:
-    """Main gameplay: player, map, sensors, doors, Task1."""
+    """Main gameplay: player, map, sensors, doors, tasks."""
 
-    def __init__(self, font, starting_suspicion=0):
+    def __init__(
+        self, font, starting_suspicion=0, *, timers, world_pool=None, telemetry=None, map_file=None, map_size=None,
+    ):
         self.machine = None
         self.game = None
         self.font = font
+        self.timers = timers  # utils.timers.TimerScheduler, advanced by Game
 
         self.timer = 0.0
 
-        self.map = Map("map_2048.csv")
+        # parsed map, sensors etc. come back pristine from the pool (no disk I/O after first load)
+        self.world_pool = world_pool or WorldPool()
+
+        # cycles (assets/cycles.json); map_file / map_size: one cycle on a different
+        # layout instead (tools.mapbench plays generated stress maps)
+        definitions = None
+        if map_file is not None:
+            definitions = [{"id": "custom", "map": map_file, "size": map_size, "doors": ["$"]}]
+        self.cycles = CycleManager(self.world_pool, definitions)
+        first_map, first_size = self.cycles.map_file(0)
+        world = self.world_pool.acquire(first_map, size=first_size)
+
+        self.map = world.map
         self.walls = self.map.get_walls()
         self.player = None
 
-        # cycle control
+        # cycle control (doors, walls, sensors and tasks come from the cycle's layout)
+        self.cycle = None
         self.cycle_index = 1
 
         # permanent / one-way flags
@@ -36,13 +59,6 @@ class PlayState:
         self.door23_closed = False
         self.room4_trapped = False
 
-        # door group defaults
-        self.map.set_group_active("!", False)
-        self.map.set_group_active("@", False)
-        self.map.set_group_active("%", False)
-        self.map.set_group_active("*", False)
-        # "$" default handled in Map (__init__)
-
         self.trigger_rules = {
             "T": ("corridor_sealed", "!", True),
             "U": ("door12_closed", "@", False),
@@ -54,40 +70,117 @@ class PlayState:
         self.suspicion.value = starting_suspicion
         self.show_suspicion = False
 
-        # sensors
-        self.sensors = self.map.create_sensors() or []
+        # sensors (set per cycle)
+        self.sensors = []
+
+        # discoveries
+        self.discoveries = world.discoveries
+
+        # patrol drones (empty unless something spawns them)
+        self.drones = world.drones
 
         # movement banner
         self.has_moved = False
-        self.msg_banner = SingleLineMessage(self.font, "MOVEMENT ACKNOWLEDGED")
+        self.msg_banner = SingleLineMessage(self.font, "MOVEMENT ACKNOWLEDGED", timers=timers)
         self.msg_shown = False
 
-        # ---- Task 1 ----
-        anchors = self.map.get_task1_anchors()
-        self.task1 = Task1PathOptimisation(anchors)
-        self.task1_started = False
-        self._task1_was_complete = False
+        # ---- telemetry (edge detection only; records are queued, never written here) ----
+        self.telemetry = telemetry or tm.Telemetry(enabled=False)
+        self._tm_cell = None
+        self._tm_detecting = 0  # bit i = sensor i saw the player last tick
+        self._tm_sample_timer = 0.0
 
-        self.task1_banner = TaskMessage(self.font)
-        self.task1_banner_started = False
+        # ---- tasks (assets/tasks.json, the cycle's subset) ----
+        self.tasks = None
+        self.task_banner = TaskMessage(self.font, timers=timers, on_reveal=self._click)
 
-    # -----------------------------
-    # Cycle scaffolding (not called yet)
-    # -----------------------------
-    def _reset_cycle_doors(self):
-        self.door12_closed = False
-        self.door23_closed = False
-        self.room4_trapped = False
+        # detection edge for the alert sting
+        self._was_detected = False
 
-        self.map.set_group_active("@", False)
-        self.map.set_group_active("%", False)
-        self.map.set_group_active("*", False)
+        # debug overlays (DebugConfig.LAYER_KEYS), baked on first show
+        self.debug = DebugLayers(self.map)
 
-        self.walls = self.map.get_walls()
+        self._enter_cycle(self.cycles.start(0))
+
+    # -----------------------------
+    # Cycles (world/cycles.py)
+    # -----------------------------
+    def _enter_cycle(self, layout):
+        """swap a built cycle in: nothing here scales with the map, it is all prebuilt"""
+        world = layout.world
+        if world.map is not self.map:
+            # another map: its own discoveries / drones, one-way flags start over, player respawns
+            self.map = world.map
+            self.discoveries = world.discoveries
+            self.drones = world.drones
+            self.corridor_sealed = False
+            if self.player is not None:
+                self.player = Player(*self.map.get_spawn_point())
+        self.telemetry.set_grid_size((self.map.cols, self.map.rows))
+
+        # cycle-only doors reopen; one-way doors already closed stay closed
+        mask = layout.door_mask
+        for flag_name, wall_token, is_permanent in self.trigger_rules.values():
+            if not is_permanent:
+                setattr(self, flag_name, False)
+            elif getattr(self, flag_name):
+                mask |= self.map.group_mask((wall_token,))
+        self.map.set_state((mask,))
+        self.walls = layout.walls if mask == layout.door_mask else self.map.walls_for(mask)
+
+        self.sensors = layout.sensors
+        previous_tasks = self.tasks
+        self.tasks = layout.tasks
+        self.tasks.bind(self.timers, self.telemetry)
+        if previous_tasks is not None and previous_tasks is not layout.tasks:
+            if layout.carry_tasks:
+                self.tasks.carry_from(previous_tasks)
+            previous_tasks.cancel()  # the old cycle's tasks must not fire later
+        self._tm_detecting = 0
+
+        visible = self.debug.visible
+        self.debug = DebugLayers(self.map, self.sensors, self.tasks)
+        self.debug.visible = visible
+
+        self.cycle = layout
+        self.cycle_index = layout.index + 1
 
     def advance_cycle(self):
-        self.cycle_index += 1
-        self._reset_cycle_doors()
+        """next cycle (built in the background meanwhile); False after the last one"""
+        layout = self.cycles.advance()
+        if layout is None:
+            return False
+        self._enter_cycle(layout)
+        return True
+
+    def goto_cycle(self, cycle_index, layout=None):
+        """jump to cycle_index (1-based), building it now unless layout is already built (snapshot loads)"""
+        self._enter_cycle(self.cycles.start(cycle_index - 1, layout))
+
+    def exit(self):
+        """leaving the state: cancel everything it has on the shared scheduler"""
+        self.msg_banner.cancel()
+        self.task_banner.cancel()
+        self.tasks.cancel()
+
+    # -----------------------------
+    # Snapshots (F5 save / F9 load), debug layer keys
+    # -----------------------------
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        key_name = pygame.key.name(event.key)
+        if key_name in DebugConfig.LAYER_KEYS:
+            self.debug.toggle(DebugConfig.LAYER_KEYS[key_name])
+        elif key_name == DebugConfig.CLEAR_KEY:
+            self.debug.clear()
+        elif event.key == pygame.K_F5:
+            save_snapshot(self)
+        elif event.key == pygame.K_F9:
+            try:
+                load_snapshot(self)
+            except (OSError, ValueError):
+                pass
 
     # -----------------------------
     # Trigger processing (doors)
@@ -100,17 +193,56 @@ class PlayState:
         if cell is None:
             return
 
-        changed = False
-        for trigger_token, (flag_name, wall_token, _is_permanent) in self.trigger_rules.items():
-            if getattr(self, flag_name):
-                continue
-            if self.map.is_trigger(cell, trigger_token):
-                setattr(self, flag_name, True)
-                self.map.set_group_active(wall_token, True)
-                changed = True
+        # one grid lookup instead of testing every rule
+        rule = self.trigger_rules.get(self.map.token_at(cell))
+        if rule is None:
+            return
+
+        flag_name, wall_token, _is_permanent = rule
+        if getattr(self, flag_name):
+            return
 
-        if changed:
-            self.walls = self.map.get_walls()
+        setattr(self, flag_name, True)
+        self.map.set_group_active(wall_token, True)
+        self.walls = self.map.get_walls()
+
+        self.telemetry.emit(tm.TRIGGER, ord(self.map.token_at(cell)), *cell)
+
+    # -----------------------------
+    # Tasks
+    # -----------------------------
+    def _announce_task(self, index):
+        banner = self.tasks.definitions[index].get("banner")
+        if banner:
+            block1, block2 = banner
+            self.task_banner.cancel()
+            self.task_banner = TaskMessage(
+                self.font, timers=self.timers, block1=block1, block2=block2, on_reveal=self._click,
+            )
+        self.task_banner.trigger()
+        if self.game:
+            self.game.audio.play("chime")
+
+    # -----------------------------
+    # Audio (fx/audio.py, owned by Game)
+    # -----------------------------
+    def _click(self):
+        if self.game:
+            self.game.audio.play("click", AudioConfig.CLICK_VOLUME)
+
+    def _update_audio(self, detected, loudest_sensor):
+        audio = self.game.audio
+        audio.sensor_tone(loudest_sensor / GamePlayConfig.MAX_INFRARED_ALPHA)
+        audio.alarm(self.suspicion.value)
+        if detected and not self._was_detected:
+            audio.play("alert")
+
+    # -----------------------------
+    # Telemetry
+    # -----------------------------
+    def _emit_at_player(self, kind, code, value=0.0):
+        c, r = self._tm_cell if self._tm_cell is not None else (-1, -1)
+        self.telemetry.emit(kind, code, c, r, value)
 
     # -----------------------------
     # Update / Render
@@ -129,7 +261,7 @@ class PlayState:
             self.player.fade(dt)
 
             if self.player.alpha >= 255:
-                moved_this_frame = self.player.move(dt, self.walls)
+                moved_this_frame = self.player.move(dt, self.walls, read_move_input())
                 self.show_suspicion = True
 
             if moved_this_frame:
@@ -138,54 +270,81 @@ class PlayState:
         # door triggers
         self._process_triggers()
 
+        player_cell = None
+        if self.player:
+            player_cell = self.map.world_to_cell(self.player.rect.centerx, self.player.rect.centery)
+            if player_cell != self._tm_cell and player_cell is not None:
+                self._tm_cell = player_cell
+                self.telemetry.emit(tm.CELL, 0, *player_cell)
+
         # sensors
         detected = False
+        loudest_sensor = 0.0
         if self.player and self.sensors:
-            for sensor in self.sensors:
+            detecting = 0
+            for i, sensor in enumerate(self.sensors):
+                was_enabled = sensor.enabled
                 if sensor.update(dt, self.map, self.player, self.suspicion):
                     detected = True
+                    detecting |= 1 << i
+                if sensor.enabled:
+                    loudest_sensor = max(loudest_sensor, sensor.alpha)
+                    if not was_enabled:
+                        self._emit_at_player(tm.SENSOR_WAKE, i)
+
+            changed = detecting ^ self._tm_detecting
+            if changed:
+                for i in range(len(self.sensors)):
+                    if (changed >> i) & 1:
+                        kind = tm.SENSOR_DETECT if (detecting >> i) & 1 else tm.SENSOR_LOST
+                        self._emit_at_player(kind, i, self.suspicion.value)
+                self._tm_detecting = detecting
+
+        # drones: one vectorised step for all of them, contact raises suspicion
+        if self.drones.count:
+            hits = self.drones.update(dt, self.player.rect if self.player else None)
+            if len(hits):
+                detected = True
+                self.suspicion.increase(GamePlayConfig.DRONE_SUSPICION_RATE * dt)
 
         if self.player and (not detected):
             self.suspicion.decrease(GamePlayConfig.SUSPICION_DECAY_RATE * dt)
 
+        if self.game:
+            self._update_audio(detected, loudest_sensor)
+        self._was_detected = detected
+
         if detected and self.has_moved and not self.msg_shown:
             self.msg_shown = True
             self.msg_banner.trigger(TimingConfig.MSG_DELAY, TimingConfig.MSG_DURATION)
 
-        # ---- Task 1 ----
-        if self.player:
-            player_cell = self.map.world_to_cell(self.player.rect.centerx, self.player.rect.centery)
-
-            if (not self.task1_started) and self.map.is_task1_trigger(player_cell):
-                self.task1_started = True
-                self.task1.start(player_cell)
-
-            # only update task1 once started (safe even if task1.update already guards)
-            if self.task1_started:
-                self.task1.update(dt, player_cell)
+        # discoveries
+        self.discoveries.update(dt, self.player)
 
-                # Edge trigger: fire exactly when Task1 first becomes complete
-                task1_now_complete = self.task1.is_complete
-                if (not self.task1_banner_started) and task1_now_complete and (not self._task1_was_complete):
-                    self.task1_banner_started = True
-                    self.task1_banner.trigger()
-
-                self._task1_was_complete = task1_now_complete
+        # ---- tasks ----
+        if self.player:
+            # fires exactly once per task, the tick it first becomes complete
+            for index in self.tasks.update(dt, player_cell):
+                self._announce_task(index)
 
-        self.msg_banner.update(dt)
-        self.task1_banner.update(dt)
+        # periodic suspicion sample
+        if self.player:
+            self._tm_sample_timer += dt
+            if self._tm_sample_timer >= TelemetryConfig.SUSPICION_SAMPLE:
+                self._tm_sample_timer = 0.0
+                self._emit_at_player(tm.SUSPICION, 0, self.suspicion.value)
 
     def draw_grid(self, screen):
-        spacing = GridConfig.CELL
+        spacing = self.map.cell
         ox, oy = self.map.offset_x, self.map.offset_y
-        grid_w = GridConfig.COLS * spacing
-        grid_h = GridConfig.ROWS * spacing
+        grid_w = self.map.cols * spacing
+        grid_h = self.map.rows * spacing
 
-        for i in range(GridConfig.COLS + 1):
+        for i in range(self.map.cols + 1):
             x = ox + i * spacing
             pygame.draw.line(screen, Colour.DIM_GREEN, (x, oy), (x, oy + grid_h))
 
-        for j in range(GridConfig.ROWS + 1):
+        for j in range(self.map.rows + 1):
             y = oy + j * spacing
             pygame.draw.line(screen, Colour.DIM_GREEN, (ox, y), (ox + grid_w, y))
 
@@ -204,23 +363,32 @@ class PlayState:
         self.draw_grid(screen)
 
         alpha = int(self.game.phosphor.alpha) if self.game else 255
-        self.map.render(screen, alpha)
+        draw_map(screen, self.map, alpha)
 
         # sensors
         if self.sensors:
             for sensor in self.sensors:
-                sensor.render(screen, self.map, draw_cone=False)
+                draw_sensor(screen, sensor, self.map, draw_cone=False)
             for sensor in self.sensors:
-                sensor.render(screen, self.map, draw_cone=True)
+                draw_sensor(screen, sensor, self.map, draw_cone=True)
 
-        # Task 1 tiles (Task1 should no-op render if idle)
-        self.task1.render(screen, self.map, phosphor_alpha=alpha)
+        draw_drones(screen, self.drones, alpha)
+
+        # task tiles (idle tasks draw nothing)
+        draw_tasks(screen, self.tasks, self.map, phosphor_alpha=alpha)
+
+        self.debug.render(screen)
 
         if self.player:
-            self.player.render(screen)
+            draw_player(screen, self.player)
+
+        # static rises with suspicion
+        if self.game:
+            intensity = FXConfig.NOISE_BASE_INTENSITY + self.suspicion.value / 100.0
+            self.game.noise.render(screen, intensity)
 
         if self.show_suspicion:
             self.draw_suspicion_meter(screen)
 
         self.msg_banner.render(screen, Colour.BRIGHT_GREEN)
-        self.task1_banner.render(screen, Colour.BRIGHT_GREEN)
\ No newline at end of file
+        self.task_banner.render(screen, Colour.BRIGHT_GREEN)
\ No newline at end of file
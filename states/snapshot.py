@@ -0,0 +1,181 @@
+import os
+import struct
+
+from utils.paths import save_path
+
+# Compact binary snapshot of a PlayState in progress.
+#
+# Layout (little-endian):
+#   header   magic "N2S", u8 version
+#   play     f32 timer, u16 cycle_index, u16 flag bits
+#   world    f32 suspicion, u8 dynamic group bits
+#   player   i32 x, i32 y, f32 alpha            (only if FLAG_PLAYER)
+#   sensors  u8 count, then per sensor: u8 enabled, u8 fading_in, f32 alpha
+#   tasks    u8 count, u32 announced bits, then per task its type's struct:
+#     path   u32 seed, u8 state, u8 index, u16 completed bits, i8 linger,
+#            i16 last_c, i16 last_r, f32 pending, f32 fade, f32 next_spawn
+
+MAGIC = b"N2S"
+VERSION = 2
+
+HEADER = struct.Struct("<3sB")
+PLAY = struct.Struct("<fHH")
+WORLD = struct.Struct("<fB")
+PLAYER = struct.Struct("<iif")
+SENSOR_COUNT = struct.Struct("<B")
+SENSOR = struct.Struct("<??f")
+TASKS = struct.Struct("<BI")
+
+# per-task state, by task TYPE
+TASK_STATES = {
+    "path": struct.Struct("<IBBHbhhfff"),
+}
+
+# PlayState boolean attributes, in bit order (never reorder within a VERSION; append only)
+FLAG_ATTRS = (
+    "corridor_sealed",
+    "door12_closed",
+    "door23_closed",
+    "room4_trapped",
+    "show_suspicion",
+    "has_moved",
+    "msg_shown",
+)
+FLAG_PLAYER = 1 << 15
+
+
+def pack_play_state(play):
+    flags = 0
+    for i, attr in enumerate(FLAG_ATTRS):
+        if getattr(play, attr):
+            flags |= 1 << i
+    if play.player is not None:
+        flags |= FLAG_PLAYER
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION),
+        PLAY.pack(play.timer, play.cycle_index, flags),
+        WORLD.pack(*play.suspicion.get_state(), *play.map.get_state()),
+    ]
+
+    if play.player is not None:
+        parts.append(PLAYER.pack(*play.player.get_state()))
+
+    parts.append(SENSOR_COUNT.pack(len(play.sensors)))
+    for sensor in play.sensors:
+        parts.append(SENSOR.pack(*sensor.get_state()))
+
+    announced, task_states = play.tasks.get_state()
+    parts.append(TASKS.pack(len(task_states), announced))
+    for task, state in zip(play.tasks.tasks, task_states):
+        parts.append(TASK_STATES[task.TYPE].pack(*state))
+
+    return b"".join(parts)
+
+
+def _unpack_sections(data, offset, flags, layout):
+    """world, player, sensor and task sections, checked against the cycle they belong to"""
+    world = WORLD.unpack_from(data, offset)
+    offset += WORLD.size
+
+    player = None
+    if flags & FLAG_PLAYER:
+        player = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+
+    (count,) = SENSOR_COUNT.unpack_from(data, offset)
+    offset += SENSOR_COUNT.size
+    if count != len(layout.sensors):
+        raise ValueError(f"Snapshot has {count} sensors, map has {len(layout.sensors)}")
+    sensors = []
+    for _ in range(count):
+        sensors.append(SENSOR.unpack_from(data, offset))
+        offset += SENSOR.size
+
+    count, announced = TASKS.unpack_from(data, offset)
+    offset += TASKS.size
+    if count != len(layout.tasks.tasks):
+        raise ValueError(f"Snapshot has {count} tasks, map has {len(layout.tasks.tasks)}")
+    task_states = []
+    for task in layout.tasks.tasks:
+        state_struct = TASK_STATES[task.TYPE]
+        state = state_struct.unpack_from(data, offset)
+        task.check_state(state)
+        task_states.append(state)
+        offset += state_struct.size
+
+    if offset != len(data):
+        raise ValueError(f"Snapshot is {len(data)} bytes, expected {offset}")
+    return world, player, sensors, (announced, task_states)
+
+
+def unpack_play_state(play, data):
+    """
+    restore a PlayState in place from pack_play_state() bytes
+
+    All of it is parsed and checked first (a truncated or corrupt file raises
+    ValueError with play untouched); only then is the cycle entered and play written.
+    """
+    from world.player import Player
+
+    try:
+        magic, version = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a NODE 2084 snapshot")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} (expected {VERSION})")
+
+        timer, cycle_index, flags = PLAY.unpack_from(data, HEADER.size)
+        if not 1 <= cycle_index <= len(play.cycles):
+            raise ValueError(f"Snapshot is in cycle {cycle_index}, game has {len(play.cycles)}")
+        # built, not entered yet: sensors / tasks below belong to that cycle
+        layout = play.cycle if cycle_index == play.cycle_index else play.cycles.build(cycle_index - 1)
+        (suspicion, groups), player, sensors, tasks = _unpack_sections(
+            data, HEADER.size + PLAY.size, flags, layout,
+        )
+    except struct.error as exc:
+        raise ValueError(f"Truncated snapshot ({len(data)} bytes): {exc}") from exc
+
+    if layout is not play.cycle:
+        play.goto_cycle(cycle_index, layout)
+    play.timer = timer
+    for i, attr in enumerate(FLAG_ATTRS):
+        setattr(play, attr, bool(flags & (1 << i)))
+
+    play.suspicion.set_state((suspicion,))
+    play.map.set_state((groups,))
+    play.walls = play.map.get_walls()
+
+    if player is not None:
+        if play.player is None:
+            play.player = Player(player[0], player[1])
+        play.player.set_state(player)
+    else:
+        play.player = None
+
+    for sensor, state in zip(play.sensors, sensors):
+        sensor.set_state(state)
+    play.tasks.set_state(tasks)
+
+
+def write_snapshot(data, name="quick"):
+    """write already-packed snapshot bytes (safe to call off the game thread)"""
+    path = save_path(f"{name}.n2s")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # whole file or nothing: a crash mid-write must not truncate the only quicksave
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path
+
+
+def save_snapshot(play, name="quick"):
+    return write_snapshot(pack_play_state(play), name)
+
+
+def load_snapshot(play, name="quick"):
+    path = save_path(f"{name}.n2s")
+    with open(path, "rb") as f:
+        unpack_play_state(play, f.read())
+    return path
@@ -1,34 +1,60 @@
 import pygame
-from config.settings import TimingConfig
+from config.settings import TimingConfig, AudioConfig
 from config.palette import Colour
+from ui.timeline import Call, Clear, Lines, Prompt, Timeline, Wait
 
 
 class TerminalState:
     """overlay terminal prompts: Y/N confirmation screens"""
 
-    def __init__(self, font):
+    PROMPTS = (
+        ("CONFIRM:", "YOUR PERCEPTION IS COMPLETE.", "[Y/N]"),
+        ("CONFIRM:", "THE SYSTEM PROVIDES.", "[Y/N]"),
+    )
+    ATTACH_LINES = ("RESPONSE RECORDED", "SENSORY FIELD ATTACHED")
+
+    def __init__(self, font, *, timers, colour=(0, 255, 70)):
         self.machine = None
         self.game = None
         self.font = font
+        self.timers = timers
+        self.colour = colour
 
         self.active = False
         self.done = False
 
-        self.lines = []
-        self.visible = 0
-
-        self.timer = 0.0
-        self.waiting_input = False
         self.prompt_index = 0
 
         self.answers = ["Y", "Y"]
         self.suspicion_delta = 0
 
-        self.post_attach_timer = None
-        self.finishing = False
+        gap = TimingConfig.TERMINAL_LINE_DELAY
+        self.timeline = Timeline(
+            font,
+            [
+                Lines(self.PROMPTS[0], gap),
+                Prompt(),
+                Clear(TimingConfig.TERMINAL_BLOCK_PAUSE),
+                Lines(self.PROMPTS[1], gap),
+                Prompt(),
+                Lines(self.ATTACH_LINES, gap),
+                Wait(TimingConfig.POST_ATTACH_PAUSE),
+                Call(self._attach),
+            ],
+            timers=timers,
+            x=40,
+            y=60,
+            line_h=28,
+            cursor_char=None,
+            on_reveal=self._click,
+        )
 
         self.start_truth_sequence()
 
+    @property
+    def waiting_input(self):
+        return self.timeline.waiting
+
     def start_truth_sequence(self):
         self.active = True
         self.done = False
@@ -37,20 +63,7 @@ class TerminalState:
         self.answers = ["", ""]
         self.suspicion_delta = 0
 
-        self.finishing = False
-        self.post_attach_timer = None
-
-        self._load_prompt(0)
-
-    def _load_prompt(self, idx):
-        if idx == 0:
-            self.lines = ["CONFIRM:", "YOUR PERCEPTION IS COMPLETE.", "[Y/N]"]
-        else:
-            self.lines = ["CONFIRM:", "THE SYSTEM PROVIDES.", "[Y/N]"]
-
-        self.visible = 0
-        self.timer = TimingConfig.TERMINAL_LINE_DELAY
-        self.waiting_input = False
+        self.timeline.start()
 
     def handle_event(self, event):
         if not self.active or not self.waiting_input:
@@ -64,76 +77,56 @@ class TerminalState:
         elif event.key == pygame.K_n:
             self._record_answer("N")
 
+    def _click(self):
+        if self.game:
+            self.game.audio.play("click", AudioConfig.CLICK_VOLUME)
+
     def _record_answer(self, yn):
         self.answers[self.prompt_index] = yn
 
         if self.prompt_index == 1 and yn == "N":
             self.suspicion_delta += 10
 
-        if self.prompt_index == 0:
-            self.prompt_index = 1
-            self.timer = TimingConfig.TERMINAL_BLOCK_PAUSE
-            self.lines = []
-            self.visible = 0
-            self.waiting_input = False
-        else:
-            self.lines = ["RESPONSE RECORDED", "SENSORY FIELD ATTACHED"]
-            self.visible = 0
-            self.timer = TimingConfig.TERMINAL_LINE_DELAY
-            self.waiting_input = False
-            self.finishing = True
-            self.post_attach_timer = None
-
-    def update(self, dt):
-        if not self.active or self.done:
-            return
-
-        if self.lines == [] and self.prompt_index == 1:
-            self.timer -= dt
+        self.prompt_index = min(self.prompt_index + 1, len(self.PROMPTS) - 1)
+        self.timeline.resume()
 
-            if self.timer <= 0:
-                self._load_prompt(1)
-            return
-
-        if self.visible < len(self.lines):
-            self.timer -= dt
-
-            if self.timer <= 0:
-                self.visible = min(self.visible + 1, len(self.lines))
-                self.timer = TimingConfig.TERMINAL_LINE_DELAY
-
-                if self.visible == len(self.lines) and self.lines[-1] == "[Y/N]":
-                    self.waiting_input = True
-            return
-
-        if self.finishing and self.visible >= len(self.lines):
-
-            if self.post_attach_timer is None:
-                self.post_attach_timer = TimingConfig.POST_ATTACH_PAUSE
-
-            self.post_attach_timer -= dt
-
-            if self.post_attach_timer <= 0:
-                self.done = True
-                self.active = False
+    def _attach(self):
+        self.timeline.cancel()
+        self.done = True
+        self.active = False
 
-                if self.machine:
-                    from states.play import PlayState
+        if self.machine:
+            from states.play import PlayState
+
+            pool = self.game.world_pool if self.game else None
+            telemetry = self.game.telemetry if self.game else None
+            self.machine.change_state(
+                PlayState(
+                    self.font,
+                    starting_suspicion=self.suspicion_delta,
+                    timers=self.timers,
+                    world_pool=pool,
+                    telemetry=telemetry,
+                )
+            )
+
+    def exit(self):
+        """leaving the state: nothing of ours stays on the shared scheduler"""
+        self.timeline.cancel()
+
+    def next_change_in(self):
+        """lines and prompts arrive on scheduler timers; otherwise we wait on Y/N"""
+        return None
 
-                    self.machine.change_state(
-                        PlayState(self.font, starting_suspicion=self.suspicion_delta)
-                    )
+    def update(self, dt):
+        # line reveal / prompt timing runs on scheduler timers
+        pass
 
-    def render(self, screen, x=40, y=60, line_h=28, colour=(0, 255, 70)):
+    def render(self, screen):
         if not self.active:
             return
 
         screen.fill(Colour.BACKGROUND)
 
         alpha = int(self.game.phosphor.alpha) if self.game else 255
-        col = Colour.phosphor_colour(colour, alpha)
-
-        for i in range(self.visible):
-            line = self.lines[i]
-            surf = self.font.render(line, True, col)
-            screen.blit(surf, (x, y + i * line_h))
+        self.timeline.render(screen, self.colour, alpha)
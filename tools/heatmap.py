@@ -0,0 +1,362 @@
+"""
+Offline playtest report from telemetry files (core/telemetry.py).
+
+    python -m tools.heatmap [files or dirs ...] [--out reports] [--workers N]
+
+With no inputs, reads telemetry/. Writes:
+    walk.png       time spent per cell, over the map layout
+    detect.png     sensor detections (rising edges) per cell
+    anchors.csv    per-task, per-anchor timings (seconds from reveal to activation)
+and prints a short summary.
+
+Heat is kept per grid size: with sessions on several map sizes each size gets
+its own walk-<cols>x<rows>.png / detect-<cols>x<rows>.png.
+
+Files are grouped into sessions (a session's rotated parts share one clock),
+each session is decoded in a worker process: files are memory-mapped, batches
+decompressed straight into a NumPy record view, and binned with bincount.
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core import telemetry as tm
+from utils.paths import telemetry_path
+
+# numpy view of core.telemetry.RECORD ("<fBHhhf", packed)
+RECORD_DTYPE = np.dtype([
+    ("t", "<f4"),
+    ("kind", "u1"),
+    ("code", "<u2"),
+    ("a", "<i2"),
+    ("b", "<i2"),
+    ("value", "<f4"),
+])
+assert RECORD_DTYPE.itemsize == tm.RECORD.size
+
+RUNNING = 1       # path task STATES index of "running"
+WAITING_NEXT = 2  # path task STATES index of "waiting_next"
+
+
+# ---- decoding (worker side) ----
+
+def _read_records(path):
+    """
+    (header tuple, structured array) for one file; truncated tail batches are skipped.
+    Raises ValueError for a telemetry file of another format version.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < tm.FILE_HEADER.size:
+            return None, np.empty(0, RECORD_DTYPE)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header = tm.FILE_HEADER.unpack_from(data, 0)
+            if header[0] != tm.MAGIC:
+                return None, np.empty(0, RECORD_DTYPE)
+            if header[1] != tm.VERSION or header[2] != tm.RECORD.size:
+                raise ValueError(f"{path}: unsupported telemetry version {header[1]} (reader is {tm.VERSION})")
+
+            chunks = []
+            offset = tm.FILE_HEADER.size
+            size = len(data)
+            while offset + tm.BATCH_HEADER.size <= size:
+                length, count = tm.BATCH_HEADER.unpack_from(data, offset)
+                offset += tm.BATCH_HEADER.size
+                if offset + length > size:
+                    break
+                raw = zlib.decompress(data[offset:offset + length])
+                offset += length
+                chunks.append(np.frombuffer(raw, RECORD_DTYPE, count))
+
+    records = np.concatenate(chunks) if chunks else np.empty(0, RECORD_DTYPE)
+    return header, records
+
+
+def _anchor_times(task_records):
+    """
+    Path-task step timings from the (state, path index) transitions, per task.
+    A step starts when RUNNING first reaches its index and ends at the next
+    record that moves past it (WAITING_NEXT on the same index, or a later index).
+    Returns [((task index, anchor token code), seconds), ...].
+    """
+    times = []
+    task_ids = task_records["value"].astype(np.int64)
+    for task in np.unique(task_ids):
+        records = task_records[task_ids == task]
+        start_t = None
+        start_index = -1
+        anchor = 0
+        for t, state, index, token in zip(records["t"], records["code"], records["a"], records["b"]):
+            if start_t is not None and (index > start_index or (state == WAITING_NEXT and index == start_index)):
+                times.append(((int(task), anchor), float(t - start_t)))
+                start_t = None
+            if state == RUNNING and start_t is None and index != start_index:
+                start_t, start_index, anchor = t, index, int(token)
+    return times
+
+
+def _heat(rec, cols, rows):
+    """{"walk": seconds per cell, "detect": detections per cell} for one grid's records"""
+    heat = {}
+    size = cols * rows
+    kind = rec["kind"]
+
+    # time in cell: each CELL record holds until the next one (last one until the run's final record)
+    cells = rec[kind == tm.CELL]
+    if len(cells):
+        dwell = np.diff(np.append(cells["t"], rec["t"][-1]))
+        ids = cells["b"].astype(np.int64) * cols + cells["a"]
+        ok = (cells["a"] >= 0) & (cells["a"] < cols) & (cells["b"] >= 0) & (cells["b"] < rows)
+        heat["walk"] = np.bincount(ids[ok], weights=dwell[ok], minlength=size)
+
+    det = rec[kind == tm.SENSOR_DETECT]
+    if len(det):
+        ok = (det["a"] >= 0) & (det["a"] < cols) & (det["b"] >= 0) & (det["b"] < rows)
+        ids = det["b"][ok].astype(np.int64) * cols + det["a"][ok]
+        heat["detect"] = np.bincount(ids, minlength=size).astype(np.float64)
+    return heat
+
+
+def _accumulate(into, heat):
+    """add heat's grids into into, key by key (the first of each is copied)"""
+    for key, grid in heat.items():
+        if key in into:
+            into[key] += grid
+        else:
+            into[key] = grid.copy()
+
+
+def process_session(paths):
+    """
+    one session (its rotated parts, in order) -> partial report.
+    A map of another size starts a new part, so consecutive parts sharing a
+    header grid form one run; heat is binned per run into grids[(cols, rows)].
+    """
+    runs = []
+    for path in paths:
+        header, records = _read_records(path)
+        if header is None:
+            continue
+        grid = (header[5], header[6])
+        if runs and runs[-1][0] == grid:
+            runs[-1][1].append(records)
+        else:
+            runs.append((grid, [records]))
+
+    result = {"records": 0, "dropped": 0, "anchors": [], "grids": {}}
+    for (cols, rows), parts in runs:
+        rec = np.concatenate(parts)
+        if not len(rec):
+            continue
+        result["records"] += len(rec)
+        kind = rec["kind"]
+
+        dropped = rec[kind == tm.DROPPED]
+        if len(dropped):
+            result["dropped"] = max(result["dropped"], int(dropped["value"].max()))  # running total
+
+        result["anchors"].extend(_anchor_times(rec[kind == tm.TASK]))
+
+        if cols and rows:
+            _accumulate(result["grids"].setdefault((cols, rows), {}), _heat(rec, cols, rows))
+    return result
+
+
+# ---- aggregation ----
+
+def find_sessions(inputs):
+    """group .n2t files by session name (file name minus the -NNN part suffix)"""
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            files.extend(os.path.join(item, n) for n in os.listdir(item) if n.endswith(".n2t"))
+        elif item.endswith(".n2t"):
+            files.append(item)
+
+    sessions = defaultdict(list)
+    for path in files:
+        base = os.path.basename(path)[:-len(".n2t")]
+        session, _, _part = base.rpartition("-")
+        sessions[(os.path.dirname(path), session)].append(path)
+
+    return [sorted(paths) for _key, paths in sorted(sessions.items())]
+
+
+def build_report(sessions, workers=None):
+    """
+    merged totals; heat stays separate per grid size:
+    report["grids"][(cols, rows)] = {"sessions": n, "walk": ..., "detect": ...}
+    """
+    report = {"sessions": 0, "records": 0, "dropped": 0, "grids": {}, "anchors": defaultdict(list)}
+
+    def merge(part):
+        if part["records"] == 0:
+            return
+        report["sessions"] += 1
+        report["records"] += part["records"]
+        report["dropped"] += part["dropped"]
+        for size, heat in part["grids"].items():
+            merged = report["grids"].setdefault(size, {"sessions": 0})
+            merged["sessions"] += 1
+            _accumulate(merged, heat)
+        for anchor, seconds in part["anchors"]:
+            report["anchors"][anchor].append(seconds)
+
+    if workers == 1 or len(sessions) < 2:
+        for paths in sessions:
+            merge(process_session(paths))
+    else:
+        chunk = max(1, len(sessions) // ((workers or os.cpu_count() or 1) * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(process_session, sessions, chunksize=chunk):
+                merge(part)
+
+    return report
+
+
+def _task_names():
+    """task index -> id from assets/tasks.json (telemetry only stores the index)"""
+    from world.tasks.system import load_task_definitions
+
+    try:
+        return [definition["id"] for definition in load_task_definitions()]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def anchor_stats(anchors):
+    """{(task id, token): (count, mean, median, p90, min, max)} in seconds"""
+    names = _task_names()
+    stats = {}
+    for (task, code), values in sorted(anchors.items()):
+        arr = np.asarray(values)
+        task_id = names[task] if task < len(names) else f"task#{task}"
+        token = chr(code) if code else "?"
+        stats[(task_id, token)] = (
+            len(arr),
+            float(arr.mean()),
+            float(np.median(arr)),
+            float(np.percentile(arr, 90)),
+            float(arr.min()),
+            float(arr.max()),
+        )
+    return stats
+
+
+# ---- rendering ----
+
+def _layout(cols, rows, map_file=None):
+    """Map drawn under a cols x rows heatmap: map_file if it has that size, else the first
+    cycle map (assets/cycles.json) that does; None if nothing fits"""
+    from config.grid import GridConfig
+    from world.cycles import load_cycle_definitions
+    from world.map.map import Map
+
+    candidates = [map_file] if map_file else []
+    for definition in load_cycle_definitions():
+        if tuple(definition.get("size") or (GridConfig.COLS, GridConfig.ROWS)) == (cols, rows):
+            candidates.append(definition["map"])
+
+    for candidate in candidates:
+        try:
+            return Map(candidate, size=(cols, rows))
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def render_heatmap(grid, cols, rows, path, tint, map_file=None):
+    """log-scaled heat over the map layout (the whole grid, however big), saved as PNG"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from config.grid import GridConfig
+    from config.palette import Colour
+    from render.map import draw_map
+
+    pygame.init()
+    game_map = _layout(cols, rows, map_file)
+    if game_map is None:
+        print(f"no map layout is {cols}x{rows} (try --map): {os.path.basename(path)} shows heat only")
+
+    # same placement as in play, grown to cover grids bigger than the screen
+    cell = GridConfig.CELL
+    ox, oy = GridConfig.offset(cols, rows)
+    surf = pygame.Surface((max(GridConfig.SCREEN_W, ox + cols * cell), max(GridConfig.SCREEN_H, oy + rows * cell)))
+    surf.fill(Colour.BACKGROUND)
+
+    # log scale, clipped at the 99th percentile so one camped cell doesn't flatten the rest
+    heat = np.log1p(grid.reshape(rows, cols))
+    hot = heat[heat > 0]
+    if hot.size:
+        heat = np.clip(heat / np.percentile(hot, 99), 0.0, 1.0)
+
+    # one pixel per cell (surfarray is x-major), scaled up to cell size in one go
+    layer = pygame.Surface((cols, rows), pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(layer)[...] = np.asarray(tint, np.uint8)
+    pygame.surfarray.pixels_alpha(layer)[...] = (heat.T * 230).astype(np.uint8)
+    layer = pygame.transform.scale(layer, (cols * cell, rows * cell))
+
+    surf.blit(layer, (ox, oy))
+
+    # dim layout on top so walls stay readable
+    if game_map is not None:
+        draw_map(surf, game_map, 90)
+    pygame.image.save(surf, path)
+    return path
+
+
+def write_anchor_csv(stats, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("task,anchor,count,mean_s,median_s,p90_s,min_s,max_s\n")
+        for (task_id, token), (count, mean, median, p90, lo, hi) in stats.items():
+            f.write(f"{task_id},{token},{count},{mean:.3f},{median:.3f},{p90:.3f},{lo:.3f},{hi:.3f}\n")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NODE 2084 telemetry heatmaps and task timings")
+    parser.add_argument("inputs", nargs="*", help=".n2t files or directories (default: telemetry/)")
+    parser.add_argument("--out", default="reports", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (1 = in-process)")
+    parser.add_argument("--map", default=None, help="map CSV drawn under the heat (default: the cycle map of the same size)")
+    args = parser.parse_args(argv)
+
+    sessions = find_sessions(args.inputs or [str(telemetry_path())])
+    try:
+        report = build_report(sessions, args.workers)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    print(f"sessions: {report['sessions']}  records: {report['records']}  dropped: {report['dropped']}")
+    if report["sessions"] == 0:
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    grids = report["grids"]
+    for (cols, rows), heat in sorted(grids.items()):
+        # one grid size keeps the plain names; several get one image pair per size
+        suffix = "" if len(grids) == 1 else f"-{cols}x{rows}"
+        print(f"grid {cols}x{rows}: {heat['sessions']} sessions")
+        for key, tint in (("walk", (255, 230, 60)), ("detect", (255, 60, 20))):
+            if key in heat:
+                path = os.path.join(args.out, f"{key}{suffix}.png")
+                print("wrote", render_heatmap(heat[key], cols, rows, path, tint, args.map))
+
+    stats = anchor_stats(report["anchors"])
+    if stats:
+        print("wrote", write_anchor_csv(stats, os.path.join(args.out, "anchors.csv")))
+        print("task      anchor  count   mean  median    p90")
+        for (task_id, token), (count, mean, median, p90, _lo, _hi) in stats.items():
+            print(f"  {task_id:<9} {token:<5} {count:>5} {mean:>6.2f} {median:>7.2f} {p90:>6.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
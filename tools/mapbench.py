@@ -0,0 +1,211 @@
+"""
+Scaling benchmark over generated stress maps (tools/mapgen.py).
+
+    python -m tools.mapbench [--scales 1 2 4 8] [--frames 240] [--repeat 3] [--seed 0]
+                             [--room 9] [--emitters 2.0] [--drones 0]
+
+Scale s is a (50 s) x (37 s) map: s^2 times the cells of the play map, with
+walls and emitters growing in proportion. For each size:
+    load        world build (Map parse + wall merge, sensor cone bake, discovery
+                lookup), best of --repeat runs; task lookups are built per cycle
+    memory      tracemalloc peak during one build, and what stays allocated
+    query       mean ns per grid query (is_wall_cell, is_sensor_occluder, token_at)
+                over random in-bounds cells
+    update      PlayState.update with the player walking a random path over open
+                floor (so triggers, sensors, discoveries and tasks all see traffic)
+    render      PlayState.render into the normal 800x600 window; on maps bigger
+                than the screen the off-screen walls and cones are still drawn
+                (clipped), so render time tracks content, not pixels
+and a final line with each column's growth exponent against cell count
+(1.0 = linear in map area).
+
+--drones N spawns N random patrol drones (world/drones.py) per 50x37 of map area
+before the frames are timed.
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from tools.mapgen import generate_map, write_map
+
+BASE_COLS = 50
+BASE_ROWS = 37
+
+
+def _walk(open_cells, rng, steps):
+    """random 4-neighbour walk over open floor, one cell per step"""
+    open_set = set(open_cells)
+    cell = rng.choice(open_cells)
+    path = []
+    for _ in range(steps):
+        c, r = cell
+        options = [n for n in ((c + 1, r), (c - 1, r), (c, r + 1), (c, r - 1)) if n in open_set]
+        if options:
+            cell = rng.choice(options)
+        path.append(cell)
+    return path
+
+
+def query_ns(game_map, rng, count=20000):
+    """mean ns per Map cell query over count random in-bounds cells"""
+    cells = [(rng.randrange(game_map.cols), rng.randrange(game_map.rows)) for _ in range(count)]
+    is_wall_cell, is_sensor_occluder, token_at = game_map.is_wall_cell, game_map.is_sensor_occluder, game_map.token_at
+
+    t0 = time.perf_counter()
+    for cell in cells:
+        is_wall_cell(cell)
+        is_sensor_occluder(cell)
+        token_at(cell)
+    return (time.perf_counter() - t0) * 1e9 / (3 * count)
+
+
+def bench_size(path, size, args, screen, font):
+    from states.play import PlayState
+    from utils.timers import TimerScheduler
+    from world.drones import random_patrols
+    from world.player import Player
+    from world.pool import WorldPool, WorldResources
+
+    result = {"cols": size[0], "rows": size[1]}
+
+    # ---- load (timed without tracemalloc, then once more under it) ----
+    best = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        WorldResources(path, size=size)
+        best = min(best, time.perf_counter() - t0)
+    result["load_ms"] = best * 1000
+
+    tracemalloc.start()
+    world = WorldResources(path, size=size)
+    result["kept_kib"], result["peak_kib"] = (v / 1024 for v in tracemalloc.get_traced_memory())
+    tracemalloc.stop()
+
+    game_map = world.map
+    result["walls"] = len(game_map.static_walls)
+    result["emitters"] = len(world.sensors)
+    result["query_ns"] = query_ns(game_map, random.Random(args.seed))
+
+    # ---- frames ----
+    pool = WorldPool()
+    pool.preload(path, size=size)
+    timers = TimerScheduler()
+    state = PlayState(font, timers=timers, world_pool=pool, map_file=path, map_size=size)
+
+    rng = random.Random(args.seed)
+    drones = args.drones * (size[0] * size[1]) // (BASE_COLS * BASE_ROWS)
+    for route in random_patrols(game_map, drones, rng):
+        state.drones.spawn(route)
+    result["drones"] = state.drones.count
+
+    x, y = game_map.get_spawn_point()
+    state.player = Player(x, y)
+    state.player.alpha = 255
+    state.timer = 1.0  # past the spawn delay
+
+    open_cells = [
+        cell for cell in map(game_map.cell_at, range(len(game_map.grid)))
+        if not game_map.is_wall_cell(cell)
+    ]
+    # a few frames per cell, like walking
+    route = _walk(open_cells, rng, args.frames // 4 + 1)
+
+    dt = 1 / 60
+    update_ms = []
+    render_ms = []
+    for i in range(args.frames):
+        state.player.rect.center = game_map.cell_center(route[i // 4])
+
+        t0 = time.perf_counter()
+        timers.advance(dt)
+        state.update(dt)
+        t1 = time.perf_counter()
+        state.render(screen)
+        t2 = time.perf_counter()
+
+        update_ms.append((t1 - t0) * 1000)
+        render_ms.append((t2 - t1) * 1000)
+
+    result["update_ms"] = statistics.median(update_ms)
+    result["render_ms"] = statistics.median(render_ms)
+    result["frame_p95_ms"] = sorted(u + r for u, r in zip(update_ms, render_ms))[int(len(update_ms) * 0.95)]
+    return result
+
+
+def growth(results, key):
+    """log-log slope of key against cell count, first size to last"""
+    first, last = results[0], results[-1]
+    cells0 = first["cols"] * first["rows"]
+    cells1 = last["cols"] * last["rows"]
+    if cells1 == cells0 or first[key] <= 0 or last[key] <= 0:
+        return float("nan")
+    return math.log(last[key] / first[key]) / math.log(cells1 / cells0)
+
+
+COLUMNS = (
+    ("size", "{cols}x{rows}", 9),
+    ("walls", "{walls}", 6),
+    ("emit", "{emitters}", 5),
+    ("drones", "{drones}", 6),
+    ("load ms", "{load_ms:.1f}", 9),
+    ("peak KiB", "{peak_kib:.0f}", 9),
+    ("kept KiB", "{kept_kib:.0f}", 9),
+    ("query ns", "{query_ns:.0f}", 9),
+    ("upd ms", "{update_ms:.3f}", 8),
+    ("rnd ms", "{render_ms:.3f}", 8),
+    ("p95 ms", "{frame_p95_ms:.3f}", 8),
+)
+GROWTH_KEYS = (None, "walls", "emitters", "drones", "load_ms", "peak_kib", "kept_kib", "query_ns", "update_ms", "render_ms", "frame_p95_ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NODE 2084 map scaling benchmark")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8], help="map scale factors")
+    parser.add_argument("--frames", type=int, default=240, help="frames timed per size")
+    parser.add_argument("--repeat", type=int, default=3, help="load runs per size (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--room", type=int, default=9, help="smallest room span in cells")
+    parser.add_argument("--emitters", type=float, default=2.0, help="sensor emitters per 1000 cells")
+    parser.add_argument("--drones", type=int, default=0, help="patrol drones per 50x37 of map area")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from config.grid import GridConfig
+
+    pygame.init()
+    screen = pygame.display.set_mode((GridConfig.SCREEN_W, GridConfig.SCREEN_H))
+    font = pygame.font.SysFont("consolas", 24)
+
+    print(" ".join(f"{name:>{width}}" for name, _fmt, width in COLUMNS))
+    results = []
+    with tempfile.TemporaryDirectory(prefix="node2084-stress-") as tmp:
+        for scale in args.scales:
+            size = (BASE_COLS * scale, BASE_ROWS * scale)
+            token_rows = generate_map(*size, seed=args.seed, room=args.room, emitters_per_k=args.emitters)
+            path = write_map(token_rows, os.path.join(tmp, f"stress_{size[0]}x{size[1]}.csv"))
+
+            result = bench_size(path, size, args, screen, font)
+            results.append(result)
+            print(" ".join(f"{fmt.format(**result):>{width}}" for _name, fmt, width in COLUMNS), flush=True)
+
+    if len(results) > 1:
+        cells = " ".join(
+            f"{'':>{width}}" if key is None else f"{growth(results, key):>{width}.2f}"
+            for (_name, _fmt, width), key in zip(COLUMNS, GROWTH_KEYS)
+        )
+        print(cells, " <- growth exponent vs cells")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
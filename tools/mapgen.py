@@ -0,0 +1,219 @@
+"""
+Procedural stress maps in the assets/ CSV token format.
+
+    python -m tools.mapgen out.csv [--size 100x74] [--seed 0] [--room 9]
+                                   [--emitters 2.0] [--doors 0.5] [--markers 2]
+
+Layout is recursive division on a 3-cell lattice: walls sit on multiples of 3,
+doorways are the 2 cells between, so every room stays reachable from spawn and
+the player (one cell wide) fits through every opening. Each map gets:
+    #            walls (density from --room: smaller rooms, more walls)
+    ^ v < >      sensor emitters on wall cells, facing open floor (--emitters per 1000 cells)
+    ! @ % * $    dynamic doors in second doorways (--doors = share of walls that get one)
+    T U V W      triggers in front of ! @ % * doors
+    x y z o p    discovery / anomaly markers (--markers cells of each)
+    1, a..m      Task1 trigger and anchors (assets/tasks.json), S spawn
+
+The same seed and options always give the same map.
+"""
+
+import argparse
+import random
+import sys
+
+# trigger token -> the dynamic group it closes (PlayState.trigger_rules)
+DOOR_TRIGGERS = {"!": "T", "@": "U", "%": "V", "*": "W"}
+DOOR_TOKENS = ("!", "@", "%", "*", "$")
+
+DISCOVERY_TOKENS = ("x", "y", "z", "o", "p")
+TASK_TRIGGER = "1"
+TASK_ANCHORS = "abcdefghijklm"
+
+STEP = 3  # lattice: walls on multiples of STEP, doorways are the STEP - 1 cells between
+
+
+def _divide(grid, right, bottom, rng, room, door_ratio, doors):
+    """outer wall ring at (0, 0)-(right, bottom), then recursive division (explicit stack) inside it"""
+    for c in range(right + 1):
+        grid[0][c] = grid[bottom][c] = "#"
+    for r in range(bottom + 1):
+        grid[r][0] = grid[r][right] = "#"
+
+    stack = [(0, 0, right, bottom)]
+    door_index = 0
+
+    while stack:
+        x0, y0, x1, y1 = stack.pop()
+        w, h = x1 - x0, y1 - y0
+
+        can_v = w >= 2 * room
+        can_h = h >= 2 * room
+        if not (can_v or can_h):
+            continue
+        vertical = can_v and (not can_h or w > h or (w == h and rng.random() < 0.5))
+
+        lo, hi = (x0, x1) if vertical else (y0, y1)
+        span0, span1 = (y0, y1) if vertical else (x0, x1)
+        at = rng.randrange((lo + room) // STEP, (hi - room) // STEP + 1) * STEP
+
+        for i in range(span0 + 1, span1):
+            c, r = (at, i) if vertical else (i, at)
+            grid[r][c] = "#"
+
+        # one open doorway per wall, plus an optional dynamic door on long walls
+        slots = list(range(span0 // STEP, span1 // STEP))
+        rng.shuffle(slots)
+        openings = [None]
+        if len(slots) > 2 and rng.random() < door_ratio:
+            openings.append(DOOR_TOKENS[door_index % len(DOOR_TOKENS)])
+            door_index += 1
+
+        for token, slot in zip(openings, slots):
+            cells = []
+            for k in range(1, STEP):
+                c, r = (at, slot * STEP + k) if vertical else (slot * STEP + k, at)
+                grid[r][c] = token or "."
+                cells.append((c, r))
+            if token is not None:
+                doors.append((token, cells, vertical))
+
+        if vertical:
+            stack.append((x0, y0, at, y1))
+            stack.append((at, y0, x1, y1))
+        else:
+            stack.append((x0, y0, x1, at))
+            stack.append((x0, at, x1, y1))
+
+
+def _place_emitters(grid, right, bottom, rng, count):
+    """sensor tokens on wall cells with open floor (inside the ring) on the facing side"""
+    facing = (("^", 0, -1), ("v", 0, 1), ("<", -1, 0), (">", 1, 0))
+    candidates = []
+    for r in range(bottom + 1):
+        row = grid[r]
+        for c in range(right + 1):
+            if row[c] != "#":
+                continue
+            for token, dc, dr in facing:
+                fc, fr = c + dc, r + dr
+                if 0 < fc < right and 0 < fr < bottom and grid[fr][fc] == ".":
+                    candidates.append((c, r, token))
+
+    rng.shuffle(candidates)
+    placed = 0
+    for c, r, token in candidates:
+        if placed >= count:
+            break
+        if grid[r][c] == "#":
+            grid[r][c] = token
+            placed += 1
+    return placed
+
+
+def generate_map(cols, rows, *, seed=0, room=9, emitters_per_k=2.0, door_ratio=0.5, markers=2):
+    """rows of tokens (one string per row) for a cols x rows map"""
+    if cols < 4 * STEP or rows < 4 * STEP:
+        raise ValueError(f"Map must be at least {4 * STEP}x{4 * STEP}, got {cols}x{rows}")
+    room = max(STEP, -(-room // STEP) * STEP)
+
+    rng = random.Random(seed)
+    grid = [["."] * cols for _ in range(rows)]
+
+    # the walled area snaps to the lattice; any leftover columns / rows stay empty margin
+    right = (cols - 1) // STEP * STEP
+    bottom = (rows - 1) // STEP * STEP
+
+    doors = []
+    _divide(grid, right, bottom, rng, room, door_ratio, doors)
+
+    # triggers sit one cell in front of their door (the side with floor)
+    for token, cells, vertical in doors:
+        trigger = DOOR_TRIGGERS.get(token)
+        if trigger is None:
+            continue
+        for c, r in cells:
+            tc, tr = (c - 1, r) if vertical else (c, r - 1)
+            if grid[tr][tc] == ".":
+                grid[tr][tc] = trigger
+
+    _place_emitters(grid, right, bottom, rng, int(cols * rows * emitters_per_k / 1000))
+
+    # open floor inside the ring, not touching doorways or emitters, for everything else
+    floor = [
+        (c, r) for r in range(1, bottom) for c in range(1, right)
+        if grid[r][c] == "." and all(grid[r + dr][c + dc] in ".#" for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)))
+    ]
+    wanted = 1 + 2 + len(TASK_ANCHORS) + len(DISCOVERY_TOKENS) * markers
+    if len(floor) < wanted:
+        raise ValueError(f"Map too small for its markers: {len(floor)} free cells, need {wanted}")
+
+    # spawn and the Task1 trigger near the top-left corner, the rest anywhere
+    floor.sort(key=lambda cell: cell[0] + cell[1])
+    (sc, sr), trigger_cells, rest = floor[0], floor[1:3], floor[3:]
+    grid[sr][sc] = "S"
+    for c, r in trigger_cells:
+        grid[r][c] = TASK_TRIGGER
+
+    rng.shuffle(rest)
+    picks = iter(rest)
+    for token in TASK_ANCHORS:
+        c, r = next(picks)
+        grid[r][c] = token
+    for token in DISCOVERY_TOKENS:
+        for _ in range(markers):
+            c, r = next(picks)
+            grid[r][c] = token
+
+    return ["".join(row) for row in grid]
+
+
+def write_map(token_rows, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in token_rows:
+            f.write(",".join(row))
+            f.write("\n")
+    return path
+
+
+def map_stats(token_rows):
+    """token -> count, for summaries"""
+    counts = {}
+    for row in token_rows:
+        for token in row:
+            counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+def parse_size(text):
+    cols, _, rows = text.lower().partition("x")
+    return int(cols), int(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NODE 2084 procedural stress maps")
+    parser.add_argument("out", help="CSV file to write")
+    parser.add_argument("--size", type=parse_size, default=(100, 74), help="COLSxROWS (default 100x74)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--room", type=int, default=9, help="smallest room span in cells (smaller = more walls)")
+    parser.add_argument("--emitters", type=float, default=2.0, help="sensor emitters per 1000 cells")
+    parser.add_argument("--doors", type=float, default=0.5, help="share of long walls given a dynamic door")
+    parser.add_argument("--markers", type=int, default=2, help="cells per discovery / anomaly token")
+    args = parser.parse_args(argv)
+
+    cols, rows = args.size
+    token_rows = generate_map(
+        cols, rows, seed=args.seed, room=args.room,
+        emitters_per_k=args.emitters, door_ratio=args.doors, markers=args.markers,
+    )
+    write_map(token_rows, args.out)
+
+    counts = map_stats(token_rows)
+    walls = counts.get("#", 0)
+    emitters = sum(counts.get(t, 0) for t in "^v<>")
+    doors = sum(counts.get(t, 0) for t in DOOR_TOKENS)
+    print(f"wrote {args.out}: {cols}x{rows}, {walls} wall cells, {emitters} emitters, {doors} door cells")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
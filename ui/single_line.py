@@ -8,9 +8,17 @@ class SingleLineMessage:
       - optional cursor-only intro (Boot-style)
       - fixed duration
 
-    trigger(delay, duration) API stays the same.
+    trigger(delay, duration) API stays the same; phases advance on scheduler
+    timers, so there is nothing to update per frame.
     """
 
+    __slots__ = (
+        "font", "text", "timers", "x", "y",
+        "cursor_char", "cursor_blink_s", "cursor_intro_s",
+        "active", "phase",
+        "_duration", "_pending", "_blink", "_cursor_visible",
+    )
+
     PH_IDLE = 0
     PH_DELAY = 1
     PH_CURSOR = 2
@@ -21,6 +29,7 @@ class SingleLineMessage:
         font,
         text,
         *,
+        timers,
         x=32,
         y=16,
         cursor_char="_",
@@ -29,6 +38,7 @@ class SingleLineMessage:
     ):
         self.font = font
         self.text = text
+        self.timers = timers
 
         self.x = x
         self.y = y
@@ -40,57 +50,49 @@ class SingleLineMessage:
         self.active = False
         self.phase = self.PH_IDLE
 
-        self._delay = 0.0
-        self._time_left = 0.0
-        self._cursor_left = 0.0
-
-        self._cursor_timer = 0.0
+        self._duration = 0.0
+        self._pending = None  # next phase change
+        self._blink = None    # repeating cursor toggle (cursor intro only)
         self._cursor_visible = True
 
     def trigger(self, delay, duration):
+        self.cancel()
+
         self.active = True
         self.phase = self.PH_DELAY
 
-        self._delay = float(delay)
-        self._time_left = float(duration)
-        self._cursor_left = float(self.cursor_intro_s)
-
-        self._cursor_timer = 0.0
+        self._duration = float(duration)
         self._cursor_visible = True
+        self._pending = self.timers.after(float(delay), self._end_delay)
+
+    def cancel(self):
+        """stop any pending phase / blink timers and hide"""
+        for timer in (self._pending, self._blink):
+            if timer is not None:
+                timer.cancel()
+        self._pending = None
+        self._blink = None
+        self.active = False
+        self.phase = self.PH_IDLE
 
-    def update(self, dt):
-        if not self.active or self.phase == self.PH_IDLE:
-            return
-
-        dt = float(dt)
-
-        if self.phase == self.PH_DELAY:
-            self._delay -= dt
-            if self._delay <= 0:
-                # go cursor intro if enabled, else go straight to line
-                if self._cursor_left > 0:
-                    self.phase = self.PH_CURSOR
-                else:
-                    self.phase = self.PH_LINE
-            return
-
-        if self.phase == self.PH_CURSOR:
-            # blink
-            self._cursor_timer += dt
-            if self._cursor_timer >= self.cursor_blink_s:
-                self._cursor_visible = not self._cursor_visible
-                self._cursor_timer = 0.0
-
-            self._cursor_left -= dt
-            if self._cursor_left <= 0:
-                self.phase = self.PH_LINE
-            return
-
-        if self.phase == self.PH_LINE:
-            self._time_left -= dt
-            if self._time_left <= 0:
-                self.active = False
-                self.phase = self.PH_IDLE
+    def _toggle_cursor(self):
+        self._cursor_visible = not self._cursor_visible
+
+    def _end_delay(self):
+        # go cursor intro if enabled, else go straight to line
+        if self.cursor_intro_s > 0:
+            self.phase = self.PH_CURSOR
+            self._blink = self.timers.every(self.cursor_blink_s, self._toggle_cursor)
+            self._pending = self.timers.after(self.cursor_intro_s, self._show_line)
+        else:
+            self._show_line()
+
+    def _show_line(self):
+        if self._blink is not None:
+            self._blink.cancel()
+            self._blink = None
+        self.phase = self.PH_LINE
+        self._pending = self.timers.after(self._duration, self.cancel)
 
     def render(self, screen, colour):
         if not self.active or self.phase == self.PH_IDLE:
@@ -0,0 +1,273 @@
+import math
+
+
+# ---- script steps ----
+
+class Lines:
+    """start a new block: clears the screen, then reveals one line every gap seconds"""
+
+    __slots__ = ("lines", "gap")
+
+    def __init__(self, lines, gap):
+        self.lines = tuple(lines)
+        self.gap = float(gap)
+
+
+class Wait:
+    """keep what is on screen (cursor keeps blinking) for seconds"""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        self.seconds = float(seconds)
+
+
+class Clear:
+    """draw nothing for seconds, then come back with no lines (cursor only)"""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds=0.0):
+        self.seconds = float(seconds)
+
+
+class Prompt:
+    """stop the clock until the owner calls Timeline.resume() (Y/N and similar)"""
+
+    __slots__ = ()
+
+
+class Call:
+    """callback(*args) at this point of the script"""
+
+    __slots__ = ("callback", "args")
+
+    def __init__(self, callback, *args):
+        self.callback = callback
+        self.args = args
+
+
+# ---- compiled form ----
+
+PROMPT = "prompt"
+END = "end"
+
+
+class Keyframe:
+    """what is on screen from time t (script seconds) until the next keyframe"""
+
+    __slots__ = ("t", "block", "visible", "shown", "revealed", "action")
+
+    def __init__(self, t, block, visible, shown, revealed, action=None):
+        self.t = t
+        self.block = block        # index into Timeline.blocks, -1 = none
+        self.visible = visible    # lines of that block on screen
+        self.shown = shown        # False = clear phase (no lines, no cursor)
+        self.revealed = revealed  # lines revealed so far in the whole script
+        self.action = action      # None, PROMPT, END or a Call
+
+
+def compile_script(script):
+    """script steps -> (blocks, keyframes) with absolute times; prompts don't take time"""
+    blocks = []
+    frames = []
+    t = 0.0
+    block, visible, shown, revealed = -1, 0, True, 0
+
+    def mark(action=None):
+        frames.append(Keyframe(t, block, visible, shown, revealed, action))
+
+    mark()
+    for step in script:
+        if isinstance(step, Lines):
+            blocks.append(step.lines)
+            block, visible, shown = len(blocks) - 1, 0, True
+            mark()
+            for _line in step.lines:
+                t += step.gap
+                visible += 1
+                revealed += 1
+                mark()
+
+        elif isinstance(step, Wait):
+            t += step.seconds
+
+        elif isinstance(step, Clear):
+            block, visible, shown = -1, 0, False
+            mark()
+            t += step.seconds
+            shown = True
+            mark()
+
+        elif isinstance(step, Prompt):
+            mark(PROMPT)
+
+        elif isinstance(step, Call):
+            mark(step)
+
+        else:
+            raise TypeError(f"Unknown timeline step {step!r}")
+
+    mark(END)
+    return blocks, frames
+
+
+class Timeline:
+    """
+    Scripted text sequence (boot screens, terminal prompts, task banners).
+
+    The script is compiled once into a flat keyframe list; one scheduler timer
+    steps through it (plus cursor blink edges), so nothing runs per frame.
+    Each block's line surfaces are rendered once, when the block first shows,
+    and drawn with a surface alpha for the phosphor pulse.
+    """
+
+    __slots__ = (
+        "font", "timers", "blocks", "keyframes", "x", "y", "line_h",
+        "cursor_char", "cursor_blink_s", "on_reveal",
+        "active", "waiting", "_index", "_origin", "_frozen", "_timer", "_surfaces",
+    )
+
+    EPSILON = 1e-6
+
+    def __init__(
+        self, font, script, *, timers, x=40, y=60, line_h=28, cursor_char="_", cursor_blink_s=0.5, on_reveal=None,
+    ):
+        self.font = font
+        self.timers = timers
+        self.blocks, self.keyframes = compile_script(script)
+
+        self.x = x
+        self.y = y
+        self.line_h = line_h
+        self.cursor_char = cursor_char  # None = no cursor
+        self.cursor_blink_s = float(cursor_blink_s)
+        self.on_reveal = on_reveal  # called as each line appears (terminal clicks)
+
+        self.active = False
+        self.waiting = False     # stopped on a Prompt
+        self._index = 0          # current keyframe
+        self._origin = 0.0       # scheduler time of script t = 0
+        self._frozen = None      # script time while waiting
+        self._timer = None
+        self._surfaces = {}      # (block, colour) -> [Surface]
+
+    # ---- control ----
+
+    def start(self):
+        self.cancel()
+        self.active = True
+        self._origin = self.timers.now
+        self._index = 0
+        self._wake()
+
+    def cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.active = False
+        self.waiting = False
+        self._frozen = None
+
+    def resume(self):
+        """carry on after a Prompt"""
+        if not self.waiting:
+            return
+        self.waiting = False
+        self._origin = self.timers.now - self._frozen
+        self._frozen = None
+        self._wake()
+
+    @property
+    def elapsed(self):
+        """script seconds since start (stands still on a prompt)"""
+        if self._frozen is not None:
+            return self._frozen
+        return self.timers.now - self._origin
+
+    @property
+    def current(self):
+        return self.keyframes[self._index]
+
+    @property
+    def revealed(self):
+        """lines revealed so far over the whole script"""
+        return self.keyframes[self._index].revealed
+
+    # ---- stepping ----
+
+    def _wake(self):
+        self._timer = None
+        frames = self.keyframes
+        t = self.elapsed + self.EPSILON
+
+        while self._index + 1 < len(frames) and frames[self._index + 1].t <= t:
+            self._index += 1
+            frame = frames[self._index]
+            if self.on_reveal is not None and frame.revealed > frames[self._index - 1].revealed:
+                self.on_reveal()
+            action = frame.action
+            if action is None:
+                continue
+
+            if action is END:
+                self.cancel()
+                return
+            if action is PROMPT:
+                self.waiting = True
+                self._frozen = frame.t
+                return
+
+            action.callback(*action.args)
+            if not self.active:  # the callback ended the sequence (state change, cancel)
+                return
+
+        self._arm()
+
+    def _arm(self):
+        """one timer: the next keyframe or the next cursor blink edge, whichever is first"""
+        elapsed = self.elapsed
+        due = self.keyframes[self._index + 1].t
+
+        if self.cursor_char is not None and self.current.shown:
+            blink = self.cursor_blink_s
+            due = min(due, (math.floor(elapsed / blink + self.EPSILON) + 1) * blink)
+
+        self._timer = self.timers.after(due - elapsed, self._wake)
+
+    # ---- render ----
+
+    def _block_surfaces(self, block, colour):
+        key = (block, colour)
+        surfaces = self._surfaces.get(key)
+        if surfaces is None:
+            surfaces = [self.font.render(line, True, colour) for line in self.blocks[block]]
+            self._surfaces[key] = surfaces
+        return surfaces
+
+    def cursor_visible(self):
+        return int(self.elapsed / self.cursor_blink_s + self.EPSILON) % 2 == 0
+
+    def render(self, screen, colour, alpha=255):
+        if not self.active:
+            return
+
+        frame = self.keyframes[self._index]
+        if not frame.shown:
+            return
+
+        x, y, line_h = self.x, self.y, self.line_h
+        if frame.visible:
+            surfaces = self._block_surfaces(frame.block, colour)
+            for i in range(frame.visible):
+                surf = surfaces[i]
+                surf.set_alpha(alpha)
+                screen.blit(surf, (x, y + i * line_h))
+
+        if self.cursor_char is not None and self.cursor_visible():
+            key = (-1, colour)
+            cursor = self._surfaces.get(key)
+            if cursor is None:
+                cursor = self._surfaces[key] = [self.font.render(self.cursor_char, True, colour)]
+            cursor[0].set_alpha(alpha)
+            screen.blit(cursor[0], (x, y + frame.visible * line_h))
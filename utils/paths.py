@@ -1,10 +1,25 @@
-from pathlib import Path
+import os
 
+# plain os.path strings: pathlib (and the re / fnmatch / urllib it imports) would
+# be most of the cost of importing the simulation core
 
-def project_root() -> Path:
+
+def project_root() -> str:
     # utils/paths.py is at <root>/utils/paths.py
-    return Path(__file__).resolve().parents[1]
+    return os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def asset_path(*parts: str) -> str:
+    return os.path.join(project_root(), "assets", *parts)
+
+
+def save_path(*parts: str) -> str:
+    return os.path.join(project_root(), "saves", *parts)
+
+
+def telemetry_path(*parts: str) -> str:
+    return os.path.join(project_root(), "telemetry", *parts)
 
 
-def asset_path(*parts: str) -> Path:
-    return project_root().joinpath("assets", *parts)
+def report_path(*parts: str) -> str:
+    return os.path.join(project_root(), "reports", *parts)
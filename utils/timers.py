@@ -0,0 +1,99 @@
+import heapq
+
+
+class Timer:
+    """handle returned by TimerScheduler.after() / every(); cancel() is safe to call twice"""
+
+    __slots__ = ("due", "seq", "interval", "callback", "args", "active")
+
+    def __init__(self, due, seq, interval, callback, args):
+        self.due = due
+        self.seq = seq
+        self.interval = interval  # None = one-shot
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class TimerScheduler:
+    """
+    Central timer heap, advanced once per frame by Game.
+
+    Components schedule callbacks instead of counting floats down every frame,
+    so anything waiting on a timer costs nothing until it fires.
+
+    - expiry order is (due time, scheduling order): deterministic for a given
+      sequence of advance() calls, whatever the frame rate
+    - while a callback runs, `now` reads as that timer's due time, so timers
+      scheduled from a callback chain without drift
+    - repeating timers fire once per elapsed interval (a long frame catches up)
+    - cancelled timers are dropped lazily when they reach the top of the heap
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = 0
+
+    def after(self, delay, callback, *args):
+        """one-shot: callback(*args) once, delay seconds from now"""
+        return self._push(self.now + max(0.0, delay), None, callback, args)
+
+    def every(self, interval, callback, *args, delay=None):
+        """repeating: every interval seconds (first after delay, default one interval)"""
+        if interval <= 0:
+            raise ValueError("Repeating timer interval must be positive")
+        first = interval if delay is None else max(0.0, delay)
+        return self._push(self.now + first, interval, callback, args)
+
+    def _push(self, due, interval, callback, args):
+        self._seq += 1
+        timer = Timer(due, self._seq, interval, callback, args)
+        heapq.heappush(self._heap, (due, timer.seq, timer))
+        return timer
+
+    def remaining(self, timer):
+        """seconds until timer fires (0 if it is overdue, None if it is cancelled / spent)"""
+        if timer is None or not timer.active:
+            return None
+        return max(0.0, timer.due - self.now)
+
+    def next_due_in(self):
+        """seconds until the next live timer (None = nothing scheduled)"""
+        heap = self._heap
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.now)
+
+    def advance(self, dt):
+        """move the clock on by dt and fire everything due, in order"""
+        end = self.now + dt
+        heap = self._heap
+
+        while heap and heap[0][0] <= end:
+            due, _seq, timer = heapq.heappop(heap)
+            if not timer.active:
+                continue
+
+            self.now = due
+            if timer.interval is None:
+                timer.active = False
+            else:
+                timer.due = due + timer.interval
+                self._seq += 1
+                timer.seq = self._seq
+                heapq.heappush(heap, (timer.due, timer.seq, timer))
+
+            timer.callback(*timer.args)
+
+        self.now = end
+
+    def clear(self):
+        for _due, _seq, timer in self._heap:
+            timer.active = False
+        self._heap.clear()
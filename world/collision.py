@@ -0,0 +1,168 @@
+def snap(value):
+    """nearest int, halves away from zero (how pygame.Rect stores float writes)"""
+    if value.__class__ is int:
+        return value
+    return int(value + 0.5) if value >= 0 else -int(0.5 - value)
+
+
+class Rect:
+    """
+    Axis-aligned integer rect: the pygame.Rect subset the simulation uses, in pure Python.
+
+    - same numbers as pygame.Rect: the constructor truncates, attribute writes
+      (x, right, center, ...) snap floats to the nearest int
+    - iterates as (x, y, w, h), so pygame drawing calls take it as a rect argument
+    """
+
+    __slots__ = ("_x", "_y", "_w", "_h")
+
+    def __init__(self, x, y, w, h):
+        self._x = int(x)
+        self._y = int(y)
+        self._w = int(w)
+        self._h = int(h)
+
+    def copy(self):
+        return Rect(self._x, self._y, self._w, self._h)
+
+    def __repr__(self):
+        return f"Rect({self._x}, {self._y}, {self._w}, {self._h})"
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    __hash__ = None  # mutable, like pygame.Rect
+
+    # ---- sequence view ----
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        return iter((self._x, self._y, self._w, self._h))
+
+    def __getitem__(self, i):
+        return (self._x, self._y, self._w, self._h)[i]
+
+    # ---- position / size ----
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = snap(value)
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = snap(value)
+
+    @property
+    def w(self):
+        return self._w
+
+    @w.setter
+    def w(self, value):
+        self._w = snap(value)
+
+    @property
+    def h(self):
+        return self._h
+
+    @h.setter
+    def h(self, value):
+        self._h = snap(value)
+
+    width = w
+    height = h
+    left = x
+    top = y
+
+    @property
+    def right(self):
+        return self._x + self._w
+
+    @right.setter
+    def right(self, value):
+        self._x = snap(value) - self._w
+
+    @property
+    def bottom(self):
+        return self._y + self._h
+
+    @bottom.setter
+    def bottom(self, value):
+        self._y = snap(value) - self._h
+
+    @property
+    def centerx(self):
+        return self._x + self._w // 2
+
+    @centerx.setter
+    def centerx(self, value):
+        self._x = snap(value) - self._w // 2
+
+    @property
+    def centery(self):
+        return self._y + self._h // 2
+
+    @centery.setter
+    def centery(self, value):
+        self._y = snap(value) - self._h // 2
+
+    @property
+    def center(self):
+        return (self._x + self._w // 2, self._y + self._h // 2)
+
+    @center.setter
+    def center(self, value):
+        cx, cy = value
+        self._x = snap(cx) - self._w // 2
+        self._y = snap(cy) - self._h // 2
+
+    @property
+    def topleft(self):
+        return (self._x, self._y)
+
+    @topleft.setter
+    def topleft(self, value):
+        x, y = value
+        self._x = snap(x)
+        self._y = snap(y)
+
+    @property
+    def size(self):
+        return (self._w, self._h)
+
+    @size.setter
+    def size(self, value):
+        w, h = value
+        self._w = snap(w)
+        self._h = snap(h)
+
+    # ---- collision ----
+
+    def colliderect(self, other):
+        """True if the rects overlap (touching edges don't; empty rects never do)"""
+        x, y, w, h = self._x, self._y, self._w, self._h
+        return (
+            w > 0 and h > 0 and other._w > 0 and other._h > 0
+            and x < other._x + other._w and other._x < x + w
+            and y < other._y + other._h and other._y < y + h
+        )
+
+    def collidelistall(self, rects):
+        """indices of every rect in rects this one overlaps"""
+        x, y, w, h = self._x, self._y, self._w, self._h
+        if w <= 0 or h <= 0:
+            return []
+        right, bottom = x + w, y + h
+        return [
+            i for i, o in enumerate(rects)
+            if x < o._x + o._w and o._x < right and y < o._y + o._h and o._y < bottom and o._w > 0 and o._h > 0
+        ]
@@ -0,0 +1,212 @@
+import sys
+import threading
+
+from utils.paths import asset_path
+from world.tasks.system import TaskSystem, load_task_definitions
+
+
+def load_cycle_definitions(filename="cycles.json"):
+    """cycle entries from assets/<filename>, in play order"""
+    import json  # deferred, as in world.tasks.system.load_task_definitions
+
+    with open(asset_path(filename), "r", encoding="utf-8") as f:
+        return json.load(f)["cycles"]
+
+
+# one worker shared by every CycleManager: builds run one at a time, off the game thread
+_loader = None
+
+# clear while Game runs a frame: the loader parks instead of fighting it for the GIL
+_between_frames = threading.Event()
+_between_frames.set()
+
+PARK_TIMEOUT = 0.1  # a stuck frame never stalls loading for longer than this per park
+
+
+def frame_started():
+    _between_frames.clear()
+
+
+def frame_finished():
+    _between_frames.set()
+
+
+def _park(_frame, _event, _arg):
+    # profile hook on the loader thread only: runs at every call, waits out the current frame
+    if not _between_frames.is_set():
+        _between_frames.wait(PARK_TIMEOUT)
+
+
+def _loader_pool():
+    global _loader
+    if _loader is None:
+        # deferred: concurrent.futures imports logging (and re) for one worker thread
+        from concurrent.futures import ThreadPoolExecutor
+
+        _loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="node2084-cycles")
+    return _loader
+
+
+class CycleLayout:
+    """one cycle, fully built: its world, door bits, merged walls, sensors and tasks"""
+
+    __slots__ = ("index", "cycle_id", "world", "door_mask", "walls", "sensors", "tasks", "carry_tasks")
+
+    def __init__(self, index, cycle_id, world, door_mask, walls, sensors, tasks, carry_tasks=False):
+        self.index = index
+        self.cycle_id = cycle_id
+        self.world = world            # world.pool.WorldResources of the cycle's map
+        self.door_mask = door_mask    # Map.get_state() bitmask of groups active at cycle start
+        self.walls = walls            # Map.walls_for(door_mask)
+        self.sensors = sensors        # fresh, dormant Sensors (cones already baked)
+        self.tasks = tasks            # the cycle's own TaskSystem (unbound)
+        self.carry_tasks = carry_tasks  # same-id tasks continue from the cycle before
+
+    @property
+    def map(self):
+        return self.world.map
+
+
+class CycleManager:
+    """
+    Cycle sequence (assets/cycles.json) for one PlayState.
+
+    Each definition names its "map" (optional "size": [cols, rows]), the door
+    groups active when it starts ("doors"), its sensor emitters ("sensors":
+    list of [c, r], null = every emitter on the map) and its tasks ("tasks":
+    ids from assets/tasks.json, null = all of them). With "carry_tasks": true,
+    tasks it shares with the cycle before continue where they were instead of
+    starting idle.
+
+    - a cycle is built ahead into a CycleLayout: door bitmask and merged walls,
+      clones of the map's sensors (sharing their baked cones) and a TaskSystem
+      holding only its tasks
+    - while a cycle plays, the next one is built on a background thread (maps
+      it hasn't seen are parsed there too), so advance() just hands over a
+      finished layout; if it isn't finished yet, advance() waits and counts a hitch
+    - the loader only runs between frames (frame_started / frame_finished from
+      Game.frame), so a big map parsing in the background doesn't stretch frames
+    """
+
+    def __init__(self, world_pool, definitions=None, *, task_definitions=None, background=True):
+        self.world_pool = world_pool
+        self.definitions = load_cycle_definitions() if definitions is None else list(definitions)
+        self.task_definitions = load_task_definitions() if task_definitions is None else list(task_definitions)
+        if not self.definitions:
+            raise ValueError("Need at least one cycle")
+        self.background = background
+
+        self.current = None
+        self._next = None   # Future (background) or CycleLayout for the cycle after current
+        self.hitches = 0    # advances that had to wait for the loader
+
+    def __len__(self):
+        return len(self.definitions)
+
+    def map_file(self, index=0):
+        definition = self.definitions[index]
+        return definition["map"], self._size(definition)
+
+    @staticmethod
+    def _size(definition):
+        size = definition.get("size")
+        return tuple(size) if size else None
+
+    # ---- building (any thread) ----
+
+    def build(self, index):
+        """CycleLayout for cycle index (blocking)"""
+        definition = self.definitions[index]
+        world = self.world_pool.get(definition["map"], size=self._size(definition))
+        game_map = world.map
+
+        door_mask = game_map.group_mask(definition.get("doors", ()))
+        walls = game_map.walls_for(door_mask)
+
+        wanted = definition.get("sensors")
+        if wanted is None:
+            sensors = [sensor.clone() for sensor in world.sensors]
+        else:
+            by_cell = {sensor.cell: sensor for sensor in world.sensors}
+            missing = [cell for cell in map(tuple, wanted) if cell not in by_cell]
+            if missing:
+                raise ValueError(f"Cycle '{definition['id']}' names cells without emitters: {missing}")
+            sensors = [by_cell[tuple(cell)].clone() for cell in wanted]
+
+        task_ids = definition.get("tasks")
+        if task_ids is None:
+            task_defs = self.task_definitions
+        else:
+            known = {d["id"]: d for d in self.task_definitions}
+            unknown = [task_id for task_id in task_ids if task_id not in known]
+            if unknown:
+                raise ValueError(f"Cycle '{definition['id']}' has unknown tasks: {unknown}")
+            task_defs = [known[task_id] for task_id in task_ids]
+
+        return CycleLayout(
+            index, definition["id"], world, door_mask, walls, sensors, TaskSystem(game_map, task_defs),
+            carry_tasks=bool(definition.get("carry_tasks", False)),
+        )
+
+    def _build_between_frames(self, index):
+        sys.setprofile(_park)
+        try:
+            return self.build(index)
+        finally:
+            sys.setprofile(None)
+
+    # ---- sequencing (game thread) ----
+
+    def start(self, index=0, layout=None):
+        """build cycle index now (level start / snapshot load; or take build(index)'s layout) and queue the one after it"""
+        if not 0 <= index < len(self.definitions):
+            raise IndexError(f"No cycle {index}")
+        self._cancel_next()
+        self.current = self.build(index) if layout is None else layout
+        self._queue_next()
+        return self.current
+
+    def advance(self):
+        """the next cycle's layout (already built, normally), or None after the last cycle"""
+        pending = self._next
+        if pending is None:
+            return None
+        self._next = None
+
+        if not isinstance(pending, CycleLayout):
+            if pending.done():
+                pending = pending.result()
+            else:
+                # blocking anyway: let the loader run through the frame, then close the gate again
+                self.hitches += 1
+                in_frame = not _between_frames.is_set()
+                _between_frames.set()
+                try:
+                    pending = pending.result()
+                finally:
+                    if in_frame:
+                        _between_frames.clear()
+
+        self.current = pending
+        self._queue_next()
+        return pending
+
+    def _queue_next(self):
+        index = self.current.index + 1
+        if index >= len(self.definitions):
+            self._next = None
+        elif self.background:
+            self._next = _loader_pool().submit(self._build_between_frames, index)
+        else:
+            self._next = self.build(index)
+
+    def _cancel_next(self):
+        if self._next is not None and not isinstance(self._next, CycleLayout):
+            self._next.cancel()
+        self._next = None
+
+    @property
+    def next_ready(self):
+        """True if advance() would not wait"""
+        pending = self._next
+        return pending is None or isinstance(pending, CycleLayout) or pending.done()
@@ -1,11 +1,128 @@
+from array import array
+
+from config.settings import GamePlayConfig, TimingConfig
+
+
 class DiscoverySystem:
-    """anomalies: memory fragement, blind spot, contradition"""
+    """
+    anomalies: memory fragement, blind spot, contradition
+
+    Every discovery region (x, y, z) and anomaly region (o, p) is one discovery.
+    At load time each region's trigger radius is baked into a flat per-cell
+    lookup (index = r * cols + c, value = discovery id + 1, 0 = nothing here),
+    so update() is a single index per tick instead of distance checks.
+    """
+
+    # memory fragments fire once; anomalies can re-fire after a cooldown
+    ONE_SHOT_TOKENS = {"x", "y", "z"}
+
+    def __init__(self, game_map, *, radius_cells=None, cooldown_s=None):
+        self.map = game_map
+        self.cols = game_map.cols
+        self.rows = game_map.rows
+
+        self.radius_cells = GamePlayConfig.DISCOVERY_RADIUS_CELLS if radius_cells is None else radius_cells
+        self.cooldown_s = TimingConfig.DISCOVERY_COOLDOWN if cooldown_s is None else cooldown_s
+
+        # discovery id -> token
+        self.tokens = []
+
+        # per-cell lookup: 0 = none, else discovery id + 1
+        self.lookup = bytearray(self.cols * self.rows)
+
+        self._bake(game_map.marker_data)
+
+        count = len(self.tokens)
+
+        # per-discovery time (system clock) at which it may fire again
+        self.time = 0.0
+        self.ready_at = array("d", bytes(8 * count))
+
+        # one-shot flags and latches as bitsets (bit i = discovery i)
+        self.one_shot_mask = 0
+        for i, token in enumerate(self.tokens):
+            if token in self.ONE_SHOT_TOKENS:
+                self.one_shot_mask |= 1 << i
+        self.latched = 0
+
+        # most recent discovery token (None until something fires)
+        self.last_discovery = None
 
-    def __init__(self):
-        pass
+    # ---- load-time baking ----
+
+    def _bake(self, marker_data):
+        regions = {}
+        for token, cells in marker_data["discovery_cells"].items():
+            regions.setdefault(token, []).extend(cells)
+        for c, r, token in marker_data["anomalies"]:
+            regions.setdefault(token, []).append((c, r))
+
+        if len(regions) > 255:
+            raise ValueError(f"Too many discoveries for lookup: {len(regions)}")
+
+        rad = self.radius_cells
+        for token in sorted(regions):
+            self.tokens.append(token)
+            value = len(self.tokens)
+
+            for c, r in regions[token]:
+                for rr in range(max(0, r - rad), min(self.rows, r + rad + 1)):
+                    base = rr * self.cols
+                    for cc in range(max(0, c - rad), min(self.cols, c + rad + 1)):
+                        # first region baked keeps overlapping cells
+                        if not self.lookup[base + cc]:
+                            self.lookup[base + cc] = value
+
+    # ---- public API ----
+
+    def reset(self):
+        self.time = 0.0
+        for i in range(len(self.ready_at)):
+            self.ready_at[i] = 0.0
+        self.latched = 0
+        self.last_discovery = None
+
+    def discovery_at(self, cell):
+        """token of the discovery whose trigger zone covers cell, or None"""
+        if cell is None:
+            return None
+        c, r = cell
+        if c < 0 or c >= self.cols or r < 0 or r >= self.rows:
+            return None
+        value = self.lookup[r * self.cols + c]
+        return self.tokens[value - 1] if value else None
 
     def update(self, dt, player):
-        pass
+        """
+        Returns the discovery token fired this tick, or None.
+        """
+        self.time += dt
+
+        if not player:
+            return None
+
+        cell = self.map.world_to_cell(player.rect.centerx, player.rect.centery)
+        if cell is None:
+            return None
+
+        c, r = cell
+        value = self.lookup[r * self.cols + c]
+        if not value:
+            return None
+
+        idx = value - 1
+        bit = 1 << idx
+        if self.latched & bit or self.time < self.ready_at[idx]:
+            return None
+
+        return self.trigger_discovery(idx)
+
+    def trigger_discovery(self, idx):
+        bit = 1 << idx
+        if self.one_shot_mask & bit:
+            self.latched |= bit
+        else:
+            self.ready_at[idx] = self.time + self.cooldown_s
 
-    def trigger_discovery(self):
-        pass
+        self.last_discovery = self.tokens[idx]
+        return self.last_discovery
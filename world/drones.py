@@ -0,0 +1,250 @@
+from config.settings import GamePlayConfig
+
+try:
+    import numpy as np
+except ImportError:  # no NumPy, no drones: the pool stays empty
+    np = None
+
+
+def sweep_and_prune(min_x, max_x, min_y, max_y):
+    """
+    Overlapping box pairs (i, j), i < j in input order, as two index arrays.
+
+    Boxes are sorted by left edge once; each box's candidates are the boxes
+    that start before its right edge (one searchsorted for all of them), and
+    only those candidate pairs are tested on y. Edges that just touch don't count.
+    """
+    n = len(min_x)
+    if n < 2:
+        empty = np.empty(0, np.intp)
+        return empty, empty
+
+    order = np.argsort(min_x, kind="stable")
+    left = min_x[order]
+    end = np.searchsorted(left, max_x[order], side="left")
+
+    counts = np.maximum(end - np.arange(1, n + 1), 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, np.intp)
+        return empty, empty
+
+    # expand (sorted i, sorted j) candidate pairs without a Python loop
+    a = np.repeat(np.arange(n), counts)
+    b = a + 1 + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    ia, ib = order[a], order[b]
+
+    hit = (min_y[ia] < max_y[ib]) & (min_y[ib] < max_y[ia])
+    ia, ib = ia[hit], ib[hit]
+    swap = ia > ib
+    return np.where(swap, ib, ia), np.where(swap, ia, ib)
+
+
+class DronePool:
+    """
+    Patrol drones stored as a struct of arrays (NumPy), not one object each.
+
+    - every live drone walks its own looping waypoint route; all of them are
+      advanced in one vectorised step
+    - moves are checked against the map's wall table (live, so closed doors
+      block): a drone whose next box would touch a wall cell stays put and
+      turns to its next waypoint
+    - drone/drone and drone/player overlaps come from one sweep-and-prune pass
+    - live drones are packed at the front; removing one swaps the last into its slot
+    """
+
+    STATE_PATROL = 0
+    STATE_ALERT = 1  # touching the player this tick
+
+    def __init__(self, game_map, *, capacity=None, size_px=None):
+        self.map = game_map
+        self.size = GamePlayConfig.DRONE_SIZE if size_px is None else size_px
+        self.count = 0
+
+        # latest overlap results (drone indices)
+        self.player_hits = ()
+        self.pairs = ((), ())
+
+        if np is None:
+            self.capacity = 0
+            return
+
+        # live views over the map's bytes: door changes show up without copying
+        self._grid = np.frombuffer(game_map.grid, dtype=np.uint8)
+        self._walls = np.frombuffer(game_map.wall_table, dtype=np.uint8)
+
+        self.capacity = 0
+        self.pos = np.empty((0, 2), np.float32)
+        self.vel = np.empty((0, 2), np.float32)
+        self.speed = np.empty(0, np.float32)
+        self.state = np.empty(0, np.uint8)
+        self.route_start = np.empty(0, np.int32)
+        self.route_len = np.empty(0, np.int32)
+        self.route_index = np.empty(0, np.int32)
+        self._grow(GamePlayConfig.DRONE_CAPACITY if capacity is None else capacity)
+
+        # every route's waypoints back to back (pixel centres)
+        self.waypoints = np.empty((0, 2), np.float32)
+
+    @property
+    def available(self):
+        return np is not None
+
+    def _grow(self, capacity):
+        def resized(arr):
+            out = np.zeros((capacity,) + arr.shape[1:], arr.dtype)
+            out[:self.count] = arr[:self.count]
+            return out
+
+        self.pos = resized(self.pos)
+        self.vel = resized(self.vel)
+        self.speed = resized(self.speed)
+        self.state = resized(self.state)
+        self.route_start = resized(self.route_start)
+        self.route_len = resized(self.route_len)
+        self.route_index = resized(self.route_index)
+        self.capacity = capacity
+
+    # ---- spawning ----
+
+    def spawn(self, route_cells, speed=None):
+        """new drone looping over route_cells [(c, r), ...], starting on the first; returns its index"""
+        if np is None:
+            raise RuntimeError("Drones need NumPy")
+        if not route_cells:
+            raise ValueError("Drone route needs at least one waypoint")
+
+        if self.count == self.capacity:
+            self._grow(max(8, self.capacity * 2))
+
+        points = np.array([self.map.cell_center(cell) for cell in route_cells], np.float32)
+        i = self.count
+        self.route_start[i] = len(self.waypoints)
+        self.route_len[i] = len(points)
+        self.route_index[i] = 1 % len(points)
+        self.waypoints = np.concatenate([self.waypoints, points])
+
+        self.pos[i] = points[0]
+        self.vel[i] = 0.0
+        self.speed[i] = GamePlayConfig.DRONE_SPEED if speed is None else speed
+        self.state[i] = self.STATE_PATROL
+        self.count += 1
+        return i
+
+    def remove(self, i):
+        """drop drone i (the last drone takes its index)"""
+        last = self.count - 1
+        if not 0 <= i <= last:
+            raise IndexError(i)
+        for arr in (self.pos, self.vel, self.speed, self.state, self.route_start, self.route_len, self.route_index):
+            arr[i] = arr[last]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
+        self.player_hits = ()
+        self.pairs = ((), ())
+        if np is not None:
+            self.waypoints = np.empty((0, 2), np.float32)
+
+    # ---- simulation ----
+
+    def _blocked(self, centres):
+        """True where a drone box centred there would touch a wall cell (or leave the map)"""
+        game_map = self.map
+        half = self.size / 2
+        cols, rows = game_map.cols, game_map.rows
+
+        blocked = np.zeros(len(centres), bool)
+        for sx in (-half, half - 1):
+            for sy in (-half, half - 1):
+                c = np.floor((centres[:, 0] + sx - game_map.offset_x) / game_map.cell).astype(np.intp)
+                r = np.floor((centres[:, 1] + sy - game_map.offset_y) / game_map.cell).astype(np.intp)
+                inside = (c >= 0) & (c < cols) & (r >= 0) & (r < rows)
+                ids = np.where(inside, r * cols + c, 0)
+                blocked |= ~inside | (self._walls[self._grid[ids]] == 1)
+        return blocked
+
+    def update(self, dt, player_rect=None):
+        """advance every drone one tick; returns the indices of drones touching player_rect"""
+        n = self.count
+        if n == 0 or dt <= 0:
+            self.player_hits = ()
+            return self.player_hits
+
+        pos = self.pos[:n]
+        route_index = self.route_index[:n]
+        route_len = self.route_len[:n]
+
+        target = self.waypoints[self.route_start[:n] + route_index]
+        delta = target - pos
+        dist = np.sqrt((delta * delta).sum(axis=1))
+        step = self.speed[:n] * dt
+
+        arrived = dist <= step
+        scale = np.where(arrived, 1.0, step / np.maximum(dist, 1e-6)).astype(np.float32)
+        moved = pos + delta * scale[:, None]
+
+        blocked = self._blocked(moved)
+        ok = ~blocked
+        self.vel[:n] = np.where(ok[:, None], (moved - pos) / dt, 0.0)
+        pos[ok] = moved[ok]
+
+        turn = (arrived & ok) | blocked
+        route_index[turn] = (route_index[turn] + 1) % route_len[turn]
+
+        self._overlaps(player_rect)
+        return self.player_hits
+
+    def _overlaps(self, player_rect):
+        n = self.count
+        half = self.size / 2
+        pos = self.pos[:n]
+
+        min_x, min_y = pos[:, 0] - half, pos[:, 1] - half
+        max_x, max_y = pos[:, 0] + half, pos[:, 1] + half
+
+        # the player rides along as box n
+        if player_rect is not None:
+            min_x = np.append(min_x, player_rect.left)
+            max_x = np.append(max_x, player_rect.right)
+            min_y = np.append(min_y, player_rect.top)
+            max_y = np.append(max_y, player_rect.bottom)
+
+        ia, ib = sweep_and_prune(min_x, max_x, min_y, max_y)
+
+        with_player = ib == n  # i < j, so the player (index n) is always on the right
+        self.player_hits = ia[with_player]
+        self.pairs = (ia[~with_player], ib[~with_player])
+
+        state = self.state[:n]
+        state[:] = self.STATE_PATROL
+        state[self.player_hits] = self.STATE_ALERT
+
+
+def random_patrols(game_map, count, rng, *, legs=4, max_leg_cells=12):
+    """
+    count routes of straight, wall-free legs over open floor (for stress maps / benchmarks).
+    Each leg runs along a row or column until a wall or max_leg_cells; routes
+    retrace themselves, so the loop back to the start never cuts a corner.
+    """
+    cols, rows = game_map.cols, game_map.rows
+    open_cells = [cell for cell in map(game_map.cell_at, range(cols * rows)) if not game_map.is_wall_cell(cell)]
+    if not open_cells:
+        return []
+
+    routes = []
+    for _ in range(count):
+        c, r = rng.choice(open_cells)
+        route = [(c, r)]
+        for _leg in range(legs):
+            dc, dr = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+            length = 0
+            limit = rng.randint(2, max_leg_cells)
+            while length < limit and game_map.in_bounds((c + dc, r + dr)) and not game_map.is_wall_cell((c + dc, r + dr)):
+                c, r = c + dc, r + dr
+                length += 1
+            if length:
+                route.append((c, r))
+        routes.append(route + route[-2:0:-1])
+    return routes
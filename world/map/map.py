@@ -1,17 +1,24 @@
-import pygame
-from config.palette import Colour
 from config.grid import GridConfig
 from utils.paths import asset_path
+from world.map.meshing import merge_cells
+from world.map.markers import parse_markers
+from world.collision import Rect
 
 
 class Map:
-    """Loads tile map from CSV. Owns static walls, dynamic wall groups, triggers, and marker cells."""
+    """
+    Loads tile map from CSV. Owns static walls, dynamic wall groups, triggers, and marker cells.
+
+    The token grid is a flat bytearray (one byte per cell, index = r * cols + c);
+    trigger sets hold the same packed integer cell ids.
+    """
 
     STATIC_WALL = "#"
     SPAWN = "S"
 
     # dynamic wall groups (inactive unless toggled)
     DYNAMIC_WALL_TOKENS = {"!", "@", "%", "*", "$"}
+    GROUP_ORDER = tuple(sorted(DYNAMIC_WALL_TOKENS))  # bit i of a group mask = GROUP_ORDER[i]
 
     # trigger cells (cause toggles)
     TRIGGER_TOKENS = {"T", "U", "V", "W"}
@@ -19,42 +26,80 @@ class Map:
     # sensor emitter tokens (placed on wall cells)
     SENSOR_TOKENS = {"^", "v", "<", ">"}
 
-    # Task 1 trigger token(s)
-    TASK1_TRIGGER_TOKENS = {"1"}
-
-    # Task 1 structured anchors
-    TASK1_ANCHOR_TOKENS = {"a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m"}
+    # byte-level lookups for the packed grid
+    _SOLID_BYTES = frozenset(ord(t) for t in SENSOR_TOKENS | {STATIC_WALL})
 
-    def __init__(self, csv_filename):
-        self.csv_path = asset_path(csv_filename)
+    def __init__(self, csv_filename, *, size=None):
+        """size: (cols, rows) the file must have; default is the screen grid (GridConfig)"""
+        self.csv_path = asset_path(csv_filename)  # absolute paths are used as-is
 
-        self.cols = GridConfig.COLS
-        self.rows = GridConfig.ROWS
+        self.cols, self.rows = (GridConfig.COLS, GridConfig.ROWS) if size is None else size
         self.cell = GridConfig.CELL
-        self.offset_x, self.offset_y = GridConfig.offset()
+        self.offset_x, self.offset_y = GridConfig.offset(self.cols, self.rows)
 
-        self.grid = []
+        self.grid = bytearray()
         self.spawn_cell = None
 
-        # walls
+        # walls (static_walls / dynamic_rects hold greedily merged blocks, not single cells)
         self.static_walls = []
         self.dynamic_cells = {tok: [] for tok in self.DYNAMIC_WALL_TOKENS}
-        self.dynamic_active = {tok: False for tok in self.DYNAMIC_WALL_TOKENS}
-        self.dynamic_active["$"] = True  # return wall default ON
+        self.dynamic_rects = {tok: [] for tok in self.DYNAMIC_WALL_TOKENS}
+        self._walls_cache = {}  # dynamic group bitmask -> merged wall list
+        self.dynamic_active = {}
+
+        # 256-entry byte tables: token byte -> 1 if it blocks (kept in sync with dynamic_active)
+        self._wall_table = bytearray(256)
+        self._occluder_b_table = bytearray(256)
+        self._reset_dynamic_groups()
 
-        # triggers
+        # triggers: token -> set of cell ids
         self.triggers = {tok: set() for tok in self.TRIGGER_TOKENS}
 
         # sensors: list of ((c,r), token)
         self.sensor_emitters = []
 
-        # task markers (new)
-        self.task1_triggers = set()   # set[(c,r)]
-        self.task1_anchors = {}       # dict[str] -> (c,r)
+        # task triggers / anchors are data-driven: see world/tasks/system.py
 
         self._load_csv()
         self._build_static_walls()
 
+        # every marker cell by kind (world/map/markers.py), parsed once for discoveries / debug layers
+        self.marker_data = parse_markers(self.token_rows())
+
+    def _reset_dynamic_groups(self):
+        for tok in self.DYNAMIC_WALL_TOKENS:
+            self.dynamic_active[tok] = False
+        self.dynamic_active["$"] = True  # return wall default ON
+        self._refresh_tables()
+
+    def _refresh_tables(self):
+        for b in self._SOLID_BYTES:
+            self._wall_table[b] = 1
+            self._occluder_b_table[b] = 1
+        for tok, active in self.dynamic_active.items():
+            self._wall_table[ord(tok)] = 1 if active else 0
+            self._occluder_b_table[ord(tok)] = 1
+
+    def reset(self):
+        """restore dynamic wall groups to their load-time defaults"""
+        self._reset_dynamic_groups()
+
+    # ---- snapshot hooks (dynamic groups only; layout comes from the CSV) ----
+
+    def get_state(self):
+        """bitmask of active dynamic groups, in sorted token order"""
+        mask = 0
+        for i, tok in enumerate(self.GROUP_ORDER):
+            if self.dynamic_active[tok]:
+                mask |= 1 << i
+        return (mask,)
+
+    def set_state(self, state):
+        (mask,) = state
+        for i, tok in enumerate(self.GROUP_ORDER):
+            self.dynamic_active[tok] = bool(mask & (1 << i))
+        self._refresh_tables()
+
     def _load_csv(self):
         with open(self.csv_path, "r", encoding="utf-8") as f:
             lines = [ln.strip() for ln in f.readlines() if ln.strip()]
@@ -62,13 +107,18 @@ class Map:
         if len(lines) != self.rows:
             raise ValueError(f"Map row mismatch: expected {self.rows}, got {len(lines)}")
 
-        grid = []
+        grid = bytearray(self.rows * self.cols)
         for r, line in enumerate(lines):
             row = [c.strip() for c in line.split(",")]
             if len(row) != self.cols:
                 raise ValueError(f"Map col mismatch on row {r}: expected {self.cols}, got {len(row)}")
 
             for c, token in enumerate(row):
+                if len(token) != 1 or not token.isascii():
+                    raise ValueError(f"Map token at {(c, r)} must be one ASCII character, got {token!r}")
+                idx = r * self.cols + c
+                grid[idx] = ord(token)
+
                 if token == self.SPAWN:
                     self.spawn_cell = (c, r)
 
@@ -76,25 +126,12 @@ class Map:
                     self.dynamic_cells[token].append((c, r))
 
                 if token in self.TRIGGER_TOKENS:
-                    self.triggers[token].add((c, r))
+                    self.triggers[token].add(idx)
 
                 if token in self.SENSOR_TOKENS:
                     # emitter lives on this wall cell; direction is the token
                     self.sensor_emitters.append(((c, r), token))
 
-                # ---- Task 1 parsing (new) ----
-                if token in self.TASK1_TRIGGER_TOKENS:
-                    self.task1_triggers.add((c, r))
-
-                if token in self.TASK1_ANCHOR_TOKENS:
-                    # enforce uniqueness: if you accidentally place two 'a' tokens,
-                    # you'll notice immediately instead of silently picking one.
-                    if token in self.task1_anchors:
-                        raise ValueError(f"Duplicate Task1 anchor '{token}' at {(c, r)}")
-                    self.task1_anchors[token] = (c, r)
-
-            grid.append(row)
-
         if self.spawn_cell is None:
             raise ValueError("Map missing spawn cell 'S'")
 
@@ -103,26 +140,43 @@ class Map:
     def _cell_rect(self, c, r):
         x = self.offset_x + c * self.cell
         y = self.offset_y + r * self.cell
-        return pygame.Rect(x, y, self.cell, self.cell)
+        return Rect(x, y, self.cell, self.cell)
+
+    def cell_rect(self, c, r):
+        """screen rect of one cell"""
+        return self._cell_rect(c, r)
+
+    def _block_rects(self, cells):
+        rects = []
+        for c, r, w, h in merge_cells(cells, self.cols, self.rows):
+            rect = self._cell_rect(c, r)
+            rect.size = (w * self.cell, h * self.cell)
+            rects.append(rect)
+        return rects
 
     def _build_static_walls(self):
         """
         Static walls include:
         - '#'
         - sensor emitter cells (^ v < >) so you don't get holes in wall lines
+
+        Cells are merged into larger blocks (per static set and per dynamic group)
+        so rendering and collision walk a few dozen rects instead of hundreds.
         """
-        self.static_walls = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                t = self.grid[r][c]
-                if t == self.STATIC_WALL or t in self.SENSOR_TOKENS:
-                    self.static_walls.append(self._cell_rect(c, r))
+        solid = self._SOLID_BYTES
+        cols = self.cols
+        cells = [(i % cols, i // cols) for i, b in enumerate(self.grid) if b in solid]
+        self.static_walls = self._block_rects(cells)
+
+        for tok, group_cells in self.dynamic_cells.items():
+            self.dynamic_rects[tok] = self._block_rects(group_cells)
+        self._walls_cache.clear()
 
     def create_sensors(self):
         from world.sensors import Sensor
         sensors = []
         for (cell, direction) in self.sensor_emitters:
-            sensors.append(Sensor(cell=cell, direction_token=direction, max_length_cells=30))
+            sensors.append(Sensor(cell=cell, direction_token=direction))
         return sensors
 
     def get_spawn_point(self):
@@ -147,87 +201,111 @@ class Map:
         c, r = cell
         return 0 <= c < self.cols and 0 <= r < self.rows
 
+    def cell_id(self, cell):
+        """packed id (r * cols + c) for an in-bounds (c, r), else None"""
+        if cell is None:
+            return None
+        c, r = cell
+        if 0 <= c < self.cols and 0 <= r < self.rows:
+            return r * self.cols + c
+        return None
+
+    def cell_at(self, idx):
+        return (idx % self.cols, idx // self.cols)
+
+    def token_rows(self):
+        """the grid as one string per row (grid[r][c] -> token), for marker parsing / tools"""
+        cols = self.cols
+        return [self.grid[r * cols:(r + 1) * cols].decode("ascii") for r in range(self.rows)]
+
     def token_at(self, cell):
-        if not self.in_bounds(cell):
+        if cell is None:
             return None
         c, r = cell
-        return self.grid[r][c]
+        if c < 0 or c >= self.cols or r < 0 or r >= self.rows:
+            return None
+        return chr(self.grid[r * self.cols + c])
 
     def is_trigger(self, cell, trigger_token):
         if cell is None:
             return False
-        return cell in self.triggers.get(trigger_token, set())
-
-    # ---- Task 1 helpers (new) ----
-
-    def is_task1_trigger(self, cell):
-        """True if player is standing on a Task 1 trigger cell (token '1')."""
-        if cell is None:
+        c, r = cell
+        if c < 0 or c >= self.cols or r < 0 or r >= self.rows:
             return False
-        return cell in self.task1_triggers
-
-    def get_task1_anchors(self):
-        required = self.TASK1_ANCHOR_TOKENS
-        missing = required - set(self.task1_anchors.keys())
-        if missing:
-            raise ValueError(f"Task1 anchors missing on map: {sorted(missing)}")
-        return dict(self.task1_anchors)
+        return self.grid[r * self.cols + c] == ord(trigger_token)
+
+    def token_cells(self, tokens):
+        """{token: [(c, r), ...]} for each of tokens present on the grid, row-major"""
+        wanted = {ord(t): t for t in tokens}
+        cols = self.cols
+        found = {}
+        for idx, b in enumerate(self.grid):
+            token = wanted.get(b)
+            if token is not None:
+                found.setdefault(token, []).append((idx % cols, idx // cols))
+        return found
+
+    @property
+    def wall_table(self):
+        """token byte -> 1 if it blocks right now (live: follows set_group_active)"""
+        return self._wall_table
 
     def set_group_active(self, wall_token, active=True):
         if wall_token not in self.DYNAMIC_WALL_TOKENS:
             return
         self.dynamic_active[wall_token] = bool(active)
+        self._wall_table[ord(wall_token)] = 1 if active else 0
+
+    def group_mask(self, wall_tokens):
+        """get_state() bitmask with exactly these dynamic groups active"""
+        mask = 0
+        for tok in wall_tokens:
+            if tok not in self.DYNAMIC_WALL_TOKENS:
+                raise ValueError(f"Unknown dynamic wall group {tok!r}")
+            mask |= 1 << self.GROUP_ORDER.index(tok)
+        return mask
 
     def get_walls(self):
-        walls = list(self.static_walls)
-        for tok, active in self.dynamic_active.items():
-            if not active:
-                continue
-            for (c, r) in self.dynamic_cells[tok]:
-                walls.append(self._cell_rect(c, r))
+        """merged collision rects for the current door state (shared list: don't mutate)"""
+        return self.walls_for(self.get_state()[0])
+
+    def walls_for(self, mask):
+        """merged collision rects with the groups in mask active (cached per mask; shared list)"""
+        walls = self._walls_cache.get(mask)
+        if walls is None:
+            walls = list(self.static_walls)
+            for i, tok in enumerate(self.GROUP_ORDER):
+                if mask & (1 << i):
+                    walls.extend(self.dynamic_rects[tok])
+            self._walls_cache[mask] = walls
         return walls
 
     def is_wall_cell(self, cell):
-        t = self.token_at(cell)
-        if t is None:
+        if cell is None:
             return False
-        if t == self.STATIC_WALL:
-            return True
-        if t in self.SENSOR_TOKENS:
-            return True
-        if t in self.DYNAMIC_WALL_TOKENS:
-            return bool(self.dynamic_active.get(t, False))
-        return False
+        c, r = cell
+        if c < 0 or c >= self.cols or r < 0 or r >= self.rows:
+            return False
+        return self._wall_table[self.grid[r * self.cols + c]] == 1
 
     def is_sensor_occluder(self, cell, behaviour="A"):
-        t = self.token_at(cell)
-        if t is None:
-            return True
-        if t == self.STATIC_WALL:
+        if cell is None:
             return True
-        if t in self.SENSOR_TOKENS:
+        c, r = cell
+        if c < 0 or c >= self.cols or r < 0 or r >= self.rows:
             return True
-        if t in self.DYNAMIC_WALL_TOKENS:
-            if behaviour == "B":
-                return True
-            return bool(self.dynamic_active.get(t, False))
-        return False
+        # behaviour "B": dynamic groups occlude even while inactive
+        table = self._occluder_b_table if behaviour == "B" else self._wall_table
+        return table[self.grid[r * self.cols + c]] == 1
+
+    def occlusion_key(self, behaviour="A"):
+        """hashable summary of everything is_sensor_occluder depends on (for caching)"""
+        if behaviour == "B":
+            return 0  # dynamic groups always occlude: layout never changes
+        return self.get_state()[0]
 
     def cell_center(self, cell):
         c, r = cell
         x = self.offset_x + c * self.cell + self.cell // 2
         y = self.offset_y + r * self.cell + self.cell // 2
         return x, y
-
-    def render(self, screen, phosphor_alpha, draw_dynamic_walls=True):
-        col = Colour.phosphor_colour(Colour.BRIGHT_GREEN, phosphor_alpha)
-
-        for wall in self.static_walls:
-            pygame.draw.rect(screen, col, wall)
-
-        if draw_dynamic_walls:
-            for tok, active in self.dynamic_active.items():
-                if not active:
-                    continue
-                for (c, r) in self.dynamic_cells[tok]:
-                    pygame.draw.rect(screen, col, self._cell_rect(c, r))
\ No newline at end of file
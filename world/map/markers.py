@@ -1,6 +1,13 @@
+# task areas / triggers (A-D, 1-3) and Task1 anchors (a-m, assets/tasks.json)
+TASK_TOKENS = frozenset("ABCD123abcdefghijklm")
+
+# door groups (Map.DYNAMIC_WALL_TOKENS)
+DYNAMIC_WALL_TOKENS = ("!", "@", "%", "*", "$")
+
+
 def parse_markers(grid):
     """
-    grid: 2D list of tokens (rows then cols)
+    grid: rows of tokens, indexable as grid[r][c] (list of lists or list of str)
     Returns a dict of marker data without pygame imports.
     """
     rows = len(grid)
@@ -8,10 +15,10 @@ def parse_markers(grid):
 
     spawn_cell = None
     sensors = []          # list of (c, r, token) where token in ^ v < >
-    task_cells = {}       # "A".."D" -> list[(c,r)]
+    task_cells = {}       # TASK_TOKENS -> list[(c,r)]
     discovery_cells = {}  # "x".."z" -> list[(c,r)]
     anomalies = []        # list[(c,r,token)] e.g. "o","p"
-    dynamic_walls = {"!": [], "?": []}  # cells that can change later
+    dynamic_walls = {t: [] for t in DYNAMIC_WALL_TOKENS}  # cells that can change later
 
     for r in range(rows):
         for c in range(cols):
@@ -23,13 +30,13 @@ def parse_markers(grid):
             elif t in ("^", "v", "<", ">"):
                 sensors.append((c, r, t))
 
-            elif t in ("A", "B", "C", "D", "a", "b", "c"):
+            elif t in TASK_TOKENS:
                 task_cells.setdefault(t, []).append((c, r))
 
             elif t in ("x", "y", "z"):
                 discovery_cells.setdefault(t, []).append((c, r))
 
-            elif t in ("!", "?"):
+            elif t in dynamic_walls:
                 dynamic_walls[t].append((c, r))
 
             elif t in ("o", "p"):
@@ -0,0 +1,44 @@
+def merge_cells(cells, cols, rows):
+    """
+    Greedy meshing: merge grid cells into a small set of axis-aligned blocks.
+
+    cells: iterable of (c, r)
+    Returns a list of (c, r, w, h) in cell units. Scans row-major; each block
+    grows right as far as it can, then down while the whole span stays filled.
+    Pure grid logic, no pygame.
+    """
+    filled = bytearray(cols * rows)
+    for c, r in cells:
+        filled[r * cols + c] = 1
+
+    blocks = []
+    for r in range(rows):
+        base = r * cols
+        c = 0
+        while c < cols:
+            if not filled[base + c]:
+                c += 1
+                continue
+
+            # widen along the row
+            w = 1
+            while c + w < cols and filled[base + c + w]:
+                w += 1
+
+            # grow down while the full span is still filled
+            h = 1
+            while r + h < rows:
+                below = (r + h) * cols + c
+                if filled[below:below + w].count(1) != w:
+                    break
+                h += 1
+
+            # consume the block
+            for rr in range(r, r + h):
+                start = rr * cols + c
+                filled[start:start + w] = bytes(w)
+
+            blocks.append((c, r, w, h))
+            c += w
+
+    return blocks
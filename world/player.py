@@ -1,17 +1,26 @@
-import pygame
 from config.settings import TimingConfig
-from config.palette import Colour
+from world.collision import Rect
 
 
 class Player:
     """the node: glowing square, grid movement, collision"""
 
+    __slots__ = ("rect", "speed", "alpha")
+
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 16, 16)
+        self.rect = Rect(x, y, 16, 16)
 
         self.speed = 150  # pixels per second
         self.alpha = 0  # start invisible
 
+    # ---- snapshot hooks ----
+
+    def get_state(self):
+        return (self.rect.x, self.rect.y, float(self.alpha))
+
+    def set_state(self, state):
+        self.rect.x, self.rect.y, self.alpha = state
+
     def fade(self, dt):
         fade_speed = 255 / TimingConfig.PLAYER_FADE_DURATION
         self.alpha += fade_speed * dt
@@ -19,18 +28,11 @@ class Player:
         if self.alpha > 255:
             self.alpha = 255
 
-    def move(self, dt, walls):
-        keys = pygame.key.get_pressed()
-        dx, dy = 0, 0
-
-        if keys[pygame.K_a]:
-            dx = -self.speed * dt
-        if keys[pygame.K_d]:
-            dx = self.speed * dt
-        if keys[pygame.K_w]:
-            dy = -self.speed * dt
-        if keys[pygame.K_s]:
-            dy = self.speed * dt
+    def move(self, dt, walls, direction):
+        """direction: (x, y) steps of -1 / 0 / 1, from whoever reads the input"""
+        step_x, step_y = direction
+        dx = step_x * self.speed * dt
+        dy = step_y * self.speed * dt
 
         moved_this_frame = (dx != 0) or (dy != 0)
 
@@ -45,7 +47,9 @@ class Player:
     def collide(self, walls, dx, dy):
         """prevents player passing through walls"""
 
-        for wall in walls:
+        # one pass for the candidates, then resolve only the hits against the moving rect
+        for i in self.rect.collidelistall(walls):
+            wall = walls[i]
             if self.rect.colliderect(wall):
                 if dx > 0:
                     self.rect.right = wall.left
@@ -55,8 +59,3 @@ class Player:
                     self.rect.bottom = wall.top
                 if dy < 0:
                     self.rect.top = wall.bottom
-
-    def render(self, screen):
-        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        surf.fill((*Colour.PLAYER_CORE, int(self.alpha)))
-        screen.blit(surf, self.rect.topleft)
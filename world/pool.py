@@ -0,0 +1,57 @@
+from world.map.map import Map
+from world.discoveries import DiscoverySystem
+from world.drones import DronePool
+
+
+class WorldResources:
+    """one map's parsed world: Map, sensors, baked discovery lookup, drone pool (tasks are per cycle)"""
+
+    def __init__(self, csv_filename, *, size=None):
+        self.map = Map(csv_filename, size=size)
+        self.sensors = self.map.create_sensors() or []
+        for sensor in self.sensors:
+            sensor.refresh_cone(self.map)  # bake cones at load, not on the first frame
+        self.discoveries = DiscoverySystem(self.map)
+        self.drones = DronePool(self.map)
+
+    def reset(self):
+        """back to the state straight after loading (no disk I/O)"""
+        self.map.reset()
+        for sensor in self.sensors:
+            sensor.reset()
+        self.discoveries.reset()
+        self.drones.clear()
+
+
+class WorldPool:
+    """
+    Builds each map's world resources once and hands them back pristine.
+
+    Only one PlayState should hold a map's resources at a time: acquiring
+    them again resets the shared objects in place.
+    """
+
+    def __init__(self):
+        self._resources = {}
+
+    def acquire(self, csv_filename, *, size=None):
+        """size: (cols, rows) for maps that aren't screen-sized (only used on first load)"""
+        res = self._resources.get(csv_filename)
+        if res is None:
+            res = WorldResources(csv_filename, size=size)
+            self._resources[csv_filename] = res
+        else:
+            res.reset()
+        return res
+
+    def preload(self, csv_filename, *, size=None):
+        if csv_filename not in self._resources:
+            self._resources[csv_filename] = WorldResources(csv_filename, size=size)
+
+    def get(self, csv_filename, *, size=None):
+        """a map's resources as they are (loaded if needed, never reset)"""
+        self.preload(csv_filename, size=size)
+        return self._resources[csv_filename]
+
+    def clear(self):
+        self._resources.clear()
@@ -1,22 +1,34 @@
-import pygame
 from config.settings import TimingConfig, GamePlayConfig
-from config.palette import Colour
+from world.visibility import shadowcast_cone, cone_outline
 
 
 class Sensor:
     """
     Grid sensor (staggered wake):
     - emitter always drawn
-    - cone is 5 parallel rays (cells)
-    - rays stop when they hit map occluders
+    - cone is a true angular cone (spread / range per emitter token),
+      computed by symmetric shadowcasting so map occluders cast real shadows
+    - visibility is cached per wall configuration: a packed cell mask for
+      detection and a polygon (same set) for rendering
     - sensor is "disabled" until the player first steps into its line-of-sight cells
     - once enabled, it pulses and can increase suspicion
     """
 
-    def __init__(self, cell, direction_token, max_length_cells=30):
+    __slots__ = (
+        "cell", "dir", "spread_deg", "range_cells",
+        "alpha", "fading_in", "enabled",
+        "visible_mask", "cone_polygon", "_cone_cache",
+    )
+
+    FORWARD = {"^": (0, -1), "v": (0, 1), "<": (-1, 0), ">": (1, 0)}
+
+    def __init__(self, cell, direction_token, *, spread_deg=None, range_cells=None):
         self.cell = cell                  # (c, r)
         self.dir = direction_token        # "^", "v", "<", ">"
-        self.max_len = max_length_cells
+
+        cone_spread, cone_range = GamePlayConfig.SENSOR_CONES[direction_token]
+        self.spread_deg = cone_spread if spread_deg is None else spread_deg
+        self.range_cells = cone_range if range_cells is None else range_cells
 
         # pulse state (only used once enabled)
         self.alpha = 0.0
@@ -25,24 +37,38 @@ class Sensor:
         # activation latch
         self.enabled = False  # becomes True once player enters LOS once
 
-        # cached ray data
-        self._ray_cells = set()
-        self._ray_endpoints = []
+        # current visibility (from the cache)
+        self.visible_mask = None   # bytearray, index r * cols + c -> 1 if seen
+        self.cone_polygon = []     # screen-space far points, left to right
+
+        # occlusion key -> (visible_mask, cone_polygon)
+        self._cone_cache = {}
+
+    def reset(self):
+        """back to the dormant, never-seen state"""
+        self.alpha = 0.0
+        self.fading_in = True
+        self.enabled = False
+
+    def clone(self):
+        """fresh dormant sensor on the same emitter, sharing this one's baked cones"""
+        twin = Sensor(self.cell, self.dir, spread_deg=self.spread_deg, range_cells=self.range_cells)
+        twin._cone_cache = self._cone_cache  # keyed by wall configuration, entries never change
+        twin.visible_mask, twin.cone_polygon = self.visible_mask, self.cone_polygon
+        return twin
+
+    # ---- snapshot hooks ----
+
+    def get_state(self):
+        return (self.enabled, self.fading_in, float(self.alpha))
+
+    def set_state(self, state):
+        self.enabled, self.fading_in, self.alpha = state
 
     # ---- direction helpers ----
 
     def _forward(self):
-        if self.dir == "^":
-            return (0, -1)
-        if self.dir == "v":
-            return (0, 1)
-        if self.dir == "<":
-            return (-1, 0)
-        return (1, 0)
-
-    def _perp(self):
-        fx, _ = self._forward()
-        return (1, 0) if fx == 0 else (0, 1)
+        return self.FORWARD[self.dir]
 
     def _pulse(self, dt):
         fade_speed = GamePlayConfig.MAX_INFRARED_ALPHA / TimingConfig.SENSOR_ON_TIME
@@ -58,51 +84,54 @@ class Sensor:
                 self.alpha = 0.0
                 self.fading_in = True
 
-    # ---- ray casting ----
-
-    def _cast_rays(self, game_map, occlusion_behaviour="B"):
-        self._ray_cells.clear()
-        self._ray_endpoints.clear()
-
-        fx, fy = self._forward()
-        px, py = self._perp()
+    # ---- visibility ----
 
-        base_c, base_r = self.cell
+    def _compute_cone(self, game_map, occlusion_behaviour):
+        cols = game_map.cols
 
-        for offset in (-2, -1, 0, 1, 2):
-            start = (base_c + px * offset, base_r + py * offset)
+        def is_blocking(c, r):
+            return game_map.is_sensor_occluder((c, r), behaviour=occlusion_behaviour)
 
-            if not game_map.in_bounds(start):
-                continue
+        cells = shadowcast_cone(self.cell, self._forward(), self.spread_deg, self.range_cells, is_blocking)
 
-            current = start
-            last_free = start
+        mask = bytearray(cols * game_map.rows)
+        for c, r in cells:
+            mask[r * cols + c] = 1
 
-            for _ in range(self.max_len):
-                nxt = (current[0] + fx, current[1] + fy)
+        def is_visible(c, r):
+            return 0 <= c < cols and 0 <= r < game_map.rows and mask[r * cols + c]
 
-                if not game_map.in_bounds(nxt):
-                    break
+        outline = cone_outline(self.cell, self._forward(), self.spread_deg, self.range_cells, is_visible)
+        cell = game_map.cell
+        polygon = [
+            (game_map.offset_x + x * cell, game_map.offset_y + y * cell)
+            for x, y in outline
+        ]
+        return mask, polygon
 
-                if game_map.is_sensor_occluder(nxt, behaviour=occlusion_behaviour):
-                    break
+    def refresh_cone(self, game_map, occlusion_behaviour="B"):
+        key = (occlusion_behaviour, game_map.occlusion_key(occlusion_behaviour))
+        cached = self._cone_cache.get(key)
+        if cached is None:
+            cached = self._compute_cone(game_map, occlusion_behaviour)
+            self._cone_cache[key] = cached
+        self.visible_mask, self.cone_polygon = cached
 
-                current = nxt
-                last_free = current
-                self._ray_cells.add(current)
-
-            end_x, end_y = game_map.cell_center(last_free)
-            self._ray_endpoints.append((end_x, end_y))
+    def sees(self, game_map, cell):
+        if cell is None or self.visible_mask is None:
+            return False
+        c, r = cell
+        return bool(self.visible_mask[r * game_map.cols + c])
 
     # ---- public API ----
 
     def update(self, dt, game_map, player, suspicion_system):
         """
-        Returns True if player detected (i.e. enabled + alpha high + player in ray cells).
+        Returns True if player detected (i.e. enabled + alpha high + player in the cone).
         """
 
-        # Always cast rays so we can "wake" based on LOS
-        self._cast_rays(game_map, occlusion_behaviour="B")
+        # cached per wall configuration; only recomputed when occluders change
+        self.refresh_cone(game_map, occlusion_behaviour="B")
 
         if not player:
             return False
@@ -110,7 +139,8 @@ class Sensor:
         player_cell = game_map.world_to_cell(player.rect.centerx, player.rect.centery)
 
         # Wake logic: first time player steps into this sensor's LOS
-        if (not self.enabled) and (player_cell in self._ray_cells):
+        in_cone = self.sees(game_map, player_cell)
+        if (not self.enabled) and in_cone:
             self.enabled = True
             # start from dark so the first ramp feels deliberate
             self.alpha = 0.0
@@ -126,23 +156,8 @@ class Sensor:
         if self.alpha <= GamePlayConfig.SENSOR_DETECTION:
             return False
 
-        detected = player_cell in self._ray_cells
+        detected = in_cone
         if detected:
             suspicion_system.increase(GamePlayConfig.SUSPICION_GAIN_RATE * dt)
 
         return detected
-
-    def render(self, screen, game_map, draw_cone=True):
-        ox, oy = game_map.cell_center(self.cell)
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-
-        # emitter always visible
-        pygame.draw.circle(overlay, Colour.SENSOR, (ox, oy), 6)
-
-        # cone only if enabled (and we have endpoints)
-        if draw_cone and self.enabled and self._ray_endpoints:
-            points = [(ox, oy)] + self._ray_endpoints + [(ox, oy)]
-            a = int(self.alpha * 0.25)
-            pygame.draw.polygon(overlay, (*Colour.SENSOR, a), points)
-
-        screen.blit(overlay, (0, 0))
\ No newline at end of file
@@ -4,6 +4,12 @@ class Suspicion:
     def __init__(self):
         self.value = 0
 
+    def get_state(self):
+        return (float(self.value),)
+
+    def set_state(self, state):
+        (self.value,) = state
+
     def increase(self, amount):
         self.value += amount
         if self.value > 100:
@@ -0,0 +1,179 @@
+from utils.paths import asset_path
+from world.tasks.task1 import Task1PathOptimisation
+
+
+def load_task_definitions(filename="tasks.json"):
+    """task entries from assets/<filename>, in file order (= task index)"""
+    import json  # deferred: json imports re, most of the cost of importing the core
+
+    with open(asset_path(filename), "r", encoding="utf-8") as f:
+        return json.load(f)["tasks"]
+
+
+class TaskSystem:
+    """
+    Owns every task on a map, built from data (assets/tasks.json).
+
+    - each definition names a task "type", its map "trigger" token and the anchor
+      tokens its type needs; anchors are found on the grid once, at load
+    - trigger cells are baked into one per-cell lookup (value = task index + 1),
+      so starting a task is a single index per tick however many tasks exist
+    - only started, unfinished tasks are ticked; finished ones just render
+    """
+
+    # definition "type" -> task class
+    TASK_TYPES = {
+        Task1PathOptimisation.TYPE: Task1PathOptimisation,
+    }
+
+    def __init__(self, game_map, definitions=None):
+        self.map = game_map
+        self.cols = game_map.cols
+        self.definitions = load_task_definitions() if definitions is None else list(definitions)
+
+        # set by the owning PlayState through bind()
+        self.timers = None
+        self.telemetry = None
+
+        self.tasks = []
+        self.trigger_lookup = bytearray(game_map.cols * game_map.rows)
+
+        for index, definition in enumerate(self.definitions):
+            task_cls = self.TASK_TYPES.get(definition["type"])
+            if task_cls is None:
+                raise ValueError(f"Task '{definition['id']}' has unknown type {definition['type']!r}")
+
+            anchors = self._find_anchors(definition["id"], task_cls.anchor_tokens(definition))
+            self.tasks.append(task_cls(definition, anchors, grid_size=(game_map.cols, game_map.rows)))
+            self._bake_trigger(index, definition)
+
+        self.reset()
+
+    def _find_anchors(self, task_id, tokens):
+        cells = self.map.token_cells(tokens)
+        anchors = {}
+        for token in tokens:
+            found = cells.get(token, [])
+            if len(found) > 1:
+                # two of the same anchor is always a map typo; fail loudly
+                raise ValueError(f"Duplicate anchor '{token}' for task '{task_id}' at {found}")
+            if found:
+                anchors[token] = found[0]
+        return anchors
+
+    def _bake_trigger(self, index, definition):
+        cols = self.cols
+        for c, r in self.map.token_cells({definition["trigger"]}).get(definition["trigger"], []):
+            idx = r * cols + c
+            if self.trigger_lookup[idx]:
+                other = self.definitions[self.trigger_lookup[idx] - 1]["id"]
+                raise ValueError(f"Tasks '{other}' and '{definition['id']}' share trigger cell {(c, r)}")
+            self.trigger_lookup[idx] = index + 1
+
+    def reset(self, seed=None):
+        """every task back to idle (fresh random paths unless seeded)"""
+        for task in self.tasks:
+            task.reset(seed)
+        self.active = []      # indices of tasks being ticked
+        self.announced = 0    # bit i = task i's completion already reported
+        self._marks = [(task.state, task.index) for task in self.tasks]
+
+    def bind(self, timers, telemetry=None):
+        """attach the game's timer scheduler (required before update) and optional telemetry"""
+        self.timers = timers
+        self.telemetry = telemetry
+        for task in self.tasks:
+            task.timers = timers
+
+    def cancel(self):
+        """drop every task's pending timer (this TaskSystem is leaving play)"""
+        for task in self.tasks:
+            task.cancel()
+
+    # ---- lookups ----
+
+    def index_of(self, task_id):
+        for i, definition in enumerate(self.definitions):
+            if definition["id"] == task_id:
+                return i
+        raise KeyError(task_id)
+
+    def get(self, task_id):
+        return self.tasks[self.index_of(task_id)]
+
+    # ---- snapshot hooks ----
+
+    def get_state(self):
+        return (self.announced, [task.get_state() for task in self.tasks])
+
+    def set_state(self, state):
+        self.announced, task_states = state
+        for task, task_state in zip(self.tasks, task_states):
+            task.set_state(task_state)
+        self._resync()
+
+    def carry_from(self, other):
+        """tasks sharing an id with other (the previous cycle's TaskSystem) continue where they were"""
+        previous = {task.task_id: (i, task) for i, task in enumerate(other.tasks)}
+        for index, task in enumerate(self.tasks):
+            found = previous.get(task.task_id)
+            if found is None:
+                continue
+            old_index, old_task = found
+            task.set_state(old_task.get_state())
+            if (other.announced >> old_index) & 1:
+                self.announced |= 1 << index
+        self._resync()
+
+    def _resync(self):
+        # tick list and transition marks follow task states set from outside update()
+        self.active = [i for i, task in enumerate(self.tasks) if self._ticking(task)]
+        self._marks = [(task.state, task.index) for task in self.tasks]
+
+    # ---- update / render ----
+
+    @staticmethod
+    def _ticking(task):
+        return task.started and task.state != task.STATE_PROCESSED
+
+    def update(self, dt, player_cell):
+        """tick active tasks; returns indices of tasks that just became complete"""
+        if player_cell is not None:
+            c, r = player_cell
+            hit = self.trigger_lookup[r * self.cols + c]
+            if hit:
+                task = self.tasks[hit - 1]
+                if not task.started:
+                    task.start(player_cell)
+                    self.active.append(hit - 1)
+
+        if not self.active:
+            return ()
+
+        completed = []
+        for index in self.active:
+            task = self.tasks[index]
+            task.update(dt, player_cell)
+
+            mark = (task.state, task.index)
+            if mark != self._marks[index]:
+                self._marks[index] = mark
+                self._emit_transition(index, task)
+
+            if task.is_complete and not (self.announced >> index) & 1:
+                self.announced |= 1 << index
+                completed.append(index)
+
+        self.active = [i for i in self.active if self._ticking(self.tasks[i])]
+        return completed
+
+    def _emit_transition(self, index, task):
+        if self.telemetry is None:
+            return
+        # only here, with a recorder bound: core.telemetry (threading, zlib) stays out of headless imports
+        from core import telemetry as tm
+
+        anchor = task.anchor_at(task.index)
+        self.telemetry.emit(
+            tm.TASK, task.STATES.index(task.state), task.index, ord(anchor) if anchor else 0, index,
+        )
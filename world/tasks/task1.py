@@ -1,14 +1,12 @@
 import random
-import pygame
-from config.palette import Colour
 
 
 class Task1PathOptimisation:
     """
-    Task 1 (Cycle 1):
-    - Structured randomness using anchor tokens: a,b,c,d (corners) + e (centre, always last).
-      Layout: a=top-left, b=top-right, c=bottom-right, d=bottom-left.
-    - Start corner random, direction random (clockwise / anticlockwise).
+    Path task (Task 1, Cycle 1), rules from its assets/tasks.json definition:
+    - Structured randomness over anchor tokens: walk the whole "ring" from a random
+      allowed start in a random direction (clockwise / anticlockwise), then the
+      "bridge" for the corner it ended on, then "finish" (always last).
     - Progressive activation:
         * current target glows
         * when activated, NEXT target appears immediately (or after delay)
@@ -16,9 +14,25 @@ class Task1PathOptimisation:
         * completed tiles remain visible (locked)
         * future tiles are hidden
     - When all done: wait, then fade all to processed.
-    - Activation uses a cell-radius around the ACTIVE tile (fair vs big glow halo).
+    - Activation uses a cell-radius around the ACTIVE tile (fair vs big glow halo),
+      baked into a per-cell zone table whenever the target or linger cell moves.
     """
 
+    __slots__ = (
+        "task_id", "seed", "rng", "anchors", "ring", "starts", "bridges", "finish",
+        "path", "cells", "index", "completed", "state",
+        "complete_pause_s", "fade_duration_s", "next_spawn_delay_s", "activation_radius_cells",
+        "timers", "_pending", "_state_started",
+        "cols", "rows", "zone", "_zone_target", "_zone_linger",
+        "_linger_cell", "_last_player_cell",
+    )
+
+    TYPE = "path"
+
+    # zone table bits
+    ZONE_TARGET = 1
+    ZONE_LINGER = 2
+
     STATE_IDLE = "idle"
     STATE_RUNNING = "running"
     STATE_WAITING_NEXT = "waiting_next"
@@ -26,37 +40,83 @@ class Task1PathOptimisation:
     STATE_FADING_TO_PROCESSED = "fading_to_processed"
     STATE_PROCESSED = "processed"
 
-    def __init__(self, anchor_cells, *, seed=None):
+    # stable order for snapshots
+    STATES = (
+        STATE_IDLE,
+        STATE_RUNNING,
+        STATE_WAITING_NEXT,
+        STATE_COMPLETE_PENDING,
+        STATE_FADING_TO_PROCESSED,
+        STATE_PROCESSED,
+    )
+
+    # timed states: state -> (duration attribute, method run when it runs out)
+    _TIMED = {
+        STATE_WAITING_NEXT: ("next_spawn_delay_s", "_reveal_next"),
+        STATE_COMPLETE_PENDING: ("complete_pause_s", "_begin_fade"),
+        STATE_FADING_TO_PROCESSED: ("fade_duration_s", "_finish_fade"),
+    }
+
+    def __init__(self, definition, anchor_cells, *, grid_size, seed=None):
         """
-        anchor_cells: dict like {"a":(c,r), "b":(c,r), "c":(c,r), "d":(c,r), "e":(c,r)}
+        definition:   task entry from assets/tasks.json (ring / starts / bridges / finish + tuning)
+        anchor_cells: dict like {"a":(c,r), "b":(c,r), ...} for every token the definition names
+        grid_size:    (cols, rows) of the map, for the zone table
         """
-        self.rng = random.Random(seed)
+        self.task_id = definition["id"]
+
+        self.ring = list(definition["ring"])
+        self.starts = list(definition["starts"])
+        self.bridges = dict(definition["bridges"])
+        self.finish = definition["finish"]
 
         self.anchors = dict(anchor_cells)
-        required = {"a","b","c","d","e","f","g","h","i","j","k","l","m"}
-        missing = required - set(self.anchors.keys())
+        missing = self.anchor_tokens(definition) - set(self.anchors.keys())
         if missing:
-            raise ValueError(f"Task1 missing anchors: {sorted(missing)}")
-
-        self.cells = self._select_structured_path()
-
-        self.index = 0
-        self.completed = set()
-
-        self.state = self.STATE_IDLE
+            raise ValueError(f"Task '{self.task_id}' missing anchors: {sorted(missing)}")
 
         # timing
-        self.complete_pending_timer = 0.0
-        self.fade_timer = 0.0
-        self.complete_pause_s = 1.0
-        self.fade_duration_s = 1.0
+        self.complete_pause_s = float(definition.get("complete_pause_s", 1.0))
+        self.fade_duration_s = float(definition.get("fade_duration_s", 1.0))
 
         # delay between locking and revealing next target (0 = instant)
-        self.next_spawn_delay_s = 0.1
-        self.next_spawn_timer = 0.0
+        self.next_spawn_delay_s = float(definition.get("next_spawn_delay_s", 0.1))
 
         # hit-area fairness: 1 => 3x3 area, 2 => 5x5 area
-        self.activation_radius_cells = 1
+        self.activation_radius_cells = int(definition.get("activation_radius_cells", 1))
+
+        # per-cell zone bits (ZONE_TARGET / ZONE_LINGER), index r * cols + c
+        self.cols, self.rows = grid_size
+        self.zone = bytearray(self.cols * self.rows)
+
+        # utils.timers.TimerScheduler, bound by TaskSystem before the task can start
+        self.timers = None
+        self._pending = None
+
+        self.reset(seed)
+
+    @staticmethod
+    def anchor_tokens(definition):
+        """every map token a path definition refers to"""
+        return set(definition["ring"]) | set(definition["bridges"].values()) | {definition["finish"]}
+
+    def reset(self, seed=None):
+        """back to idle with a freshly rolled path"""
+        # keep the seed so a snapshot can rebuild the exact same path
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+
+        self.path = self._select_structured_path()
+        self.cells = [self.anchors[t] for t in self.path]
+
+        self.index = 0
+        self.completed = 0  # bitmask over self.cells (bit i = path step i done)
+
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        self.state = self.STATE_IDLE
+        self._state_started = 0.0
 
         # linger: the last-completed cell keeps the ACTIVE glow until player leaves its zone
         self._linger_cell = None
@@ -64,13 +124,9 @@ class Task1PathOptimisation:
         # step guard
         self._last_player_cell = None
 
-        # glow tuning (your current preference)
-        self.active_glow_layers = [
-            (18, 10),
-            (12, 18),
-            (8,  28),
-            (4,  45),
-        ]
+        self.zone[:] = bytes(len(self.zone))
+        self._zone_target = None
+        self._zone_linger = None
 
     # ----------------------------
     # Path selection (structured)
@@ -78,42 +134,33 @@ class Task1PathOptimisation:
 
     def _select_structured_path(self):
         """
+        Task 1's definition:
         Perimeter: a b c d e f g h (clockwise)
         Allowed starts: b d f h
         Direction: CW or CCW
         After completing perimeter, spawn bridge based on finishing corner:
             a->i, c->j, e->k, g->l
         Then centre m last.
-        """
-        cw_ring = ["a", "b", "c", "d", "e", "f", "g", "h"]
-
-        # Safety: ensure we have everything we might reference
-        required = set(cw_ring) | {"i", "j", "k", "l", "m"}
-        missing = required - set(self.anchors.keys())
-        if missing:
-            raise ValueError(f"Task1 missing anchors: {sorted(missing)}")
 
-        cw_next = {cw_ring[i]: cw_ring[(i + 1) % len(cw_ring)] for i in range(len(cw_ring))}
-        ccw_next = {cw_ring[i]: cw_ring[(i - 1) % len(cw_ring)] for i in range(len(cw_ring))}
-
-        start = self.rng.choice(["b", "d", "f", "h"])
-        nxt = cw_next if self.rng.choice([True, False]) else ccw_next
+        Returns the path as anchor tokens.
+        """
+        ring = self.ring
+        n = len(ring)
 
-        # Walk the full perimeter (8 unique points)
-        order = [start]
-        while len(order) < 8:
-            order.append(nxt[order[-1]])
+        start = self.rng.choice(self.starts)
+        step = 1 if self.rng.choice([True, False]) else -1
 
-        end_corner = order[-1]  # should be one of a/c/e/g
-        bridge_for_end = {"a": "i", "c": "j", "e": "k", "g": "l"}
+        # Walk the full perimeter
+        first = ring.index(start)
+        order = [ring[(first + k * step) % n] for k in range(n)]
 
-        if end_corner not in bridge_for_end:
+        end_corner = order[-1]
+        if end_corner not in self.bridges:
             raise ValueError(f"Unexpected perimeter end '{end_corner}'. Check ring/start rules.")
 
-        order.append(bridge_for_end[end_corner])
-        order.append("m")
-
-        return [self.anchors[t] for t in order]
+        order.append(self.bridges[end_corner])
+        order.append(self.finish)
+        return order
 
     # ----------------------------
     # State / helpers
@@ -131,34 +178,165 @@ class Task1PathOptimisation:
             self.STATE_PROCESSED,
         )
 
+    @property
+    def zone_centres(self):
+        """(target, linger) cells the zone table is currently baked around (None = no zone)"""
+        return (self._zone_target, self._zone_linger)
+
+    def cancel(self):
+        """drop the pending timed-state timer (the task is being discarded)"""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
     def start(self, player_cell=None):
         if self.state == self.STATE_IDLE:
             self.state = self.STATE_RUNNING
         self._last_player_cell = player_cell
 
+    def _enter(self, state, elapsed=0.0):
+        """switch state; timed states schedule their own way out"""
+        self.state = state
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+        timed = self._TIMED.get(state)
+        if timed is None:
+            return
+        attr, action = timed
+        self._state_started = self.timers.now - elapsed
+        self._pending = self.timers.after(getattr(self, attr) - elapsed, getattr(self, action))
+
+    def _elapsed(self):
+        """seconds spent in the current timed state"""
+        return self.timers.now - self._state_started if self.state in self._TIMED else 0.0
+
+    def _reveal_next(self):
+        self.index += 1
+        self._enter(self.STATE_RUNNING)
+
+    def _begin_fade(self):
+        self._enter(self.STATE_FADING_TO_PROCESSED)
+
+    def _finish_fade(self):
+        self._enter(self.STATE_PROCESSED)
+
     def _current_target(self):
         if self.index >= len(self.cells):
             return None
         return self.cells[self.index]
 
-    def _player_in_zone(self, player_cell, centre_cell):
-        if player_cell is None or centre_cell is None:
+    def _zone_ids(self, centre):
+        if centre is None:
+            return ()
+        c0, r0 = centre
+        rad = self.activation_radius_cells
+        cols = self.cols
+        c_lo, c_hi = max(0, c0 - rad), min(cols, c0 + rad + 1)
+        return [
+            r * cols + c
+            for r in range(max(0, r0 - rad), min(self.rows, r0 + rad + 1))
+            for c in range(c_lo, c_hi)
+        ]
+
+    def _move_zone(self, bit, old_centre, new_centre):
+        zone = self.zone
+        clear = 0xFF ^ bit
+        for idx in self._zone_ids(old_centre):
+            zone[idx] &= clear
+        for idx in self._zone_ids(new_centre):
+            zone[idx] |= bit
+
+    def _sync_zones(self):
+        # re-bake only when the target / linger cell actually moved
+        target = self._current_target()
+        if target != self._zone_target:
+            self._move_zone(self.ZONE_TARGET, self._zone_target, target)
+            self._zone_target = target
+        if self._linger_cell != self._zone_linger:
+            self._move_zone(self.ZONE_LINGER, self._zone_linger, self._linger_cell)
+            self._zone_linger = self._linger_cell
+
+    def _player_in_zone(self, player_cell, bit):
+        if player_cell is None:
             return False
-        pc, pr = player_cell
-        tc, tr = centre_cell
-        r = self.activation_radius_cells
-        return abs(pc - tc) <= r and abs(pr - tr) <= r
+        c, r = player_cell
+        return (self.zone[r * self.cols + c] & bit) != 0
 
     def _update_linger(self, player_cell):
         # Linger ends the moment the player leaves the activation zone of the linger cell.
         if self._linger_cell is None:
             return
-        if not self._player_in_zone(player_cell, self._linger_cell):
+        if not self._player_in_zone(player_cell, self.ZONE_LINGER):
             self._linger_cell = None
 
+    def anchor_at(self, index):
+        """anchor token of path step index (None past the end)"""
+        return self.path[index] if index < len(self.path) else None
+
     def current_target_is_centre(self):
         t = self._current_target()
-        return t == self.anchors["m"]
+        return t == self.anchors[self.finish]
+
+    # ----------------------------
+    # Snapshot hooks
+    # ----------------------------
+
+    def get_state(self):
+        linger = self.cells.index(self._linger_cell) if self._linger_cell in self.cells else -1
+        last_c, last_r = self._last_player_cell if self._last_player_cell is not None else (-1, -1)
+
+        # elapsed seconds in whichever timed state is current (the rest stay 0)
+        elapsed = self._elapsed()
+        pending = elapsed if self.state == self.STATE_COMPLETE_PENDING else 0.0
+        next_spawn = elapsed if self.state == self.STATE_WAITING_NEXT else 0.0
+        if self.state == self.STATE_PROCESSED:
+            fade = self.fade_duration_s
+        else:
+            fade = elapsed if self.state == self.STATE_FADING_TO_PROCESSED else 0.0
+
+        return (
+            self.seed,
+            self.STATES.index(self.state),
+            self.index,
+            self.completed,
+            linger,
+            last_c,
+            last_r,
+            pending,
+            fade,
+            next_spawn,
+        )
+
+    def check_state(self, state):
+        """ValueError if set_state(state) would index past this task (a corrupt snapshot); changes nothing"""
+        _seed, state_code, index, _completed, linger = state[:5]
+        steps = len(self.ring) + 2  # every seed's path: the ring, one bridge, the finish
+        if state_code >= len(self.STATES) or index > steps or not -1 <= linger < steps:
+            raise ValueError(f"Task '{self.task_id}' bad snapshot state (state {state_code}, step {index}, linger {linger})")
+
+    def set_state(self, state):
+        (seed, state_code, index, self.completed, linger, last_c, last_r,
+         pending, fade, next_spawn) = state
+
+        if seed != self.seed:
+            self.seed = seed
+            self.rng = random.Random(seed)
+            self.path = self._select_structured_path()
+            self.cells = [self.anchors[t] for t in self.path]
+
+        self.index = index
+        self._linger_cell = self.cells[linger] if linger >= 0 else None
+        self._last_player_cell = (last_c, last_r) if last_c >= 0 else None
+
+        state = self.STATES[state_code]
+        elapsed = {
+            self.STATE_WAITING_NEXT: next_spawn,
+            self.STATE_COMPLETE_PENDING: pending,
+            self.STATE_FADING_TO_PROCESSED: fade,
+        }.get(state, 0.0)
+        self._enter(state, elapsed)
 
     # ----------------------------
     # Update
@@ -170,6 +348,7 @@ class Task1PathOptimisation:
             return
 
         # update linger in all active states
+        self._sync_zones()
         self._update_linger(player_cell)
 
         if self.state == self.STATE_PROCESSED:
@@ -179,19 +358,18 @@ class Task1PathOptimisation:
         if self.state == self.STATE_RUNNING:
             target = self._current_target()
             if target is None:
-                self.state = self.STATE_COMPLETE_PENDING
-                self.complete_pending_timer = 0.0
+                self._enter(self.STATE_COMPLETE_PENDING)
                 self._last_player_cell = player_cell
                 return
 
             stepped_newly = (
                 player_cell is not None
                 and player_cell != self._last_player_cell
-                and self._player_in_zone(player_cell, target)
+                and self._player_in_zone(player_cell, self.ZONE_TARGET)
             )
 
             if stepped_newly:
-                self.completed.add(target)
+                self.completed |= 1 << self.index
 
                 # begin linger on the just-completed target
                 self._linger_cell = target
@@ -199,34 +377,15 @@ class Task1PathOptimisation:
                 # last tile?
                 if self.index >= len(self.cells) - 1:
                     self.index += 1
-                    self.state = self.STATE_COMPLETE_PENDING
-                    self.complete_pending_timer = 0.0
+                    self._enter(self.STATE_COMPLETE_PENDING)
                 else:
                     # reveal next either instantly or after delay
                     if self.next_spawn_delay_s <= 0:
                         self.index += 1
-                        self.state = self.STATE_RUNNING
                     else:
-                        self.state = self.STATE_WAITING_NEXT
-                        self.next_spawn_timer = 0.0
-
-        elif self.state == self.STATE_WAITING_NEXT:
-            self.next_spawn_timer += dt
-            if self.next_spawn_timer >= self.next_spawn_delay_s:
-                self.index += 1
-                self.state = self.STATE_RUNNING
-
-        elif self.state == self.STATE_COMPLETE_PENDING:
-            self.complete_pending_timer += dt
-            if self.complete_pending_timer >= self.complete_pause_s:
-                self.state = self.STATE_FADING_TO_PROCESSED
-                self.fade_timer = 0.0
-
-        elif self.state == self.STATE_FADING_TO_PROCESSED:
-            self.fade_timer += dt
-            if self.fade_timer >= self.fade_duration_s:
-                self.fade_timer = self.fade_duration_s
-                self.state = self.STATE_PROCESSED
+                        self._enter(self.STATE_WAITING_NEXT)
+
+        # WAITING_NEXT / COMPLETE_PENDING / FADING_TO_PROCESSED advance on timers
 
         self._last_player_cell = player_cell
 
@@ -234,76 +393,45 @@ class Task1PathOptimisation:
         if self.state == self.STATE_FADING_TO_PROCESSED:
             if self.fade_duration_s <= 0:
                 return 1.0
-            return max(0.0, min(1.0, self.fade_timer / self.fade_duration_s))
+            return max(0.0, min(1.0, self._elapsed() / self.fade_duration_s))
         if self.state == self.STATE_PROCESSED:
             return 1.0
         return 0.0
 
     # ----------------------------
-    # Rendering
+    # Tiles (what a renderer draws)
     # ----------------------------
 
-    def _cell_rect(self, game_map, cell):
-        rect = pygame.Rect(0, 0, game_map.cell, game_map.cell)
-        cx, cy = game_map.cell_center(cell)
-        rect.center = (cx, cy)
-        return rect
+    # tile looks
+    TILE_ACTIVE = "active"
+    TILE_LOCKED = "locked"
+    TILE_PROCESSED = "processed"
 
-    def _draw_glow(self, overlay, rect, rgb, layers):
-        for inflate_px, a in layers:
-            r = rect.inflate(inflate_px, inflate_px)
-            pygame.draw.rect(overlay, (*rgb, a), r)
+    def tiles(self):
+        """
+        [(cell, look, fill alpha, glowing), ...] for every tile showing right now.
 
-    def render(self, screen, game_map, phosphor_alpha=255):
+        RUNNING / WAITING_NEXT: completed tiles, the current target and the linger cell
+        (the last two glow); COMPLETE_PENDING / FADING / PROCESSED: every tile.
+        """
         if self.state == self.STATE_IDLE:
-            return
-
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-
-        col_active = Colour.phosphor_colour(Colour.TASK1_ACTIVE, phosphor_alpha)
-        col_locked = Colour.phosphor_colour(Colour.TASK1_LOCKED, phosphor_alpha)
-        col_processed = Colour.phosphor_colour(Colour.TASK1_PROCESSED, phosphor_alpha)
+            return []
 
         target = self._current_target()
-        fade_t = self._fade_t()
 
-        # Visibility:
-        # RUNNING/WAITING_NEXT: show completed + current target + linger cell (if any)
-        # COMPLETE_PENDING/FADING/PROCESSED: show all
         if self.state in (self.STATE_RUNNING, self.STATE_WAITING_NEXT):
-            visible = []
-            for cell in self.cells:
-                if cell in self.completed or cell == target or cell == self._linger_cell:
-                    visible.append(cell)
-        else:
-            visible = list(self.cells)
-
-        for cell in visible:
-            rect = self._cell_rect(game_map, cell)
-
-            if self.state == self.STATE_COMPLETE_PENDING:
-                fill_col = col_locked
-                fill_alpha = 120
-
-            elif self.state in (self.STATE_FADING_TO_PROCESSED, self.STATE_PROCESSED):
-                fill_alpha = int(120 * (1.0 - fade_t) + 50 * fade_t)
-                fill_col = col_processed if fade_t >= 1.0 else col_locked
-
-            else:
-                # RUNNING / WAITING_NEXT
-                # Active glow applies to:
-                # - current target
-                # - linger cell (just completed, until player leaves its zone)
-                is_glowing = (cell == target) or (cell == self._linger_cell)
-
-                if is_glowing:
-                    fill_col = col_active
-                    fill_alpha = 80
-                    self._draw_glow(overlay, rect, col_active, self.active_glow_layers)
-                else:
-                    fill_col = col_locked
-                    fill_alpha = 70
+            tiles = []
+            for i, cell in enumerate(self.cells):
+                if cell == target or cell == self._linger_cell:
+                    tiles.append((cell, self.TILE_ACTIVE, 80, True))
+                elif (self.completed >> i) & 1:
+                    tiles.append((cell, self.TILE_LOCKED, 70, False))
+            return tiles
 
-            pygame.draw.rect(overlay, (*fill_col, fill_alpha), rect)
+        if self.state == self.STATE_COMPLETE_PENDING:
+            return [(cell, self.TILE_LOCKED, 120, False) for cell in self.cells]
 
-        screen.blit(overlay, (0, 0))
\ No newline at end of file
+        fade_t = self._fade_t()
+        fill_alpha = int(120 * (1.0 - fade_t) + 50 * fade_t)
+        look = self.TILE_PROCESSED if fade_t >= 1.0 else self.TILE_LOCKED
+        return [(cell, look, fill_alpha, False) for cell in self.cells]
@@ -0,0 +1,119 @@
+import math
+
+# Symmetric shadowcasting (after Albert Ford's formulation) restricted to a
+# single cone. Pure grid logic: no pygame.
+#
+# Slopes are exact fractions.Fraction values; the module is only imported when
+# a cone is cast (it pulls in decimal and re, the bulk of importing the core).
+
+
+def _round_ties_up(n):
+    """floor(n + 1/2) for a Fraction n, in integers"""
+    return (2 * n.numerator + n.denominator) // (2 * n.denominator)
+
+
+def _round_ties_down(n):
+    """ceil(n - 1/2) for a Fraction n, in integers"""
+    return -((n.denominator - 2 * n.numerator) // (2 * n.denominator))
+
+
+def shadowcast_cone(origin, forward, spread_deg, range_cells, is_blocking):
+    """
+    Cells visible from origin inside a cone.
+
+    origin:      (c, r) of the emitter
+    forward:     unit grid direction, e.g. (0, -1) for "^"
+    spread_deg:  full cone angle, at most 90 (one shadowcasting quadrant)
+    range_cells: euclidean reach in cells
+    is_blocking: callable(c, r) -> True for opaque cells (out of bounds included)
+
+    Returns a set of (c, r). Opaque cells are never included; the origin is not
+    included either (emitters sit inside walls).
+    """
+    from fractions import Fraction
+
+    def slope(depth, col):
+        return Fraction(2 * col - 1, 2 * depth)
+
+    ox, oy = origin
+    fx, fy = forward
+    px, py = -fy, fx  # perpendicular: "col" axis of the quadrant
+
+    half = math.radians(min(90.0, max(0.0, spread_deg)) / 2.0)
+    limit = Fraction(math.tan(half)).limit_denominator(256)
+    range_sq = range_cells * range_cells
+
+    def to_cell(depth, col):
+        return (ox + col * px + depth * fx, oy + col * py + depth * fy)
+
+    visible = set()
+
+    # rows: (depth, start_slope, end_slope); explicit stack instead of recursion
+    stack = [(1, -limit, limit)]
+    while stack:
+        depth, start, end = stack.pop()
+        if depth > range_cells or start > end:
+            continue
+
+        prev_wall = None  # None = no previous tile in this row
+        min_col = _round_ties_up(depth * start)
+        max_col = _round_ties_down(depth * end)
+
+        for col in range(min_col, max_col + 1):
+            c, r = to_cell(depth, col)
+            wall = is_blocking(c, r)
+
+            if not wall and depth * start <= col <= depth * end and col * col + depth * depth <= range_sq:
+                visible.add((c, r))
+
+            if prev_wall is True and not wall:
+                start = slope(depth, col)
+            if prev_wall is False and wall:
+                stack.append((depth + 1, start, slope(depth, col)))
+
+            prev_wall = wall
+
+        if prev_wall is False:
+            stack.append((depth + 1, start, end))
+
+    return visible
+
+
+def cone_outline(origin, forward, spread_deg, range_cells, is_visible, *, step_deg=3.0, step_cells=0.25):
+    """
+    Polygon outline (in cell units, emitter centre at origin + 0.5) of a
+    visibility set: rays fanned across the cone, each stopping at the first
+    cell that is not visible. Returns [(x, y), ...] far points, left to right.
+    """
+    ox, oy = origin
+    fx, fy = forward
+    px, py = -fy, fx
+
+    cx = ox + 0.5
+    cy = oy + 0.5
+
+    half = min(90.0, max(0.0, spread_deg)) / 2.0
+    n = max(2, int(math.ceil(2 * half / step_deg)) + 1)
+
+    points = []
+    for i in range(n):
+        a = math.radians(-half + 2 * half * i / (n - 1))
+        # direction in grid space: forward * cos + perp * sin
+        dx = fx * math.cos(a) + px * math.sin(a)
+        dy = fy * math.cos(a) + py * math.sin(a)
+
+        dist = 0.0
+        last = 0.0
+        while dist < range_cells:
+            dist += step_cells
+            c = math.floor(cx + dx * dist)
+            r = math.floor(cy + dy * dist)
+            if (c, r) == (ox, oy):
+                continue
+            if not is_visible(c, r):
+                break
+            last = dist
+
+        points.append((cx + dx * last, cy + dy * last))
+
+    return points